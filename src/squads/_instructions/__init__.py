@@ -1,3 +1,6 @@
+from .batch_add_transaction import batch_add_transaction
+from .batch_create import batch_create
+from .batch_execute_transaction import batch_execute_transaction
 from .config_transaction_create import config_transaction_create
 from .config_transaction_execute import config_transaction_execute
 from .multisig_add_member import multisig_add_member
@@ -13,10 +16,16 @@ from .proposal_cancel_v2 import proposal_cancel_v2
 from .proposal_create import proposal_create
 from .proposal_reject import proposal_reject
 from .spending_limit_use import spending_limit_use
+from .transaction_buffer_create import transaction_buffer_create
+from .transaction_buffer_extend import transaction_buffer_extend
 from .vault_transaction_create import vault_transaction_create
+from .vault_transaction_create_from_buffer import vault_transaction_create_from_buffer
 from .vault_transaction_execute import vault_transaction_execute
 
 __all__ = [
+    "batch_add_transaction",
+    "batch_create",
+    "batch_execute_transaction",
     "config_transaction_create",
     "config_transaction_execute",
     "multisig_add_member",
@@ -32,6 +41,9 @@ __all__ = [
     "proposal_create",
     "proposal_reject",
     "spending_limit_use",
+    "transaction_buffer_create",
+    "transaction_buffer_extend",
     "vault_transaction_create",
+    "vault_transaction_create_from_buffer",
     "vault_transaction_execute",
 ]
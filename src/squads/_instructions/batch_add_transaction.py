@@ -0,0 +1,92 @@
+from typing import Annotated
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from .._internal.utils import transaction_message_to_multisig_transaction_message_bytes
+from ..accounts import PDA
+from ..generated.instructions.batch_add_transaction import (
+    BatchAddTransactionAccounts,
+    BatchAddTransactionArgs,
+)
+from ..generated.instructions.batch_add_transaction import (
+    batch_add_transaction as batch_add_transaction_instruction,
+)
+from ..generated.types.batch_add_transaction_args import (
+    BatchAddTransactionArgs as BatchAddTransactionArgsType,
+)
+
+
+def batch_add_transaction(
+    multisig_pda: Pubkey,
+    batch_index: int,
+    transaction_index: Annotated[int, "1-based index of the transaction in the batch"],
+    member: Pubkey,
+    rent_payer: Pubkey | None,
+    ephemeral_signers: int,
+    transaction_payer: Annotated[Pubkey, "Payer of the transaction for the multisig"],
+    transaction_recent_blockhash: Hash,
+    transaction_instructions: list[Instruction],
+    address_lookup_table_accounts: list[AddressLookupTableAccount] | None,
+    program_id: Pubkey,
+    optimize_lookup_tables: bool = False,
+) -> Instruction:
+    try:
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(batch_index, int)
+        assert isinstance(transaction_index, int)
+        assert isinstance(member, Pubkey)
+        assert isinstance(rent_payer, Pubkey) or rent_payer is None
+        assert isinstance(ephemeral_signers, int)
+        assert isinstance(transaction_payer, Pubkey)
+        assert isinstance(transaction_recent_blockhash, Hash)
+        assert isinstance(transaction_instructions, list)
+        assert (
+            isinstance(address_lookup_table_accounts, list)
+            or address_lookup_table_accounts is None
+        )
+        assert isinstance(program_id, Pubkey)
+        assert isinstance(optimize_lookup_tables, bool)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    # If rent_payer is not provided, use the member as the rent payer
+    if rent_payer is None:
+        rent_payer = member
+
+    proposal_pda = PDA.get_proposal_pda(multisig_pda, batch_index, program_id)[0]
+    batch_pda = PDA.get_transaction_pda(multisig_pda, batch_index, program_id)[0]
+    batch_transaction_pda = PDA.get_batch_transaction_pda(
+        multisig_pda, batch_index, transaction_index, program_id
+    )[0]
+
+    transaction_message_bytes = (
+        transaction_message_to_multisig_transaction_message_bytes(
+            transaction_payer,
+            transaction_recent_blockhash,
+            transaction_instructions,
+            address_lookup_table_accounts,
+            optimize_lookup_tables,
+        )
+    )
+
+    accounts = BatchAddTransactionAccounts(
+        multisig=multisig_pda,
+        proposal=proposal_pda,
+        batch=batch_pda,
+        transaction=batch_transaction_pda,
+        member=member,
+        rent_payer=rent_payer,
+    )
+    args = BatchAddTransactionArgs(
+        args=BatchAddTransactionArgsType(
+            ephemeral_signers=ephemeral_signers,
+            transaction_message=transaction_message_bytes,
+        )
+    )
+
+    return batch_add_transaction_instruction(
+        accounts=accounts, args=args, program_id=program_id
+    )
@@ -0,0 +1,58 @@
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from ..accounts import PDA
+from ..generated.instructions.batch_create import (
+    BatchCreateAccounts,
+    BatchCreateArgs,
+)
+from ..generated.instructions.batch_create import (
+    batch_create as batch_create_instruction,
+)
+from ..generated.types.batch_create_args import (
+    BatchCreateArgs as BatchCreateArgsType,
+)
+
+
+def batch_create(
+    multisig_pda: Pubkey,
+    batch_index: int,
+    creator: Pubkey,
+    rent_payer: Pubkey | None,
+    vault_index: int,
+    memo: str | None,
+    program_id: Pubkey,
+) -> Instruction:
+    try:
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(batch_index, int)
+        assert isinstance(creator, Pubkey)
+        assert isinstance(rent_payer, Pubkey) or rent_payer is None
+        assert isinstance(vault_index, int)
+        assert isinstance(memo, str) or memo is None
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    # If rent_payer is not provided, use the creator as the rent payer
+    if rent_payer is None:
+        rent_payer = creator
+
+    # Batches share the transaction index space (and PDA) with vault and
+    # config transactions.
+    batch_pda = PDA.get_transaction_pda(multisig_pda, batch_index, program_id)[0]
+
+    accounts = BatchCreateAccounts(
+        multisig=multisig_pda,
+        batch=batch_pda,
+        creator=creator,
+        rent_payer=rent_payer,
+    )
+    args = BatchCreateArgs(
+        args=BatchCreateArgsType(
+            vault_index=vault_index,
+            memo=memo,
+        )
+    )
+
+    return batch_create_instruction(accounts=accounts, args=args, program_id=program_id)
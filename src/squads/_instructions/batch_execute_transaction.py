@@ -0,0 +1,100 @@
+from solana.rpc.async_api import AsyncClient
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from .._internal.lookup_table_cache import AddressLookupTableCache
+from .._internal.utils import accounts_for_transaction_execute
+from ..accounts import PDA, Batch
+from ..generated.accounts.vault_batch_transaction import VaultBatchTransaction
+from ..generated.instructions.batch_execute_transaction import (
+    BatchExecuteTransactionAccounts,
+)
+from ..generated.instructions.batch_execute_transaction import (
+    batch_execute_transaction as batch_execute_transaction_instruction,
+)
+from ..generated.program_id import PROGRAM_ID
+
+
+async def batch_execute_transaction(
+    connection: AsyncClient,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    transaction_index: int,
+    member: Pubkey,
+    program_id: Pubkey | None,
+    lookup_table_cache: AddressLookupTableCache | None = None,
+    batch: Batch | None = None,
+    batch_transaction: VaultBatchTransaction | None = None,
+) -> tuple[Instruction, list[AddressLookupTableAccount]]:
+    """
+    `batch` and `batch_transaction` may be passed when already fetched, e.g.
+    while executing a whole batch, to skip fetching them again.
+    """
+    if program_id is None:
+        program_id = PROGRAM_ID
+
+    try:
+        assert isinstance(connection, AsyncClient)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(batch_index, int)
+        assert isinstance(transaction_index, int)
+        assert isinstance(member, Pubkey)
+        assert isinstance(program_id, Pubkey)
+        assert (
+            isinstance(lookup_table_cache, AddressLookupTableCache)
+            or lookup_table_cache is None
+        )
+        assert isinstance(batch, Batch) or batch is None
+        assert (
+            isinstance(batch_transaction, VaultBatchTransaction)
+            or batch_transaction is None
+        )
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    proposal_pda = PDA.get_proposal_pda(multisig_pda, batch_index, program_id)[0]
+    batch_pda = PDA.get_transaction_pda(multisig_pda, batch_index, program_id)[0]
+    batch_transaction_pda = PDA.get_batch_transaction_pda(
+        multisig_pda, batch_index, transaction_index, program_id
+    )[0]
+
+    if batch is None:
+        batch = await Batch.fetch(connection, batch_pda, program_id=program_id)
+    assert batch is not None, "Batch account not found"
+
+    if batch_transaction is None:
+        batch_transaction = await VaultBatchTransaction.fetch(
+            connection, batch_transaction_pda, program_id=program_id
+        )
+    assert batch_transaction is not None, "Batch transaction account not found"
+
+    vault_pda = PDA.get_vault_pda_with_bump(
+        multisig_pda, batch.vault_index, batch.vault_bump, program_id
+    )[0]
+
+    account_metas, lookup_table_accs = await accounts_for_transaction_execute(
+        connection,
+        batch_transaction_pda,
+        vault_pda,
+        batch_transaction.message,
+        list(batch_transaction.ephemeral_signer_bumps),
+        program_id,
+        lookup_table_cache,
+    )
+
+    accs = BatchExecuteTransactionAccounts(
+        multisig=multisig_pda,
+        member=member,
+        proposal=proposal_pda,
+        batch=batch_pda,
+        transaction=batch_transaction_pda,
+    )
+
+    ix = batch_execute_transaction_instruction(
+        accs,
+        program_id,
+        account_metas,
+    )
+
+    return ix, lookup_table_accs
@@ -1,6 +1,5 @@
 from solders.instruction import Instruction
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
 from ..accounts import PDA
 from ..generated.instructions.spending_limit_use import (
@@ -44,21 +43,21 @@ def spending_limit_use(
 
     if mint is not None:
         if token_program is None:
-            vault_token_ass_address = get_associated_token_address(
+            vault_token_ass_address = PDA.get_associated_token_address(
                 vault_pda,
                 mint,
             )
-            destination_token_ass_address = get_associated_token_address(
+            destination_token_ass_address = PDA.get_associated_token_address(
                 destination,
                 mint,
             )
         else:
-            vault_token_ass_address = get_associated_token_address(
+            vault_token_ass_address = PDA.get_associated_token_address(
                 vault_pda,
                 mint,
                 token_program,
             )
-            destination_token_ass_address = get_associated_token_address(
+            destination_token_ass_address = PDA.get_associated_token_address(
                 destination,
                 mint,
                 token_program,
@@ -0,0 +1,69 @@
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from .._internal.contants import MAX_TRANSACTION_BUFFER_SIZE
+from ..accounts import PDA
+from ..generated.instructions.transaction_buffer_create import (
+    TransactionBufferCreateAccounts,
+    TransactionBufferCreateArgs,
+)
+from ..generated.instructions.transaction_buffer_create import (
+    transaction_buffer_create as transaction_buffer_create_instruction,
+)
+from ..generated.types.transaction_buffer_create_args import (
+    TransactionBufferCreateArgs as TransactionBufferCreateArgsType,
+)
+
+
+def transaction_buffer_create(
+    multisig_pda: Pubkey,
+    creator: Pubkey,
+    rent_payer: Pubkey | None,
+    buffer_index: int,
+    vault_index: int,
+    final_buffer_hash: bytes,
+    final_buffer_size: int,
+    buffer: bytes,
+    program_id: Pubkey,
+) -> Instruction:
+    try:
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Pubkey)
+        assert isinstance(rent_payer, Pubkey) or rent_payer is None
+        assert isinstance(buffer_index, int)
+        assert isinstance(vault_index, int)
+        assert isinstance(final_buffer_hash, bytes) and len(final_buffer_hash) == 32
+        assert isinstance(final_buffer_size, int)
+        assert 0 < final_buffer_size <= MAX_TRANSACTION_BUFFER_SIZE
+        assert isinstance(buffer, bytes) and len(buffer) <= final_buffer_size
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    # If rent_payer is not provided, use the creator as the rent payer
+    if rent_payer is None:
+        rent_payer = creator
+
+    transaction_buffer_pda = PDA.get_transaction_buffer_pda(
+        multisig_pda, creator, buffer_index, program_id
+    )[0]
+
+    accounts = TransactionBufferCreateAccounts(
+        multisig=multisig_pda,
+        transaction_buffer=transaction_buffer_pda,
+        creator=creator,
+        rent_payer=rent_payer,
+    )
+    args = TransactionBufferCreateArgs(
+        args=TransactionBufferCreateArgsType(
+            buffer_index=buffer_index,
+            vault_index=vault_index,
+            final_buffer_hash=list(final_buffer_hash),
+            final_buffer_size=final_buffer_size,
+            buffer=buffer,
+        )
+    )
+
+    return transaction_buffer_create_instruction(
+        accounts=accounts, args=args, program_id=program_id
+    )
@@ -0,0 +1,48 @@
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from ..accounts import PDA
+from ..generated.instructions.transaction_buffer_extend import (
+    TransactionBufferExtendAccounts,
+    TransactionBufferExtendArgs,
+)
+from ..generated.instructions.transaction_buffer_extend import (
+    transaction_buffer_extend as transaction_buffer_extend_instruction,
+)
+from ..generated.types.transaction_buffer_extend_args import (
+    TransactionBufferExtendArgs as TransactionBufferExtendArgsType,
+)
+
+
+def transaction_buffer_extend(
+    multisig_pda: Pubkey,
+    creator: Pubkey,
+    buffer_index: int,
+    buffer: bytes,
+    program_id: Pubkey,
+) -> Instruction:
+    try:
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Pubkey)
+        assert isinstance(buffer_index, int)
+        assert isinstance(buffer, bytes)
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    transaction_buffer_pda = PDA.get_transaction_buffer_pda(
+        multisig_pda, creator, buffer_index, program_id
+    )[0]
+
+    accounts = TransactionBufferExtendAccounts(
+        multisig=multisig_pda,
+        transaction_buffer=transaction_buffer_pda,
+        creator=creator,
+    )
+    args = TransactionBufferExtendArgs(
+        args=TransactionBufferExtendArgsType(buffer=buffer)
+    )
+
+    return transaction_buffer_extend_instruction(
+        accounts=accounts, args=args, program_id=program_id
+    )
@@ -17,9 +17,6 @@ from ..generated.instructions.vault_transaction_create import (
 from ..generated.types.vault_transaction_create_args import (
     VaultTransactionCreateArgs as VaultTransactionCreateArgsType,
 )
-from ..generated.types.vault_transaction_create_args import (
-    VaultTransactionCreateArgsJSON,
-)
 
 
 def vault_transaction_create(
@@ -39,6 +36,7 @@ def vault_transaction_create(
     address_lookup_table_accounts: list[AddressLookupTableAccount] | None,
     memo: str | None,
     program_id: Pubkey,
+    optimize_lookup_tables: bool = False,
 ) -> Instruction:
     assert isinstance(multisig_pda, Pubkey)
     assert isinstance(transaction_index, int)
@@ -55,6 +53,7 @@ def vault_transaction_create(
     )
     assert isinstance(memo, str) or memo is None
     assert isinstance(program_id, Pubkey)
+    assert isinstance(optimize_lookup_tables, bool)
 
     # If rent_payer is not provided, use the creator as the rent payer
     if rent_payer is None:
@@ -68,6 +67,7 @@ def vault_transaction_create(
             transaction_recent_blockhash,
             transaction_instructions,
             address_lookup_table_accounts,
+            optimize_lookup_tables,
         )
     )
 
@@ -77,15 +77,13 @@ def vault_transaction_create(
         creator=creator,
         rent_payer=rent_payer,
     )
-    args = VaultTransactionCreateArgsJSON(
-        vault_index=vault_index,
-        ephemeral_signers=ephemeral_signers,
-        transaction_message=list(transaction_message_bytes),
-        memo=memo,
-    )
-
     args = VaultTransactionCreateArgs(
-        args=VaultTransactionCreateArgsType.from_json(args)
+        args=VaultTransactionCreateArgsType(
+            vault_index=vault_index,
+            ephemeral_signers=ephemeral_signers,
+            transaction_message=transaction_message_bytes,
+            memo=memo,
+        )
     )
 
     return vault_transaction_create_instruction(
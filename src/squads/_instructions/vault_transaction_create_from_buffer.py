@@ -0,0 +1,76 @@
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from ..accounts import PDA
+from ..generated.instructions.vault_transaction_create_from_buffer import (
+    VaultTransactionCreateFromBufferAccounts,
+    VaultTransactionCreateFromBufferArgs,
+    VaultTransactionCreateNested,
+)
+from ..generated.instructions.vault_transaction_create_from_buffer import (
+    vault_transaction_create_from_buffer as create_from_buffer_instruction,
+)
+from ..generated.types.vault_transaction_create_args import (
+    VaultTransactionCreateArgs as VaultTransactionCreateArgsType,
+)
+
+# The program reads the message from the buffer and requires this
+# placeholder in its place.
+EMPTY_TRANSACTION_MESSAGE = bytes(6)
+
+
+def vault_transaction_create_from_buffer(
+    multisig_pda: Pubkey,
+    transaction_index: int,
+    creator: Pubkey,
+    rent_payer: Pubkey | None,
+    buffer_index: int,
+    vault_index: int,
+    ephemeral_signers: int,
+    memo: str | None,
+    program_id: Pubkey,
+) -> Instruction:
+    try:
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(transaction_index, int)
+        assert isinstance(creator, Pubkey)
+        assert isinstance(rent_payer, Pubkey) or rent_payer is None
+        assert isinstance(buffer_index, int)
+        assert isinstance(vault_index, int)
+        assert isinstance(ephemeral_signers, int)
+        assert isinstance(memo, str) or memo is None
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    # If rent_payer is not provided, use the creator as the rent payer
+    if rent_payer is None:
+        rent_payer = creator
+
+    tx_pda = PDA.get_transaction_pda(multisig_pda, transaction_index, program_id)[0]
+    transaction_buffer_pda = PDA.get_transaction_buffer_pda(
+        multisig_pda, creator, buffer_index, program_id
+    )[0]
+
+    accounts = VaultTransactionCreateFromBufferAccounts(
+        vault_transaction_create=VaultTransactionCreateNested(
+            multisig=multisig_pda,
+            transaction=tx_pda,
+            creator=creator,
+            rent_payer=rent_payer,
+        ),
+        transaction_buffer=transaction_buffer_pda,
+        creator=creator,
+    )
+    args = VaultTransactionCreateFromBufferArgs(
+        args=VaultTransactionCreateArgsType(
+            vault_index=vault_index,
+            ephemeral_signers=ephemeral_signers,
+            transaction_message=EMPTY_TRANSACTION_MESSAGE,
+            memo=memo,
+        )
+    )
+
+    return create_from_buffer_instruction(
+        accounts=accounts, args=args, program_id=program_id
+    )
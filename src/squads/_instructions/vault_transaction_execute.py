@@ -3,9 +3,10 @@ from solders.address_lookup_table_account import AddressLookupTableAccount
 from solders.instruction import Instruction
 from solders.pubkey import Pubkey
 
+from .._internal.lookup_table_cache import AddressLookupTableCache
 from .._internal.utils import accounts_for_transaction_execute
+from .._internal.views import VaultTransactionView
 from ..accounts import PDA
-from ..generated.accounts.vault_transaction import VaultTransaction
 from ..generated.instructions.vault_transaction_execute import (
     VaultTransactionExecuteAccounts,
 )
@@ -21,6 +22,7 @@ async def vault_transaction_execute(
     transaction_index: int,
     member: Pubkey,
     program_id: Pubkey | None,
+    lookup_table_cache: AddressLookupTableCache | None = None,
 ) -> tuple[Instruction, list[AddressLookupTableAccount]]:
     if program_id is None:
         program_id = PROGRAM_ID
@@ -31,17 +33,25 @@ async def vault_transaction_execute(
         assert isinstance(transaction_index, int)
         assert isinstance(member, Pubkey)
         assert isinstance(program_id, Pubkey)
+        assert (
+            isinstance(lookup_table_cache, AddressLookupTableCache)
+            or lookup_table_cache is None
+        )
     except AssertionError:
         raise ValueError("Invalid argument") from None
 
     proposal_pda = PDA.get_proposal_pda(multisig_pda, transaction_index, program_id)[0]
     tx_pda = PDA.get_transaction_pda(multisig_pda, transaction_index, program_id)[0]
 
-    tx_acc = await VaultTransaction.fetch(connection, tx_pda)
+    # Only the header, the account keys and the lookups are needed here,
+    # so skip decoding the instruction payloads.
+    tx_acc = await VaultTransactionView.fetch(connection, tx_pda, program_id=program_id)
 
     assert tx_acc is not None, "Transaction account not found"
 
-    vault_pda = PDA.get_vault_pda(multisig_pda, tx_acc.vault_index, program_id)[0]
+    vault_pda = PDA.get_vault_pda_with_bump(
+        multisig_pda, tx_acc.vault_index, tx_acc.vault_bump, program_id
+    )[0]
     ephemeral_signer_bump_seq = list(tx_acc.ephemeral_signer_bumps)
 
     account_metas, lookup_table_accs = await accounts_for_transaction_execute(
@@ -51,6 +61,7 @@ async def vault_transaction_execute(
         tx_acc.message,
         ephemeral_signer_bump_seq,
         program_id,
+        lookup_table_cache,
     )
 
     accs = VaultTransactionExecuteAccounts(
@@ -0,0 +1,202 @@
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from threading import Lock
+
+from solders.pubkey import Pubkey
+
+# Bump whenever the on-disk layout or the seed encoding changes; stores
+# written with another version are discarded on open.
+SCHEMA_VERSION = 1
+
+
+def encode_seeds(seeds: Sequence[bytes]) -> bytes:
+    # Seeds are at most 32 bytes, so a one byte length prefix keeps the
+    # encoding unambiguous.
+    return b"".join(len(seed).to_bytes(1, "little") + seed for seed in seeds)
+
+
+def decode_seeds(data: bytes) -> tuple[bytes, ...]:
+    seeds: list[bytes] = []
+    offset = 0
+    while offset < len(data):
+        length = data[offset]
+        seeds.append(data[offset + 1 : offset + 1 + length])
+        offset += 1 + length
+    return tuple(seeds)
+
+
+def _verified_address(
+    seeds: Sequence[bytes], program_id: Pubkey, address: bytes, bump: int
+) -> Pubkey | None:
+    """
+    Returns the stored address if re-deriving it from `seeds` and `bump`
+    gives the same address, `None` otherwise. A single hash, not a bump
+    search.
+    """
+    if not 0 <= bump < 256:
+        return None
+    try:
+        derived = Pubkey.create_program_address([*seeds, bytes([bump])], program_id)
+    except Exception:
+        return None
+    if bytes(derived) != address:
+        return None
+    return derived
+
+
+class PersistentAddressCache:
+    """
+    SQLite backed store of derived program addresses.
+
+    Entries are namespaced by program id, so addresses derived for one
+    deployment are never served for another. The database runs in WAL mode,
+    which lets any number of worker processes read it while one of them
+    writes. Each process (and each fork) lazily opens its own connection.
+
+    Every address read back is re-derived from its seeds and stored bump
+    before it is served, so a stale, corrupt or tampered file cannot hand
+    out a wrong address; rows that fail the check are deleted.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 5.0):
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS addresses")
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS addresses ("
+            " program_id BLOB NOT NULL,"
+            " seeds BLOB NOT NULL,"
+            " address BLOB NOT NULL,"
+            " bump INTEGER NOT NULL,"
+            " PRIMARY KEY (program_id, seeds)"
+            ") WITHOUT ROWID"
+        )
+
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def get(
+        self, seeds: Sequence[bytes], program_id: Pubkey
+    ) -> tuple[Pubkey, int] | None:
+        encoded_seeds = encode_seeds(seeds)
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT address, bump FROM addresses"
+                    " WHERE program_id = ? AND seeds = ?",
+                    (bytes(program_id), encoded_seeds),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+
+        address, bump = row
+        verified = _verified_address(seeds, program_id, address, bump)
+        if verified is None:
+            self._delete(program_id, [encoded_seeds])
+            return None
+        return verified, bump
+
+    def put(
+        self, seeds: Sequence[bytes], program_id: Pubkey, value: tuple[Pubkey, int]
+    ) -> None:
+        self.put_many([(seeds, value)], program_id)
+
+    def put_many(
+        self,
+        entries: Iterable[tuple[Sequence[bytes], tuple[Pubkey, int]]],
+        program_id: Pubkey,
+    ) -> None:
+        rows = [
+            (bytes(program_id), encode_seeds(seeds), bytes(address), bump)
+            for seeds, (address, bump) in entries
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO addresses"
+                    " (program_id, seeds, address, bump) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def items(
+        self, program_id: Pubkey
+    ) -> Iterator[tuple[tuple[bytes, ...], tuple[Pubkey, int]]]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT seeds, address, bump FROM addresses WHERE program_id = ?",
+                    (bytes(program_id),),
+                )
+                .fetchall()
+            )
+
+        invalid: list[bytes] = []
+        for encoded_seeds, address, bump in rows:
+            seeds = decode_seeds(encoded_seeds)
+            verified = _verified_address(seeds, program_id, address, bump)
+            if verified is None:
+                invalid.append(encoded_seeds)
+                continue
+            yield seeds, (verified, bump)
+        self._delete(program_id, invalid)
+
+    def _delete(self, program_id: Pubkey, encoded_seeds: Sequence[bytes]) -> None:
+        if not encoded_seeds:
+            return
+        with self._lock:
+            self._connect().executemany(
+                "DELETE FROM addresses WHERE program_id = ? AND seeds = ?",
+                [(bytes(program_id), seeds) for seeds in encoded_seeds],
+            )
+
+    def clear(self, program_id: Pubkey | None = None) -> None:
+        with self._lock:
+            connection = self._connect()
+            if program_id is None:
+                connection.execute("DELETE FROM addresses")
+            else:
+                connection.execute(
+                    "DELETE FROM addresses WHERE program_id = ?", (bytes(program_id),)
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
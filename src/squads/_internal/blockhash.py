@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.hash import Hash
+
+logger = logging.getLogger(__name__)
+
+# A blockhash stays usable for 150 slots (~60s); refreshing well inside that
+# window keeps transactions built from the cache far from expiry.
+DEFAULT_REFRESH_INTERVAL = 10.0
+DEFAULT_MAX_AGE = 30.0
+# A cached blockhash is refetched once fewer blocks than this remain before
+# its `last_valid_block_height`.
+DEFAULT_MIN_REMAINING_BLOCKS = 75
+
+# `getLatestBlockhash` reports `last_valid_block_height` as the current block
+# height plus `MAX_PROCESSING_AGE`; blocks are produced roughly every 400ms.
+MAX_PROCESSING_AGE = 150
+BLOCK_DURATION = 0.4
+
+_providers: "WeakKeyDictionary[AsyncClient, BlockhashProvider]" = WeakKeyDictionary()
+
+
+@dataclass(frozen=True)
+class CachedBlockhash:
+    blockhash: Hash
+    last_valid_block_height: int
+    slot: int
+    """Context slot of the RPC response the blockhash was read from."""
+    fetched_at: float
+    """`time.monotonic()` timestamp of the fetch."""
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    @property
+    def block_height(self) -> int:
+        """Current block height, estimated from the age of the fetch."""
+        fetched_height = self.last_valid_block_height - MAX_PROCESSING_AGE
+        return fetched_height + int(self.age / BLOCK_DURATION)
+
+    @property
+    def remaining_blocks(self) -> int:
+        """Estimated blocks left before the blockhash expires."""
+        return self.last_valid_block_height - self.block_height
+
+
+class BlockhashProvider:
+    """
+    Keeps a recent blockhash for `connection` refreshed in the background.
+
+    While started, the provider is registered for its connection and every
+    `rpc` builder called with that connection takes the cached blockhash
+    instead of issuing its own `getLatestBlockhash` request. A cached value
+    older than `max_age` seconds, or with fewer than `min_remaining_blocks`
+    estimated blocks left before its `last_valid_block_height` (e.g. when the
+    refresh loop keeps failing), is never served; it is refetched inline
+    instead.
+
+    Usage:
+        async with BlockhashProvider(connection):
+            await rpc.proposal_approve(connection, ...)
+    """
+
+    def __init__(
+        self,
+        connection: AsyncClient,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_age: float = DEFAULT_MAX_AGE,
+        commitment: Commitment | None = None,
+        min_remaining_blocks: int = DEFAULT_MIN_REMAINING_BLOCKS,
+    ):
+        assert isinstance(connection, AsyncClient)
+        assert refresh_interval > 0, "Refresh interval must be positive"
+        assert max_age >= refresh_interval, "Max age must cover the refresh interval"
+        assert 0 <= min_remaining_blocks < MAX_PROCESSING_AGE
+
+        self.connection = connection
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.commitment = commitment
+        self.min_remaining_blocks = min_remaining_blocks
+        self._latest: CachedBlockhash | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self.fetches = 0
+        self.served = 0
+
+    @property
+    def latest(self) -> CachedBlockhash | None:
+        return self._latest
+
+    @property
+    def last_valid_block_height(self) -> int | None:
+        return self._latest.last_valid_block_height if self._latest else None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def refresh(self) -> CachedBlockhash:
+        resp = await self.connection.get_latest_blockhash(self.commitment)
+        self.fetches += 1
+        latest = CachedBlockhash(
+            blockhash=resp.value.blockhash,
+            last_valid_block_height=resp.value.last_valid_block_height,
+            slot=resp.context.slot,
+            fetched_at=time.monotonic(),
+        )
+        self._latest = latest
+        return latest
+
+    def _fresh(self, latest: CachedBlockhash) -> bool:
+        return (
+            latest.age < self.max_age
+            and latest.remaining_blocks >= self.min_remaining_blocks
+        )
+
+    async def get(self) -> CachedBlockhash:
+        latest = self._latest
+        if latest is None or not self._fresh(latest):
+            # Concurrent callers share a single inline refresh
+            async with self._lock:
+                latest = self._latest
+                if latest is None or not self._fresh(latest):
+                    latest = await self.refresh()
+        self.served += 1
+        return latest
+
+    async def get_blockhash(self) -> Hash:
+        return (await self.get()).blockhash
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Blockhash refresh failed", exc_info=True)
+
+    async def start(self) -> None:
+        """Fetches the first blockhash and starts the refresh loop."""
+        if self.running:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._refresh_loop())
+        _providers[self.connection] = self
+
+    async def stop(self) -> None:
+        if _providers.get(self.connection) is self:
+            del _providers[self.connection]
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "BlockhashProvider":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+
+def get_blockhash_provider(connection: AsyncClient) -> BlockhashProvider | None:
+    """Returns the running provider registered for `connection`, if any."""
+    provider = _providers.get(connection)
+    if provider is None or not provider.running:
+        return None
+    return provider
@@ -0,0 +1,342 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from anchorpy.coder.accounts import ACCOUNT_DISCRIMINATOR_SIZE
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.proposal import Proposal
+from ..generated.accounts.spending_limit import SpendingLimit
+from ..generated.accounts.vault_transaction import VaultTransaction
+from ..generated.types.proposal_status import Executing
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+PUBKEY_SIZE = 32
+VEC_LEN_SIZE = 4
+
+# Fixed offsets shared by the multisig-scoped accounts
+MULTISIG_OFFSET = ACCOUNT_DISCRIMINATOR_SIZE
+# Proposal: transaction_index, then the status tag. Every status but
+# `Executing` carries an i64 timestamp, which shifts `bump` and the vote lists.
+PROPOSAL_TRANSACTION_INDEX_OFFSET = 40
+PROPOSAL_STATUS_OFFSET = 48
+PROPOSAL_STATUS_TIMESTAMP_OFFSET = 49
+# VaultTransaction
+VAULT_TRANSACTION_CREATOR_OFFSET = 40
+VAULT_TRANSACTION_INDEX_OFFSET = 72
+VAULT_TRANSACTION_BUMP_OFFSET = 80
+VAULT_TRANSACTION_VAULT_INDEX_OFFSET = 81
+VAULT_TRANSACTION_VAULT_BUMP_OFFSET = 82
+VAULT_TRANSACTION_EPHEMERAL_SIGNER_BUMPS_OFFSET = 83
+# SpendingLimit
+SPENDING_LIMIT_CREATE_KEY_OFFSET = 40
+SPENDING_LIMIT_VAULT_INDEX_OFFSET = 72
+SPENDING_LIMIT_MINT_OFFSET = 73
+SPENDING_LIMIT_AMOUNT_OFFSET = 105
+SPENDING_LIMIT_PERIOD_OFFSET = 113
+SPENDING_LIMIT_REMAINING_AMOUNT_OFFSET = 114
+SPENDING_LIMIT_LAST_RESET_OFFSET = 122
+SPENDING_LIMIT_BUMP_OFFSET = 130
+SPENDING_LIMIT_MEMBERS_OFFSET = 131
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Columnar decoding requires numpy: pip install 'squads[columnar]'"
+        ) from None
+    return numpy
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Arrow export requires pyarrow: pip install 'squads[columnar]'"
+        ) from None
+    return pyarrow
+
+
+@dataclass
+class AccountColumns:
+    """
+    Columnar decoding of many accounts of one type.
+
+    `fields` holds one array per fixed-size field: 1-D for integers, `(n, 32)`
+    `uint8` for pubkeys. Rows where a field is absent are flagged in
+    `null_masks`. Variable-length fields are offset-indexed buffers in
+    `lists`: the values of row `i` are `values[offsets[i] : offsets[i + 1]]`,
+    with `(k, 32)` values for pubkey vectors and 1-D `uint8` values for bytes.
+    """
+
+    num_rows: int
+    fields: "dict[str, np.ndarray]" = field(default_factory=dict[str, "np.ndarray"])
+    null_masks: "dict[str, np.ndarray]" = field(default_factory=dict[str, "np.ndarray"])
+    lists: "dict[str, tuple[np.ndarray, np.ndarray]]" = field(
+        default_factory=dict[str, "tuple[np.ndarray, np.ndarray]"]
+    )
+
+    # pyarrow ships without type information, so its types are unknown to pyright
+    def to_arrow(self) -> "pa.Table":  # pyright: ignore[reportUnknownParameterType, reportUnknownMemberType]
+        """
+        Builds a `pyarrow.Table` straight from the column buffers, without a
+        Python object per row. Pubkeys become `fixed_size_binary(32)`, pubkey
+        vectors `large_list` of those and byte fields `large_binary`.
+        """
+        pa = _import_pyarrow()
+        np = _import_numpy()
+
+        arrays: dict[str, Any] = {}
+        for name, values in self.fields.items():
+            if values.ndim == 2:
+                arrays[name] = _fixed_binary_array(pa, values)
+            else:
+                arrays[name] = pa.array(values, mask=self.null_masks.get(name))
+        for name, (offsets, values) in self.lists.items():
+            if values.ndim == 2:
+                arrays[name] = pa.LargeListArray.from_arrays(
+                    pa.array(offsets), _fixed_binary_array(pa, values)
+                )
+            else:
+                arrays[name] = pa.LargeBinaryArray.from_buffers(
+                    pa.large_binary(),
+                    self.num_rows,
+                    [
+                        None,
+                        pa.py_buffer(np.ascontiguousarray(offsets)),
+                        pa.py_buffer(np.ascontiguousarray(values)),
+                    ],
+                )
+        return pa.table(arrays)
+
+    def write_parquet(self, path: str, **kwargs: Any) -> None:
+        """Writes `to_arrow()` to a Parquet file; `kwargs` go to `write_table`."""
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, **kwargs)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
+
+def _fixed_binary_array(pa: Any, values: "np.ndarray") -> Any:
+    return pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(values.shape[1]),
+        values.shape[0],
+        [None, pa.py_buffer(values.tobytes())],
+    )
+
+
+class _RowReader:
+    """Reads the same field from every row of a concatenated data buffer."""
+
+    def __init__(self, np: Any, datas: Sequence[bytes], discriminator: bytes):
+        self.np = np
+        self.num_rows = len(datas)
+        self.buf = np.frombuffer(b"".join(datas), dtype=np.uint8)
+        lengths = np.fromiter(
+            (len(data) for data in datas), dtype=np.int64, count=self.num_rows
+        )
+        self.ends = np.cumsum(lengths)
+        self.starts = self.ends - lengths
+        self.check_bounds(self.starts + ACCOUNT_DISCRIMINATOR_SIZE)
+
+        matches = self.gather(self.starts, ACCOUNT_DISCRIMINATOR_SIZE) == np.frombuffer(
+            discriminator, dtype=np.uint8
+        )
+        invalid = np.flatnonzero(~matches.all(axis=1))
+        if invalid.size:
+            raise ValueError(f"Invalid account discriminator in row {invalid[0]}")
+
+    def check_bounds(self, positions: "np.ndarray") -> None:
+        truncated = self.np.flatnonzero(positions > self.ends)
+        if truncated.size:
+            raise ValueError(f"Truncated account data in row {truncated[0]}")
+
+    def gather(self, positions: "np.ndarray", width: int) -> "np.ndarray":
+        """`(len(positions), width)` bytes starting at each position."""
+        return self.buf[positions[:, None] + self.np.arange(width)]
+
+    def read(self, positions: "np.ndarray", dtype: str) -> "np.ndarray":
+        item_type = self.np.dtype(dtype)
+        itemsize: int = item_type.itemsize
+        self.check_bounds(positions + itemsize)
+        return (
+            self.np.ascontiguousarray(self.gather(positions, itemsize))
+            .view(item_type)
+            .reshape(-1)
+        )
+
+    def pubkeys(self, positions: "np.ndarray") -> "np.ndarray":
+        self.check_bounds(positions + PUBKEY_SIZE)
+        return self.gather(positions, PUBKEY_SIZE)
+
+    def _offsets(self, counts: "np.ndarray") -> "np.ndarray":
+        offsets = self.np.zeros(self.num_rows + 1, dtype=self.np.int64)
+        self.np.cumsum(counts, out=offsets[1:])
+        return offsets
+
+    def _item_positions(
+        self, first: "np.ndarray", counts: "np.ndarray", offsets: "np.ndarray"
+    ) -> "tuple[np.ndarray, np.ndarray]":
+        np = self.np
+        # Position of every item's row start, plus its rank within the row
+        rank = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+        return np.repeat(first, counts), rank
+
+    def pubkey_vec(
+        self, positions: "np.ndarray"
+    ) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+        """Borsh `Vec<Pubkey>` at each position: offsets, keys, end positions."""
+        counts = self.read(positions, "<u4").astype(self.np.int64)
+        ends = positions + VEC_LEN_SIZE + PUBKEY_SIZE * counts
+        self.check_bounds(ends)
+        offsets = self._offsets(counts)
+        first, rank = self._item_positions(positions + VEC_LEN_SIZE, counts, offsets)
+        return offsets, self.gather(first + PUBKEY_SIZE * rank, PUBKEY_SIZE), ends
+
+    def bytes_vec(
+        self, positions: "np.ndarray"
+    ) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+        """Borsh `Vec<u8>` at each position: offsets, bytes, end positions."""
+        counts = self.read(positions, "<u4").astype(self.np.int64)
+        ends = positions + VEC_LEN_SIZE + counts
+        self.check_bounds(ends)
+        offsets = self._offsets(counts)
+        first, rank = self._item_positions(positions + VEC_LEN_SIZE, counts, offsets)
+        return offsets, self.buf[first + rank], ends
+
+    def remainder(self, positions: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+        """Everything from each position to the end of its row."""
+        self.check_bounds(positions)
+        counts = self.ends - positions
+        offsets = self._offsets(counts)
+        first, rank = self._item_positions(positions, counts, offsets)
+        return offsets, self.buf[first + rank]
+
+
+def _with_addresses(
+    np: Any, columns: AccountColumns, addresses: Sequence[Pubkey] | None
+) -> AccountColumns:
+    if addresses is None:
+        return columns
+    if len(addresses) != columns.num_rows:
+        raise ValueError("addresses and account data differ in length")
+    columns.fields = {
+        "address": np.frombuffer(
+            b"".join(bytes(address) for address in addresses), dtype=np.uint8
+        ).reshape(-1, PUBKEY_SIZE),
+        **columns.fields,
+    }
+    return columns
+
+
+def decode_proposal_columns(
+    datas: Sequence[bytes], addresses: Sequence[Pubkey] | None = None
+) -> AccountColumns:
+    """
+    Decodes raw `Proposal` account data into columns: `multisig`,
+    `transaction_index`, `status` (discriminant), `status_timestamp` (null
+    for `Executing`), `bump` and the `approved`, `rejected` and `cancelled`
+    pubkey vectors.
+    """
+    np = _import_numpy()
+    reader = _RowReader(np, datas, Proposal.discriminator)
+    starts = reader.starts
+
+    status = reader.read(starts + PROPOSAL_STATUS_OFFSET, "u1")
+    executing = status == Executing.discriminator
+    # Executing proposals hold `bump` and the vote lists there instead
+    timestamp = reader.read(starts + PROPOSAL_STATUS_TIMESTAMP_OFFSET, "<i8")
+    timestamp[executing] = 0
+    bump_positions = starts + np.where(
+        executing,
+        PROPOSAL_STATUS_TIMESTAMP_OFFSET,
+        PROPOSAL_STATUS_TIMESTAMP_OFFSET + 8,
+    )
+
+    columns = AccountColumns(reader.num_rows)
+    columns.fields = {
+        "multisig": reader.pubkeys(starts + MULTISIG_OFFSET),
+        "transaction_index": reader.read(
+            starts + PROPOSAL_TRANSACTION_INDEX_OFFSET, "<u8"
+        ),
+        "status": status,
+        "status_timestamp": timestamp,
+        "bump": reader.read(bump_positions, "u1"),
+    }
+    columns.null_masks = {"status_timestamp": executing}
+
+    positions = bump_positions + 1
+    for name in ("approved", "rejected", "cancelled"):
+        offsets, keys, positions = reader.pubkey_vec(positions)
+        columns.lists[name] = (offsets, keys)
+    return _with_addresses(np, columns, addresses)
+
+
+def decode_vault_transaction_columns(
+    datas: Sequence[bytes], addresses: Sequence[Pubkey] | None = None
+) -> AccountColumns:
+    """
+    Decodes raw `VaultTransaction` account data into columns: `multisig`,
+    `creator`, `index`, `bump`, `vault_index`, `vault_bump`,
+    `ephemeral_signer_bumps` and `message`, the still encoded
+    `VaultTransactionMessage` (the rest of the account data).
+    """
+    np = _import_numpy()
+    reader = _RowReader(np, datas, VaultTransaction.discriminator)
+    starts = reader.starts
+
+    columns = AccountColumns(reader.num_rows)
+    columns.fields = {
+        "multisig": reader.pubkeys(starts + MULTISIG_OFFSET),
+        "creator": reader.pubkeys(starts + VAULT_TRANSACTION_CREATOR_OFFSET),
+        "index": reader.read(starts + VAULT_TRANSACTION_INDEX_OFFSET, "<u8"),
+        "bump": reader.read(starts + VAULT_TRANSACTION_BUMP_OFFSET, "u1"),
+        "vault_index": reader.read(starts + VAULT_TRANSACTION_VAULT_INDEX_OFFSET, "u1"),
+        "vault_bump": reader.read(starts + VAULT_TRANSACTION_VAULT_BUMP_OFFSET, "u1"),
+    }
+    offsets, values, positions = reader.bytes_vec(
+        starts + VAULT_TRANSACTION_EPHEMERAL_SIGNER_BUMPS_OFFSET
+    )
+    columns.lists["ephemeral_signer_bumps"] = (offsets, values)
+    columns.lists["message"] = reader.remainder(positions)
+    return _with_addresses(np, columns, addresses)
+
+
+def decode_spending_limit_columns(
+    datas: Sequence[bytes], addresses: Sequence[Pubkey] | None = None
+) -> AccountColumns:
+    """
+    Decodes raw `SpendingLimit` account data into columns: `multisig`,
+    `create_key`, `vault_index`, `mint`, `amount`, `period` (discriminant),
+    `remaining_amount`, `last_reset`, `bump` and the `members` and
+    `destinations` pubkey vectors.
+    """
+    np = _import_numpy()
+    reader = _RowReader(np, datas, SpendingLimit.discriminator)
+    starts = reader.starts
+
+    columns = AccountColumns(reader.num_rows)
+    columns.fields = {
+        "multisig": reader.pubkeys(starts + MULTISIG_OFFSET),
+        "create_key": reader.pubkeys(starts + SPENDING_LIMIT_CREATE_KEY_OFFSET),
+        "vault_index": reader.read(starts + SPENDING_LIMIT_VAULT_INDEX_OFFSET, "u1"),
+        "mint": reader.pubkeys(starts + SPENDING_LIMIT_MINT_OFFSET),
+        "amount": reader.read(starts + SPENDING_LIMIT_AMOUNT_OFFSET, "<u8"),
+        "period": reader.read(starts + SPENDING_LIMIT_PERIOD_OFFSET, "u1"),
+        "remaining_amount": reader.read(
+            starts + SPENDING_LIMIT_REMAINING_AMOUNT_OFFSET, "<u8"
+        ),
+        "last_reset": reader.read(starts + SPENDING_LIMIT_LAST_RESET_OFFSET, "<i8"),
+        "bump": reader.read(starts + SPENDING_LIMIT_BUMP_OFFSET, "u1"),
+    }
+    offsets, keys, positions = reader.pubkey_vec(starts + SPENDING_LIMIT_MEMBERS_OFFSET)
+    columns.lists["members"] = (offsets, keys)
+    offsets, keys, _ = reader.pubkey_vec(positions)
+    columns.lists["destinations"] = (offsets, keys)
+    return _with_addresses(np, columns, addresses)
@@ -0,0 +1,325 @@
+from collections.abc import Iterable, Iterator, Set
+from dataclasses import dataclass
+from typing import Self
+
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.accounts.spending_limit import SpendingLimit
+from ..generated.types import period, proposal_status
+from ..generated.types.member import Member
+from ..generated.types.permissions import Permissions
+from .types import Permission
+
+PUBKEY_SIZE = 32
+
+_TimestampedStatus = (
+    proposal_status.Draft
+    | proposal_status.Active
+    | proposal_status.Rejected
+    | proposal_status.Approved
+    | proposal_status.Executed
+    | proposal_status.Cancelled
+)
+_TIMESTAMPED_STATUSES: dict[int, type[_TimestampedStatus]] = {
+    status.discriminator: status
+    for status in (
+        proposal_status.Draft,
+        proposal_status.Active,
+        proposal_status.Rejected,
+        proposal_status.Approved,
+        proposal_status.Executed,
+        proposal_status.Cancelled,
+    )
+}
+_PROPOSAL_STATUSES: dict[int, type[proposal_status.ProposalStatusKind]] = {
+    **_TIMESTAMPED_STATUSES,
+    proposal_status.Executing.discriminator: proposal_status.Executing,
+}
+_PERIODS: dict[int, type[period.PeriodKind]] = {
+    kind.discriminator: kind
+    for kind in (period.OneTime, period.Day, period.Week, period.Month)
+}
+
+
+class PubkeySet(Set[Pubkey]):
+    """
+    Immutable set of pubkeys stored as one packed buffer of 32-byte records,
+    in insertion order.
+
+    Membership is a scan of the buffer in C, which for the member and vote
+    lists of a multisig is faster than hashing `Pubkey` objects and takes a
+    fraction of the memory. `Pubkey` objects are only created on iteration.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, pubkeys: Iterable[Pubkey] = ()):
+        data = bytearray()
+        for pubkey in pubkeys:
+            key = bytes(pubkey)
+            if not _contains(data, key):
+                data += key
+        self._data = bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Wraps `data` holding packed, distinct 32-byte pubkeys as is."""
+        if len(data) % PUBKEY_SIZE:
+            raise ValueError("Data length is not a multiple of the pubkey size")
+        pubkey_set = cls.__new__(cls)
+        pubkey_set._data = bytes(data)
+        return pubkey_set
+
+    def __bytes__(self) -> bytes:
+        return self._data
+
+    def __contains__(self, pubkey: object) -> bool:
+        if isinstance(pubkey, Pubkey):
+            return _contains(self._data, bytes(pubkey))
+        if isinstance(pubkey, bytes) and len(pubkey) == PUBKEY_SIZE:
+            return _contains(self._data, pubkey)
+        return False
+
+    def __iter__(self) -> Iterator[Pubkey]:
+        data = self._data
+        for offset in range(0, len(data), PUBKEY_SIZE):
+            yield Pubkey.from_bytes(data[offset : offset + PUBKEY_SIZE])
+
+    def __len__(self) -> int:
+        return len(self._data) // PUBKEY_SIZE
+
+    def __getitem__(self, index: int) -> Pubkey:
+        offset = range(0, len(self._data), PUBKEY_SIZE)[index]
+        return Pubkey.from_bytes(self._data[offset : offset + PUBKEY_SIZE])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PubkeySet) and self._data == other._data:
+            return True
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash()
+
+    def __repr__(self) -> str:
+        return f"PubkeySet([{', '.join(str(pubkey) for pubkey in self)}])"
+
+    def index(self, pubkey: Pubkey) -> int:
+        """Position of `pubkey` in insertion order."""
+        offset = _find(self._data, bytes(pubkey))
+        if offset < 0:
+            raise ValueError(f"{pubkey} is not in the set")
+        return offset // PUBKEY_SIZE
+
+
+def _find(data: bytes | bytearray, key: bytes) -> int:
+    # A match must start on a record boundary, not inside or across records.
+    offset = data.find(key)
+    while offset >= 0 and offset % PUBKEY_SIZE:
+        offset = data.find(key, offset + 1)
+    return offset
+
+
+def _contains(data: bytes | bytearray, key: bytes) -> bool:
+    return _find(data, key) >= 0
+
+
+@dataclass(frozen=True, slots=True)
+class CompactMember:
+    key: Pubkey
+    permissions: int
+
+    @classmethod
+    def from_member(cls, member: Member) -> Self:
+        return cls(member.key, member.permissions.mask)
+
+    def to_member(self) -> Member:
+        return Member(self.key, Permissions(self.permissions))
+
+    def has(self, permission: Permission) -> bool:
+        return self.permissions & permission == permission
+
+
+@dataclass(frozen=True, slots=True)
+class CompactMultisig:
+    """
+    Slotted, immutable counterpart of `Multisig`.
+
+    Member keys are packed into a `PubkeySet` with one permission mask byte
+    per member, in the same order.
+    """
+
+    create_key: Pubkey
+    config_authority: Pubkey
+    threshold: int
+    time_lock: int
+    transaction_index: int
+    stale_transaction_index: int
+    rent_collector: Pubkey | None
+    bump: int
+    member_keys: PubkeySet
+    member_permissions: bytes
+
+    @classmethod
+    def from_multisig(cls, multisig: Multisig) -> Self:
+        return cls(
+            multisig.create_key,
+            multisig.config_authority,
+            multisig.threshold,
+            multisig.time_lock,
+            multisig.transaction_index,
+            multisig.stale_transaction_index,
+            multisig.rent_collector,
+            multisig.bump,
+            PubkeySet(member.key for member in multisig.members),
+            bytes(member.permissions.mask for member in multisig.members),
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> Self:
+        return cls.from_multisig(Multisig.decode(data))
+
+    def to_multisig(self) -> Multisig:
+        return Multisig(
+            self.create_key,
+            self.config_authority,
+            self.threshold,
+            self.time_lock,
+            self.transaction_index,
+            self.stale_transaction_index,
+            self.rent_collector,
+            self.bump,
+            [member.to_member() for member in self.members],
+        )
+
+    @property
+    def members(self) -> tuple[CompactMember, ...]:
+        return tuple(
+            CompactMember(key, permissions)
+            for key, permissions in zip(
+                self.member_keys, self.member_permissions, strict=True
+            )
+        )
+
+    def member(self, key: Pubkey) -> CompactMember | None:
+        offset = _find(bytes(self.member_keys), bytes(key))
+        if offset < 0:
+            return None
+        return CompactMember(key, self.member_permissions[offset // PUBKEY_SIZE])
+
+
+@dataclass(frozen=True, slots=True)
+class CompactProposal:
+    """
+    Slotted, immutable counterpart of `Proposal`.
+
+    The status is kept as its discriminant and timestamp (`None` for
+    `Executing`, which has none); `status` rebuilds the generated kind.
+    """
+
+    multisig: Pubkey
+    transaction_index: int
+    status_tag: int
+    status_timestamp: int | None
+    bump: int
+    approved: PubkeySet
+    rejected: PubkeySet
+    cancelled: PubkeySet
+
+    @classmethod
+    def from_proposal(cls, proposal: Proposal) -> Self:
+        value = getattr(proposal.status, "value", None)
+        return cls(
+            proposal.multisig,
+            proposal.transaction_index,
+            proposal.status.discriminator,
+            value["timestamp"] if value is not None else None,
+            proposal.bump,
+            PubkeySet(proposal.approved),
+            PubkeySet(proposal.rejected),
+            PubkeySet(proposal.cancelled),
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> Self:
+        return cls.from_proposal(Proposal.decode(data))
+
+    def to_proposal(self) -> Proposal:
+        return Proposal(
+            self.multisig,
+            self.transaction_index,
+            self.status,
+            self.bump,
+            list(self.approved),
+            list(self.rejected),
+            list(self.cancelled),
+        )
+
+    @property
+    def status(self) -> proposal_status.ProposalStatusKind:
+        if self.status_tag == proposal_status.Executing.discriminator:
+            return proposal_status.Executing()
+        status = _TIMESTAMPED_STATUSES[self.status_tag]
+        assert self.status_timestamp is not None
+        return status({"timestamp": self.status_timestamp})
+
+    @property
+    def status_kind(self) -> str:
+        return _PROPOSAL_STATUSES[self.status_tag].kind
+
+
+@dataclass(frozen=True, slots=True)
+class CompactSpendingLimit:
+    """Slotted, immutable counterpart of `SpendingLimit`."""
+
+    multisig: Pubkey
+    create_key: Pubkey
+    vault_index: int
+    mint: Pubkey
+    amount: int
+    period_tag: int
+    remaining_amount: int
+    last_reset: int
+    bump: int
+    members: PubkeySet
+    destinations: PubkeySet
+
+    @classmethod
+    def from_spending_limit(cls, spending_limit: SpendingLimit) -> Self:
+        return cls(
+            spending_limit.multisig,
+            spending_limit.create_key,
+            spending_limit.vault_index,
+            spending_limit.mint,
+            spending_limit.amount,
+            spending_limit.period.discriminator,
+            spending_limit.remaining_amount,
+            spending_limit.last_reset,
+            spending_limit.bump,
+            PubkeySet(spending_limit.members),
+            PubkeySet(spending_limit.destinations),
+        )
+
+    @classmethod
+    def decode(cls, data: bytes) -> Self:
+        return cls.from_spending_limit(SpendingLimit.decode(data))
+
+    def to_spending_limit(self) -> SpendingLimit:
+        return SpendingLimit(
+            self.multisig,
+            self.create_key,
+            self.vault_index,
+            self.mint,
+            self.amount,
+            self.period,
+            self.remaining_amount,
+            self.last_reset,
+            self.bump,
+            list(self.members),
+            list(self.destinations),
+        )
+
+    @property
+    def period(self) -> period.PeriodKind:
+        return _PERIODS[self.period_tag]()
@@ -1,5 +1,7 @@
-from collections.abc import Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
+from threading import Lock
 
 from solders.address_lookup_table_account import AddressLookupTableAccount
 from solders.instruction import CompiledInstruction, Instruction
@@ -7,6 +9,7 @@ from solders.message import MessageAddressTableLookup, MessageHeader
 from solders.pubkey import Pubkey
 
 from .contants import U8_MAX
+from .sizing import PUBKEY_SIZE, WRAPPED_LOOKUP_OVERHEAD
 
 
 @dataclass
@@ -26,7 +29,51 @@ class CompiledKeyMeta:
     is_invoked: bool
 
 
-KeyMetaMap = dict[str, CompiledKeyMeta]
+KeyMetaMap = dict[Pubkey, CompiledKeyMeta]
+
+LOOKUP_TABLE_INDEX_CACHE_SIZE = 1024
+
+# A looked-up key costs a single index byte in a vault transaction message.
+LOOKUP_KEY_SIZE = 1
+
+_lookup_table_indexes: OrderedDict[
+    tuple[Pubkey, int], tuple[list[Pubkey], dict[Pubkey, int]]
+] = OrderedDict()
+_lookup_table_indexes_lock = Lock()
+
+
+def get_lookup_table_index(
+    lookup_table: AddressLookupTableAccount,
+) -> dict[Pubkey, int]:
+    """
+    Returns an address -> position map for the lookup table, built once and
+    shared across compilations.
+
+    On-chain tables are append-only, so the table key together with its
+    length usually identifies its contents. Tables built by the caller need
+    not be, so a hit is only used when the cached addresses match.
+    """
+    addresses = lookup_table.addresses
+    cache_key = (lookup_table.key, len(addresses))
+
+    with _lookup_table_indexes_lock:
+        cached = _lookup_table_indexes.get(cache_key)
+        if cached is not None and cached[0] == addresses:
+            _lookup_table_indexes.move_to_end(cache_key)
+            return cached[1]
+
+    built: dict[Pubkey, int] = {}
+    for position, address in enumerate(addresses):
+        # Keep the first occurrence, like `list.index` would.
+        built.setdefault(address, position)
+
+    with _lookup_table_indexes_lock:
+        _lookup_table_indexes[cache_key] = (addresses, built)
+        _lookup_table_indexes.move_to_end(cache_key)
+        while len(_lookup_table_indexes) > LOOKUP_TABLE_INDEX_CACHE_SIZE:
+            _lookup_table_indexes.popitem(last=False)
+
+    return built
 
 
 class MessageAccountKeys:
@@ -38,8 +85,8 @@ class MessageAccountKeys:
         self.static_account_keys = static_account_keys
         self.account_keys_from_lookups = account_keys_from_lookups
 
-    def __find_key_index(self, key_index_dict: dict[str, int], key: Pubkey) -> int:
-        idx = key_index_dict.get(str(key))
+    def __find_key_index(self, key_index_dict: dict[Pubkey, int], key: Pubkey) -> int:
+        idx = key_index_dict.get(key)
         if idx is None:
             raise ValueError(f"Key {key} not found in key_index_dict")
         return idx
@@ -79,7 +126,7 @@ class MessageAccountKeys:
 
         # Build a dict pubkey -> flat index
         flat_keys = [k for seg in self.key_segments() for k in seg]
-        key_index_dict = {str(pk): idx for idx, pk in enumerate(flat_keys)}
+        key_index_dict = {pk: idx for idx, pk in enumerate(flat_keys)}
 
         compiled_instructions: list[CompiledInstruction] = []
         for ix in instructions:
@@ -115,12 +162,12 @@ class CompiledKeys:
 
     def _drain_keys_found_in_lookup_table(
         self,
-        lookup_table_entries: Sequence[Pubkey],
+        lookup_table_index: Mapping[Pubkey, int],
         key_meta_filter: Callable[[CompiledKeyMeta], bool],
     ) -> tuple[Sequence[int], Sequence[Pubkey]]:
         """
         Internal helper to find and remove keys from key_meta_map that
-        are present in the lookup_table_entries and match the filter.
+        are present in the lookup table and match the filter.
 
         Returns a list of table indexes and a list of drained keys.
         """
@@ -128,20 +175,17 @@ class CompiledKeys:
         drained_keys: Sequence[Pubkey] = []
 
         # Iterate over a copy of items if modifying the dict during iteration
-        # (which self.key_meta_map.delete(address_str) would do)
-        for address_str, key_meta in list(self.key_meta_map.items()):
+        # (which self.key_meta_map.delete(key) would do)
+        for key, key_meta in list(self.key_meta_map.items()):
             if key_meta_filter(key_meta):
-                key = Pubkey.from_string(address_str)
-                try:
-                    # Find index of key in lookup_table_entries
-                    idx = lookup_table_entries.index(key)
-                    assert idx < 256, "Max lookup table index exceeded (must be < 256)"
-                    found_indexes.append(idx)
-                    drained_keys.append(key)
-                    del self.key_meta_map[address_str]
-                except ValueError:
-                    # Key not found in lookup_table_entries, do nothing
-                    pass
+                idx = lookup_table_index.get(key)
+                if idx is None:
+                    # Key not found in the lookup table, do nothing
+                    continue
+                assert idx < 256, "Max lookup table index exceeded (must be < 256)"
+                found_indexes.append(idx)
+                drained_keys.append(key)
+                del self.key_meta_map[key]
 
         return found_indexes, drained_keys
 
@@ -161,15 +205,14 @@ class CompiledKeys:
         key_meta_map: KeyMetaMap = {}
 
         def get_or_insert_default(pubkey: Pubkey) -> CompiledKeyMeta:
-            address = str(pubkey)  # Pubkey to base58 string for map key
-            key_meta = key_meta_map.get(address)
+            key_meta = key_meta_map.get(pubkey)
             if key_meta is None:
                 key_meta = CompiledKeyMeta(
                     is_signer=False,
                     is_writable=False,
                     is_invoked=False,
                 )
-                key_meta_map[address] = key_meta
+                key_meta_map[pubkey] = key_meta
             return key_meta
 
         payer_key_meta = get_or_insert_default(payer)
@@ -190,7 +233,7 @@ class CompiledKeys:
         """
         Constructs the message header and a list of static account keys.
         """
-        map_entries: Sequence[tuple[str, CompiledKeyMeta]] = list(
+        map_entries: Sequence[tuple[Pubkey, CompiledKeyMeta]] = list(
             self.key_meta_map.items()
         )
         assert len(map_entries) <= 256, "Max static account keys length exceeded"
@@ -228,21 +271,83 @@ class CompiledKeys:
 
         # Sanity checks
         assert len(writable_signers) > 0, "Expected at least one writable signer key"
-        assert writable_signers[0][0] == str(self.payer), (
+        assert writable_signers[0][0] == self.payer, (
             "Expected first writable signer key to be the fee payer"
         )
 
         static_account_keys: Sequence[Pubkey] = []
 
         static_account_keys.extend(
-            [Pubkey.from_string(address) for address, _ in writable_signers]
-            + [Pubkey.from_string(address) for address, _ in readonly_signers]
-            + [Pubkey.from_string(address) for address, _ in writable_non_signers]
-            + [Pubkey.from_string(address) for address, _ in readonly_non_signers]
+            [address for address, _ in writable_signers]
+            + [address for address, _ in readonly_signers]
+            + [address for address, _ in writable_non_signers]
+            + [address for address, _ in readonly_non_signers]
         )
 
         return header, static_account_keys
 
+    def _lookup_candidates(self) -> set[Pubkey]:
+        return {
+            key
+            for key, meta in self.key_meta_map.items()
+            if not meta.is_signer and not meta.is_invoked
+        }
+
+    def select_lookup_tables(
+        self, lookup_tables: Sequence[AddressLookupTableAccount]
+    ) -> list[AddressLookupTableAccount]:
+        """
+        Picks the subset and order of `lookup_tables` that minimizes the
+        serialized message size, falling back to `lookup_tables` as given
+        when that is no larger.
+
+        Runs a weighted greedy set cover (repeatedly take the table covering
+        the most still-static keys while that saves bytes), then prunes
+        tables whose exclusively covered keys no longer pay for the lookup
+        entry. Draining the returned tables in order reproduces the chosen
+        key assignment. Does not modify `key_meta_map`.
+        """
+        candidates = self._lookup_candidates()
+        coverage = [
+            candidates.intersection(get_lookup_table_index(table))
+            for table in lookup_tables
+        ]
+
+        selected: list[int] = []
+        remaining = set(candidates)
+        while True:
+            best, best_gain = None, 0
+            for position, covered in enumerate(coverage):
+                if position in selected:
+                    continue
+                gain = _lookup_savings(len(covered & remaining))
+                if gain > best_gain:
+                    best, best_gain = position, gain
+            if best is None:
+                break
+            selected.append(best)
+            remaining -= coverage[best]
+
+        pruned = True
+        while pruned:
+            pruned = False
+            for position in selected:
+                others = set[Pubkey]().union(
+                    *(coverage[p] for p in selected if p != position)
+                )
+                if _lookup_savings(len(coverage[position] - others)) <= 0:
+                    selected.remove(position)
+                    pruned = True
+                    break
+
+        optimized_size = _lookup_section_size(
+            candidates, [coverage[p] for p in selected]
+        )
+        default_size = _lookup_section_size(candidates, coverage)
+        if optimized_size >= default_size:
+            return list(lookup_tables)
+        return [lookup_tables[p] for p in selected]
+
     def extract_table_lookup(
         self, lookup_table: AddressLookupTableAccount
     ) -> tuple[MessageAddressTableLookup, AccountKeysFromLookups] | None:
@@ -253,10 +358,12 @@ class CompiledKeys:
         Returns a tuple containing the MessageAddressTableLookup and
         AccountKeysFromLookups if any keys are extracted, otherwise None.
         """
+        lookup_table_index = get_lookup_table_index(lookup_table)
+
         # Filter for writable keys (not signer, not invoked)
         writable_indexes_list, drained_writable_keys = (
             self._drain_keys_found_in_lookup_table(
-                lookup_table.addresses,  # Accessing addresses from state
+                lookup_table_index,
                 lambda key_meta: (
                     not key_meta.is_signer
                     and not key_meta.is_invoked
@@ -268,7 +375,7 @@ class CompiledKeys:
         # Filter for readonly keys (not signer, not invoked)
         readonly_indexes_list, drained_readonly_keys = (
             self._drain_keys_found_in_lookup_table(
-                lookup_table.addresses,  # Accessing addresses from state
+                lookup_table_index,
                 lambda key_meta: (
                     not key_meta.is_signer
                     and not key_meta.is_invoked
@@ -296,3 +403,24 @@ class CompiledKeys:
         )
 
         return message_address_table_lookup, account_keys_from_lookups
+
+
+def _lookup_savings(num_keys: int) -> int:
+    return num_keys * (PUBKEY_SIZE - LOOKUP_KEY_SIZE) - WRAPPED_LOOKUP_OVERHEAD
+
+
+def _lookup_section_size(
+    candidates: set[Pubkey], coverage: Sequence[set[Pubkey]]
+) -> int:
+    """
+    Size of the candidate keys and lookup entries when keys are drained into
+    the tables in the given order.
+    """
+    remaining = set(candidates)
+    size = 0
+    for covered in coverage:
+        drained = covered & remaining
+        if drained:
+            size += WRAPPED_LOOKUP_OVERHEAD + len(drained) * LOOKUP_KEY_SIZE
+            remaining -= drained
+    return size + len(remaining) * PUBKEY_SIZE
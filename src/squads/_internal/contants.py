@@ -2,4 +2,13 @@ MAX_SAFE_INTEGER = 2**63 - 1
 U8_MAX = 2**8 - 1
 
 MAX_TX_SIZE_BYTES = 1232
+# Accounts a transaction may load and lock, static and looked-up keys
+# together. Clusters with the increased limit accept 128.
+MAX_TX_ACCOUNT_LOCKS = 64
+# Without a compute budget instruction, every instruction adds this many
+# compute units to the transaction's limit, up to `MAX_COMPUTE_UNIT_LIMIT`.
+DEFAULT_INSTRUCTION_COMPUTE_UNIT_LIMIT = 200_000
+MAX_COMPUTE_UNIT_LIMIT = 1_400_000
+# Largest message the program accepts through a `TransactionBuffer`.
+MAX_TRANSACTION_BUFFER_SIZE = 4000
 STRING_LEN_SIZE = 4
@@ -0,0 +1,118 @@
+from collections.abc import Sequence
+
+from solders.instruction import CompiledInstruction
+from solders.message import MessageAddressTableLookup, MessageV0
+
+from .contants import U8_MAX
+from .sizing import PUBKEY_SIZE, wrapped_instruction_size, wrapped_message_size
+
+U16_MAX = 2**16 - 1
+
+
+def _check_u8_len(length: int, name: str) -> None:
+    if length > U8_MAX:
+        raise ValueError(f"Too many {name}: {length} > {U8_MAX}")
+
+
+def _encoded_size(
+    num_account_keys: int,
+    instructions: Sequence[CompiledInstruction],
+    address_table_lookups: Sequence[MessageAddressTableLookup],
+) -> int:
+    return wrapped_message_size(
+        num_account_keys,
+        sum(
+            wrapped_instruction_size(len(ix.accounts), len(ix.data))
+            for ix in instructions
+        ),
+        [
+            (len(lookup.writable_indexes), len(lookup.readonly_indexes))
+            for lookup in address_table_lookups
+        ],
+    )
+
+
+def vault_transaction_message_size(message: MessageV0) -> int:
+    """
+    Size in bytes of `message` once encoded as a Squads `TransactionMessage`
+    (the `transaction_message` argument of `vault_transaction_create`).
+    """
+    return _encoded_size(
+        len(message.account_keys),
+        message.instructions,
+        message.address_table_lookups,
+    )
+
+
+def encode_vault_transaction_message(message: MessageV0) -> bytes:
+    """
+    Encodes a compiled `MessageV0` into the Squads `TransactionMessage`
+    layout (u8/u16 length prefixed "small vecs").
+
+    Produces the same bytes as `TransactionMessageConstruct.layout.build`,
+    written directly into a preallocated buffer.
+    """
+    header = message.header
+    account_keys = message.account_keys
+    instructions = message.instructions
+    address_table_lookups = message.address_table_lookups
+
+    _check_u8_len(len(account_keys), "account keys")
+    _check_u8_len(len(instructions), "instructions")
+    _check_u8_len(len(address_table_lookups), "address table lookups")
+
+    buffer = bytearray(
+        _encoded_size(len(account_keys), instructions, address_table_lookups)
+    )
+    view = memoryview(buffer)
+
+    num_signers = header.num_required_signatures
+    buffer[0] = num_signers
+    buffer[1] = num_signers - header.num_readonly_signed_accounts
+    buffer[2] = len(account_keys) - num_signers - header.num_readonly_unsigned_accounts
+    buffer[3] = len(account_keys)
+    offset = 4
+
+    for key in account_keys:
+        view[offset : offset + PUBKEY_SIZE] = bytes(key)
+        offset += PUBKEY_SIZE
+
+    buffer[offset] = len(instructions)
+    offset += 1
+    for ix in instructions:
+        accounts = ix.accounts
+        data = ix.data
+        _check_u8_len(len(accounts), "instruction accounts")
+        if len(data) > U16_MAX:
+            raise ValueError(f"Instruction data too large: {len(data)} > {U16_MAX}")
+
+        buffer[offset] = ix.program_id_index
+        buffer[offset + 1] = len(accounts)
+        offset += 2
+        view[offset : offset + len(accounts)] = accounts
+        offset += len(accounts)
+        view[offset : offset + 2] = len(data).to_bytes(2, "little")
+        offset += 2
+        view[offset : offset + len(data)] = data
+        offset += len(data)
+
+    buffer[offset] = len(address_table_lookups)
+    offset += 1
+    for lookup in address_table_lookups:
+        writable_indexes = lookup.writable_indexes
+        readonly_indexes = lookup.readonly_indexes
+        _check_u8_len(len(writable_indexes), "writable lookup indexes")
+        _check_u8_len(len(readonly_indexes), "readonly lookup indexes")
+
+        view[offset : offset + PUBKEY_SIZE] = bytes(lookup.account_key)
+        offset += PUBKEY_SIZE
+        buffer[offset] = len(writable_indexes)
+        offset += 1
+        view[offset : offset + len(writable_indexes)] = writable_indexes
+        offset += len(writable_indexes)
+        buffer[offset] = len(readonly_indexes)
+        offset += 1
+        view[offset : offset + len(readonly_indexes)] = readonly_indexes
+        offset += len(readonly_indexes)
+
+    return bytes(buffer)
@@ -0,0 +1,169 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import Protocol, Self
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from ..generated.program_id import PROGRAM_ID
+
+# Maximum number of accounts a single `getMultipleAccounts` call accepts.
+GET_MULTIPLE_ACCOUNTS_LIMIT = 100
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+
+async def get_multiple_accounts_chunked(
+    connection: AsyncClient,
+    pubkeys: Sequence[Pubkey],
+    commitment: Commitment | None = None,
+    chunk_size: int = GET_MULTIPLE_ACCOUNTS_LIMIT,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> tuple[int, list[Account | None]]:
+    """
+    Fetches raw accounts with base64 `getMultipleAccounts` calls of at most
+    `chunk_size` keys, keeping up to `max_concurrency` calls in flight.
+
+    Returns the lowest context slot among the responses and the accounts in
+    input order (`None` for missing accounts).
+    """
+    assert 0 < chunk_size <= GET_MULTIPLE_ACCOUNTS_LIMIT, "Invalid chunk size"
+    assert max_concurrency > 0, "Invalid concurrency"
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_chunk(chunk: Sequence[Pubkey]) -> tuple[int, list[Account | None]]:
+        async with semaphore:
+            resp = await connection.get_multiple_accounts(
+                list(chunk), commitment=commitment, encoding="base64"
+            )
+        return resp.context.slot, list(resp.value)
+
+    chunks = [pubkeys[i : i + chunk_size] for i in range(0, len(pubkeys), chunk_size)]
+    if not chunks:
+        return 0, []
+
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+    slot = min(chunk_slot for chunk_slot, _ in results)
+    accounts = [account for _, chunk_accounts in results for account in chunk_accounts]
+    return slot, accounts
+
+
+class GeneratedAccount(Protocol):
+    discriminator: bytes
+
+    @classmethod
+    def decode(cls, data: bytes) -> Self: ...
+
+
+@dataclass
+class FetchedAccount[T]:
+    """
+    Outcome of fetching one address: `account` is `None` when the account
+    does not exist or could not be fetched or decoded, in which case
+    `error` holds the reason.
+    """
+
+    address: Pubkey
+    account: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _chunked(pubkeys: Iterable[Pubkey], chunk_size: int) -> Iterator[list[Pubkey]]:
+    it = iter(pubkeys)
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
+
+
+async def _get_chunk(
+    connection: AsyncClient, chunk: list[Pubkey], commitment: Commitment | None
+) -> list[Account | None]:
+    resp = await connection.get_multiple_accounts(
+        chunk, commitment=commitment, encoding="base64"
+    )
+    return list(resp.value)
+
+
+def _decode[T: GeneratedAccount](
+    account_class: type[T],
+    address: Pubkey,
+    account: Account | None,
+    program_id: Pubkey,
+) -> FetchedAccount[T]:
+    if account is None:
+        return FetchedAccount(address)
+    if account.owner != program_id:
+        return FetchedAccount(
+            address, error=ValueError("Account does not belong to this program")
+        )
+    try:
+        return FetchedAccount(address, account_class.decode(account.data))
+    except Exception as e:
+        return FetchedAccount(address, error=e)
+
+
+async def iter_fetch_multiple[T: GeneratedAccount](
+    connection: AsyncClient,
+    account_class: type[T],
+    addresses: Iterable[Pubkey],
+    commitment: Commitment | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+    chunk_size: int = GET_MULTIPLE_ACCOUNTS_LIMIT,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> AsyncIterator[list[FetchedAccount[T]]]:
+    """
+    Streaming counterpart of the generated `fetch_multiple`, e.g.
+    `iter_fetch_multiple(connection, Proposal, addresses)`.
+
+    `addresses` is consumed lazily in chunks of `chunk_size`, with at most
+    `max_concurrency` `getMultipleAccounts` calls in flight. The decoded
+    chunks are yielded in input order as soon as they are available, so
+    memory stays bounded by the chunks in flight rather than the number of
+    addresses.
+
+    Instead of aborting, a foreign-owned or undecodable account, or a failed
+    RPC call, is reported in the `error` of the affected items.
+
+    Usage:
+        async for chunk in iter_fetch_multiple(connection, Proposal, addresses):
+            for fetched in chunk:
+                ...
+    """
+    assert 0 < chunk_size <= GET_MULTIPLE_ACCOUNTS_LIMIT, "Invalid chunk size"
+    assert max_concurrency > 0, "Invalid concurrency"
+
+    in_flight: deque[tuple[list[Pubkey], asyncio.Task[list[Account | None]]]] = deque()
+    chunks = _chunked(addresses, chunk_size)
+    try:
+        while True:
+            while len(in_flight) < max_concurrency:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                task = asyncio.create_task(_get_chunk(connection, chunk, commitment))
+                in_flight.append((chunk, task))
+            if not in_flight:
+                return
+
+            chunk, task = in_flight.popleft()
+            try:
+                accounts = await task
+            except Exception as e:
+                yield [FetchedAccount(address, error=e) for address in chunk]
+                continue
+            yield [
+                _decode(account_class, address, account, program_id)
+                for address, account in zip(chunk, accounts, strict=True)
+            ]
+    finally:
+        for _, task in in_flight:
+            task.cancel()
@@ -0,0 +1,187 @@
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.address_lookup_table_account import (
+    AddressLookupTable,
+    AddressLookupTableAccount,
+)
+from solders.pubkey import Pubkey
+
+from .blockhash import BLOCK_DURATION
+from .fetch import get_multiple_accounts_chunked
+
+U64_MAX = 2**64 - 1
+# A deactivated table can no longer be extended, and stays usable until its
+# deactivation slot drops out of the slot hashes sysvar, after which it may
+# be closed at any time.
+DEACTIVATION_COOLDOWN_SLOTS = 512
+
+DEFAULT_LOOKUP_TABLE_TTL = 60.0
+DEFAULT_LOOKUP_TABLE_CACHE_SIZE = 4096
+
+
+async def fetch_address_lookup_tables(
+    connection: AsyncClient,
+    keys: Sequence[Pubkey],
+    commitment: Commitment | None = None,
+) -> tuple[int, dict[Pubkey, AddressLookupTable]]:
+    """
+    Fetches and decodes lookup tables in as few `getMultipleAccounts` round
+    trips as possible. Returns the context slot and the decoded tables.
+    """
+    slot, accounts = await get_multiple_accounts_chunked(
+        connection, keys, commitment=commitment
+    )
+
+    lookup_tables: dict[Pubkey, AddressLookupTable] = {}
+    for key, account in zip(keys, accounts, strict=True):
+        if account is None:
+            raise ValueError(f"Address lookup table account {key} not found")
+        # Raw account data holds the table state, not an `AddressLookupTableAccount`
+        lookup_tables[key] = AddressLookupTable.deserialize(account.data)
+
+    return slot, lookup_tables
+
+
+@dataclass
+class CachedLookupTable:
+    account: AddressLookupTableAccount
+    slot: int
+    """Context slot of the RPC response the table was read from."""
+    fetched_at: float
+    """`time.monotonic()` timestamp of the fetch."""
+    deactivation_slot: int
+
+    @property
+    def is_deactivated(self) -> bool:
+        return self.deactivation_slot != U64_MAX
+
+    @property
+    def estimated_slot(self) -> int:
+        """Current slot, estimated from the age of the fetch."""
+        elapsed = time.monotonic() - self.fetched_at
+        return self.slot + int(elapsed / BLOCK_DURATION)
+
+    @property
+    def may_be_closed(self) -> bool:
+        return (
+            self.is_deactivated
+            and self.estimated_slot
+            >= self.deactivation_slot + DEACTIVATION_COOLDOWN_SLOTS
+        )
+
+
+@dataclass(frozen=True)
+class LookupTableCacheStats:
+    hits: int
+    misses: int
+    stale_refreshes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses + self.stale_refreshes
+        return self.hits / total if total else 0.0
+
+
+class AddressLookupTableCache:
+    """
+    Cache of decoded address lookup tables keyed by table address.
+
+    Lookup tables are append-only while active, so a cached table stays
+    valid for every index below its length. An active entry is refetched
+    only when a caller needs an index beyond the cached length or the entry
+    is older than `ttl` seconds. A deactivated table can no longer change,
+    so its entry is kept until the cooldown may have ended (estimated from
+    the slot it was read at), after which the table may be closed and is
+    refetched to find out.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_LOOKUP_TABLE_TTL,
+        maxsize: int = DEFAULT_LOOKUP_TABLE_CACHE_SIZE,
+    ):
+        assert ttl >= 0, "TTL must be non-negative"
+        assert maxsize > 0, "Cache size must be positive"
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Pubkey, CachedLookupTable] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.stale_refreshes = 0
+
+    def _is_fresh(self, entry: CachedLookupTable, min_length: int) -> bool:
+        if entry.is_deactivated:
+            return not entry.may_be_closed
+        return (
+            len(entry.account.addresses) >= min_length
+            and time.monotonic() - entry.fetched_at < self.ttl
+        )
+
+    def get(self, key: Pubkey) -> CachedLookupTable | None:
+        return self._entries.get(key)
+
+    async def get_many(
+        self,
+        connection: AsyncClient,
+        keys: Sequence[Pubkey],
+        min_lengths: Mapping[Pubkey, int] | None = None,
+        commitment: Commitment | None = None,
+    ) -> dict[Pubkey, AddressLookupTableAccount]:
+        """
+        Returns the requested tables, fetching only the missing or stale ones
+        in a single batched RPC round trip. `min_lengths` maps a table to the
+        number of addresses the caller needs it to have.
+        """
+        min_lengths = min_lengths or {}
+
+        to_fetch: dict[Pubkey, None] = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                to_fetch[key] = None
+            elif not self._is_fresh(entry, min_lengths.get(key, 0)):
+                self.stale_refreshes += 1
+                to_fetch[key] = None
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+        if to_fetch:
+            slot, lookup_tables = await fetch_address_lookup_tables(
+                connection, list(to_fetch), commitment=commitment
+            )
+            fetched_at = time.monotonic()
+            for key, lookup_table in lookup_tables.items():
+                self._entries[key] = CachedLookupTable(
+                    account=AddressLookupTableAccount(key, lookup_table.addresses),
+                    slot=slot,
+                    fetched_at=fetched_at,
+                    deactivation_slot=lookup_table.meta.deactivation_slot,
+                )
+                self._entries.move_to_end(key)
+
+        result = {key: self._entries[key].account for key in keys}
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return result
+
+    def invalidate(self, key: Pubkey | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> LookupTableCacheStats:
+        return LookupTableCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            stale_refreshes=self.stale_refreshes,
+        )
@@ -0,0 +1,125 @@
+from collections.abc import Iterable
+
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.multisig import Multisig
+from ..generated.types.config_action import AddMember, ConfigActionKind, RemoveMember
+from ..generated.types.member import Member
+from .compact import PUBKEY_SIZE, PubkeySet
+from .types import Permission
+
+
+class MemberIndex:
+    """
+    Precomputed lookup of a multisig's members.
+
+    Every member owns a position, and each `Permission` has a bitset with
+    the bit of every member holding it. Membership and permission checks are
+    a dict lookup and a bit test, and vote lists become bitmasks that can be
+    intersected and counted without scanning `members`.
+
+    Positions are stable: removing a member frees its position for the next
+    member added, so bitmasks built earlier stay valid for the remaining
+    members.
+    """
+
+    __slots__ = ("_positions", "_keys", "_free", "_bitsets")
+
+    def __init__(self, members: Iterable[Member] = ()):
+        self._positions: dict[bytes, int] = {}
+        self._keys: list[Pubkey | None] = []
+        self._free: list[int] = []
+        self._bitsets: dict[Permission, int] = dict.fromkeys(Permission, 0)
+        for member in members:
+            self.add_member(member)
+
+    @classmethod
+    def from_multisig(cls, multisig: Multisig) -> "MemberIndex":
+        return cls(multisig.members)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, Pubkey) and bytes(key) in self._positions
+
+    def position(self, key: Pubkey) -> int | None:
+        return self._positions.get(bytes(key))
+
+    def has(self, key: Pubkey, permission: Permission) -> bool:
+        """Whether `key` is a member holding `permission`."""
+        position = self._positions.get(bytes(key))
+        return position is not None and bool(self._bitsets[permission] >> position & 1)
+
+    def bitset(self, permission: Permission) -> int:
+        """Bits of the members holding `permission`."""
+        return self._bitsets[permission]
+
+    def count(self, permission: Permission) -> int:
+        return self._bitsets[permission].bit_count()
+
+    def members_with(self, permission: Permission) -> list[Pubkey]:
+        bitset = self._bitsets[permission]
+        return [
+            key
+            for position, key in enumerate(self._keys)
+            if key is not None and bitset >> position & 1
+        ]
+
+    def mask(self, keys: Iterable[Pubkey] | PubkeySet) -> int:
+        """Bits of the members among `keys`; non-members are ignored."""
+        positions = self._positions
+        mask = 0
+        if isinstance(keys, PubkeySet):
+            data = bytes(keys)
+            for offset in range(0, len(data), PUBKEY_SIZE):
+                position = positions.get(data[offset : offset + PUBKEY_SIZE])
+                if position is not None:
+                    mask |= 1 << position
+        else:
+            for key in keys:
+                position = positions.get(bytes(key))
+                if position is not None:
+                    mask |= 1 << position
+        return mask
+
+    def add_member(self, member: Member) -> int:
+        """Indexes `member` and returns its position."""
+        key = bytes(member.key)
+        if key in self._positions:
+            raise ValueError(f"{member.key} is already a member")
+
+        if self._free:
+            position = self._free.pop()
+            self._keys[position] = member.key
+        else:
+            position = len(self._keys)
+            self._keys.append(member.key)
+        self._positions[key] = position
+
+        bit = 1 << position
+        for permission in Permission:
+            if member.permissions.mask & permission:
+                self._bitsets[permission] |= bit
+        return position
+
+    def remove_member(self, key: Pubkey) -> None:
+        position = self._positions.pop(bytes(key), None)
+        if position is None:
+            raise ValueError(f"{key} is not a member")
+
+        self._keys[position] = None
+        self._free.append(position)
+        bit = 1 << position
+        for permission in Permission:
+            self._bitsets[permission] &= ~bit
+
+    def apply(self, action: ConfigActionKind) -> None:
+        """
+        Applies an executed config action. Only `AddMember` and
+        `RemoveMember` change the members; other actions are ignored.
+        """
+        if isinstance(action, AddMember):
+            self.add_member(action.value["new_member"])
+        elif isinstance(action, RemoveMember):
+            self.remove_member(action.value["old_member"])
@@ -0,0 +1,75 @@
+from collections.abc import Sequence
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+
+from .contants import MAX_TX_ACCOUNT_LOCKS, MAX_TX_SIZE_BYTES
+from .sizing import MessageSizeEstimator, compact_u16_size
+
+
+def pack_instructions(
+    payer_key: Pubkey,
+    instructions: Sequence[Instruction],
+    address_lookup_table_accounts: Sequence[AddressLookupTableAccount] | None = None,
+    max_size: int = MAX_TX_SIZE_BYTES,
+    max_accounts: int = MAX_TX_ACCOUNT_LOCKS,
+    max_instructions: int | None = None,
+) -> list[range]:
+    """
+    Greedily splits `instructions` into consecutive groups that each fit in a
+    single transaction of at most `max_size` bytes, loading at most
+    `max_accounts` unique accounts and, when given, holding at most
+    `max_instructions` instructions (e.g. to stay within the compute budget).
+
+    Returns the index range of every group, in order.
+    """
+    assert max_instructions is None or max_instructions > 0
+
+    groups: list[range] = []
+    start = 0
+    estimator = MessageSizeEstimator(payer_key, address_lookup_table_accounts)
+    for index, ix in enumerate(instructions):
+        group_full = max_instructions is not None and index - start == max_instructions
+        if not group_full and estimator.try_add(ix, max_size, max_accounts):
+            continue
+        if index == start:
+            raise ValueError(f"Instruction {index} does not fit in a transaction")
+
+        groups.append(range(start, index))
+        start = index
+        estimator = MessageSizeEstimator(payer_key, address_lookup_table_accounts)
+        if not estimator.try_add(ix, max_size, max_accounts):
+            raise ValueError(f"Instruction {index} does not fit in a transaction")
+
+    if start < len(instructions):
+        groups.append(range(start, len(instructions)))
+    return groups
+
+
+def max_appendable_data(
+    payer_key: Pubkey,
+    ix: Instruction,
+    max_size: int = MAX_TX_SIZE_BYTES,
+) -> int:
+    """
+    Number of bytes that can be appended to the data of `ix` before a
+    transaction carrying only `ix` exceeds `max_size` bytes.
+    """
+    estimator = MessageSizeEstimator(payer_key)
+    estimator.add(ix)
+    available = max_size - estimator.transaction_size
+    if available <= 0:
+        return 0
+
+    # Longer data may need a longer compact-u16 length prefix
+    data_len = len(ix.data)
+    appendable = available
+    while (
+        appendable
+        + compact_u16_size(data_len + appendable)
+        - compact_u16_size(data_len)
+        > available
+    ):
+        appendable -= 1
+    return appendable
@@ -1,6 +1,20 @@
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Literal
+
 from solders.pubkey import Pubkey
+from spl.token.constants import (
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    TOKEN_2022_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+)
 
 from ..generated.program_id import PROGRAM_ID
+from .address_store import PersistentAddressCache
 from .nums import to_u8_bytes, to_u32_bytes, to_u64_bytes, to_utf_bytes
 
 SEED_PREFIX = to_utf_bytes("multisig")
@@ -12,52 +26,206 @@ SEED_PROPOSAL = to_utf_bytes("proposal")
 SEED_BATCH_TRANSACTION = to_utf_bytes("batch_transaction")
 SEED_EPHEMERAL_SIGNER = to_utf_bytes("ephemeral_signer")
 SEED_SPENDING_LIMIT = to_utf_bytes("spending_limit")
+SEED_TRANSACTION_BUFFER = to_utf_bytes("transaction_buffer")
+
+DEFAULT_PDA_CACHE_SIZE = 65_536
+# Below this many uncached derivations the process pool startup and
+# pickling overhead outweighs the parallel bump search.
+DERIVE_MANY_PARALLEL_THRESHOLD = 4_096
+
+PDACacheKey = tuple[tuple[bytes, ...], Pubkey]
+PDAKind = Literal[
+    "program_config",
+    "multisig",
+    "vault",
+    "ephemeral_signer",
+    "transaction",
+    "proposal",
+    "batch_transaction",
+    "spending_limit",
+    "transaction_buffer",
+]
+
+
+@dataclass(frozen=True)
+class PDACacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PDACache:
+    """Bounded LRU cache of `find_program_address` results."""
+
+    def __init__(self, maxsize: int = DEFAULT_PDA_CACHE_SIZE):
+        assert maxsize >= 0, "Cache size must be non-negative"
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[PDACacheKey, tuple[Pubkey, int]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: PDACacheKey) -> tuple[Pubkey, int] | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: PDACacheKey, value: tuple[Pubkey, int]) -> None:
+        if self._maxsize == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        assert maxsize >= 0, "Cache size must be non-negative"
+
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> PDACacheInfo:
+        with self._lock:
+            return PDACacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+
+def find_program_address(
+    seeds: Sequence[bytes], program_id: Pubkey
+) -> tuple[Pubkey, int]:
+    """
+    Memoized `Pubkey.find_program_address`.
+
+    Results are deterministic for a given seed tuple and program id,
+    so they are served from `PDA.cache` after the first bump search, and
+    from `PDA.persistent_cache` across restarts when one is configured.
+    """
+    key = (tuple(seeds), program_id)
+    cached = PDA.cache.get(key)
+    if cached is not None:
+        return cached
+
+    persistent_cache = PDA.persistent_cache
+    if persistent_cache is not None:
+        stored = persistent_cache.get(key[0], program_id)
+        if stored is not None:
+            PDA.cache.put(key, stored)
+            return stored
+
+    result = Pubkey.find_program_address(list(key[0]), program_id)
+    PDA.cache.put(key, result)
+    if persistent_cache is not None:
+        persistent_cache.put(key[0], program_id, result)
+    return result
+
+
+def create_program_address(
+    seeds: Sequence[bytes], bump: int, program_id: Pubkey
+) -> tuple[Pubkey, int]:
+    """
+    Derives a PDA from an already known bump with a single hash.
+
+    Accounts store their canonical bump on chain, so re-running the bump
+    search for them is wasted work. A single hash is as cheap as a cache
+    lookup, so `PDA.cache` is bypassed and its statistics only reflect bump
+    searches. Raises `ValueError` if the seeds and bump do not produce a
+    valid off-curve address.
+    """
+    assert 0 <= bump < 256, "Invalid bump"
+
+    try:
+        address = Pubkey.create_program_address([*seeds, to_u8_bytes(bump)], program_id)
+    except Exception as e:
+        raise ValueError(f"Invalid bump {bump} for the given seeds") from e
+
+    return address, bump
 
 
 class PDA:
+    cache: PDACache = PDACache()
+    persistent_cache: PersistentAddressCache | None = None
+
+    @staticmethod
+    def cache_info() -> PDACacheInfo:
+        return PDA.cache.info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        PDA.cache.clear()
+
+    @staticmethod
+    def set_cache_size(maxsize: int) -> None:
+        """Resizes the derivation cache; `0` disables caching."""
+        PDA.cache.resize(maxsize)
+
+    @staticmethod
+    def set_persistent_cache(
+        persistent_cache: PersistentAddressCache | None,
+    ) -> None:
+        """Sets (or with `None` removes) the on-disk cache behind `PDA.cache`."""
+        PDA.persistent_cache = persistent_cache
+
+    @staticmethod
+    def warm_cache(program_id: Pubkey = PROGRAM_ID) -> int:
+        """
+        Loads every address stored for `program_id` in the persistent cache
+        into the in-memory cache. Returns the number of entries loaded.
+        """
+        if PDA.persistent_cache is None:
+            return 0
+
+        loaded = 0
+        for seeds, value in PDA.persistent_cache.items(program_id):
+            PDA.cache.put((seeds, program_id), value)
+            loaded += 1
+        return loaded
+
     @staticmethod
     def get_program_config_pda(program_id: Pubkey = PROGRAM_ID) -> tuple[Pubkey, int]:
-        return Pubkey.find_program_address(
-            [SEED_PREFIX, SEED_PROGRAM_CONFIG], program_id
-        )
+        return find_program_address(_program_config_seeds(), program_id)
 
     @staticmethod
     def get_multisig_pda(
         create_key: Pubkey, program_id: Pubkey = PROGRAM_ID
     ) -> tuple[Pubkey, int]:
-        create_key_bytes = create_key.__bytes__()
-        return Pubkey.find_program_address(
-            [SEED_PREFIX, SEED_MULTISIG, create_key_bytes], program_id
-        )
+        return find_program_address(_multisig_seeds(create_key), program_id)
 
     @staticmethod
     def get_vault_pda(
         multisig_pda: Pubkey, index: int, program_id: Pubkey = PROGRAM_ID
     ) -> tuple[Pubkey, int]:
-        assert 0 <= index < 256, "Invalid vault index"
-
-        multisig_pda_bytes = multisig_pda.__bytes__()
-        return Pubkey.find_program_address(
-            [SEED_PREFIX, multisig_pda_bytes, SEED_VAULT, to_u8_bytes(index)],
-            program_id,
-        )
+        return find_program_address(_vault_seeds(multisig_pda, index), program_id)
 
     @staticmethod
     def get_ephemeral_signer_pda(
         transaction_pda: Pubkey, ephemeral_signer_index: int, program_id: Pubkey | None
     ) -> tuple[Pubkey, int]:
-        transaction_pda_bytes = transaction_pda.__bytes__()
-
         if program_id is None:
             program_id = PROGRAM_ID
 
-        return Pubkey.find_program_address(
-            [
-                SEED_PREFIX,
-                transaction_pda_bytes,
-                SEED_EPHEMERAL_SIGNER,
-                to_u8_bytes(ephemeral_signer_index),
-            ],
+        return find_program_address(
+            _ephemeral_signer_seeds(transaction_pda, ephemeral_signer_index),
             program_id,
         )
 
@@ -65,28 +233,14 @@ class PDA:
     def get_transaction_pda(
         multisig_pda: Pubkey, index: int, program_id: Pubkey = PROGRAM_ID
     ) -> tuple[Pubkey, int]:
-        multisig_pda_bytes = multisig_pda.__bytes__()
-
-        return Pubkey.find_program_address(
-            [SEED_PREFIX, multisig_pda_bytes, SEED_TRANSACTION, to_u64_bytes(index)],
-            program_id,
-        )
+        return find_program_address(_transaction_seeds(multisig_pda, index), program_id)
 
     @staticmethod
     def get_proposal_pda(
         multisig_pda: Pubkey, transaction_index: int, program_id: Pubkey = PROGRAM_ID
     ) -> tuple[Pubkey, int]:
-        multisig_pda_bytes = multisig_pda.__bytes__()
-
-        return Pubkey.find_program_address(
-            [
-                SEED_PREFIX,
-                multisig_pda_bytes,
-                SEED_TRANSACTION,
-                to_u64_bytes(transaction_index),
-                SEED_PROPOSAL,
-            ],
-            program_id,
+        return find_program_address(
+            _proposal_seeds(multisig_pda, transaction_index), program_id
         )
 
     @staticmethod
@@ -96,17 +250,8 @@ class PDA:
         transaction_index: int,
         program_id: Pubkey = PROGRAM_ID,
     ) -> tuple[Pubkey, int]:
-        multisig_pda_bytes = multisig_pda.__bytes__()
-
-        return Pubkey.find_program_address(
-            [
-                SEED_PREFIX,
-                multisig_pda_bytes,
-                SEED_TRANSACTION,
-                to_u64_bytes(batch_index),
-                SEED_BATCH_TRANSACTION,
-                to_u32_bytes(transaction_index),
-            ],
+        return find_program_address(
+            _batch_transaction_seeds(multisig_pda, batch_index, transaction_index),
             program_id,
         )
 
@@ -114,10 +259,320 @@ class PDA:
     def get_spending_limit_pda(
         multisig_pda: Pubkey, create_key: Pubkey, program_id: Pubkey = PROGRAM_ID
     ) -> tuple[Pubkey, int]:
-        multisig_pda_bytes = multisig_pda.__bytes__()
-        create_key_bytes = create_key.__bytes__()
+        return find_program_address(
+            _spending_limit_seeds(multisig_pda, create_key), program_id
+        )
 
-        return Pubkey.find_program_address(
-            [SEED_PREFIX, multisig_pda_bytes, SEED_SPENDING_LIMIT, create_key_bytes],
+    @staticmethod
+    def get_transaction_buffer_pda(
+        multisig_pda: Pubkey,
+        creator: Pubkey,
+        buffer_index: int,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> tuple[Pubkey, int]:
+        return find_program_address(
+            _transaction_buffer_seeds(multisig_pda, creator, buffer_index),
             program_id,
         )
+
+    @staticmethod
+    def get_program_config_pda_with_bump(
+        bump: int, program_id: Pubkey = PROGRAM_ID
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(_program_config_seeds(), bump, program_id)
+
+    @staticmethod
+    def get_multisig_pda_with_bump(
+        create_key: Pubkey, bump: int, program_id: Pubkey = PROGRAM_ID
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(_multisig_seeds(create_key), bump, program_id)
+
+    @staticmethod
+    def get_vault_pda_with_bump(
+        multisig_pda: Pubkey, index: int, bump: int, program_id: Pubkey = PROGRAM_ID
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _vault_seeds(multisig_pda, index), bump, program_id
+        )
+
+    @staticmethod
+    def get_ephemeral_signer_pda_with_bump(
+        transaction_pda: Pubkey,
+        ephemeral_signer_index: int,
+        bump: int,
+        program_id: Pubkey | None,
+    ) -> tuple[Pubkey, int]:
+        if program_id is None:
+            program_id = PROGRAM_ID
+
+        return create_program_address(
+            _ephemeral_signer_seeds(transaction_pda, ephemeral_signer_index),
+            bump,
+            program_id,
+        )
+
+    @staticmethod
+    def get_transaction_pda_with_bump(
+        multisig_pda: Pubkey, index: int, bump: int, program_id: Pubkey = PROGRAM_ID
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _transaction_seeds(multisig_pda, index), bump, program_id
+        )
+
+    @staticmethod
+    def get_proposal_pda_with_bump(
+        multisig_pda: Pubkey,
+        transaction_index: int,
+        bump: int,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _proposal_seeds(multisig_pda, transaction_index), bump, program_id
+        )
+
+    @staticmethod
+    def get_batch_transaction_pda_with_bump(
+        multisig_pda: Pubkey,
+        batch_index: int,
+        transaction_index: int,
+        bump: int,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _batch_transaction_seeds(multisig_pda, batch_index, transaction_index),
+            bump,
+            program_id,
+        )
+
+    @staticmethod
+    def get_spending_limit_pda_with_bump(
+        multisig_pda: Pubkey,
+        create_key: Pubkey,
+        bump: int,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _spending_limit_seeds(multisig_pda, create_key), bump, program_id
+        )
+
+    @staticmethod
+    def get_transaction_buffer_pda_with_bump(
+        multisig_pda: Pubkey,
+        creator: Pubkey,
+        buffer_index: int,
+        bump: int,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> tuple[Pubkey, int]:
+        return create_program_address(
+            _transaction_buffer_seeds(multisig_pda, creator, buffer_index),
+            bump,
+            program_id,
+        )
+
+    @staticmethod
+    def get_associated_token_address(
+        owner: Pubkey, mint: Pubkey, token_program_id: Pubkey = TOKEN_PROGRAM_ID
+    ) -> Pubkey:
+        """Cached `spl.token.instructions.get_associated_token_address`."""
+        if token_program_id not in (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID):
+            raise ValueError(
+                "token_program_id must be one of TOKEN_PROGRAM_ID or "
+                "TOKEN_2022_PROGRAM_ID."
+            )
+
+        return find_program_address(
+            _associated_token_seeds(owner, mint, token_program_id),
+            ASSOCIATED_TOKEN_PROGRAM_ID,
+        )[0]
+
+    @staticmethod
+    def derive_many(
+        kind: PDAKind,
+        params: Iterable[tuple[Any, ...]],
+        program_id: Pubkey = PROGRAM_ID,
+        max_workers: int | None = None,
+    ) -> list[tuple[Pubkey, int]]:
+        """
+        Derives many PDAs of the same `kind` in one call.
+
+        Each item of `params` holds the positional arguments of the matching
+        `get_*_pda` method without `program_id`, e.g. `(multisig_pda, index)`
+        for `"transaction"`. Results are returned in input order. Cached
+        entries are served directly; when at least
+        `DERIVE_MANY_PARALLEL_THRESHOLD` derivations miss the cache, the bump
+        searches are spread over a `ProcessPoolExecutor`.
+        """
+        seeds_fn = _SEEDS_BY_KIND.get(kind)
+        if seeds_fn is None:
+            raise ValueError(f"Unknown PDA kind: {kind}")
+
+        keys = [(seeds_fn(*args), program_id) for args in params]
+        results: list[tuple[Pubkey, int] | None] = [PDA.cache.get(k) for k in keys]
+
+        persistent_cache = PDA.persistent_cache
+        missing: dict[PDACacheKey, list[int]] = {}
+        for position, (key, result) in enumerate(zip(keys, results, strict=True)):
+            if result is not None:
+                continue
+            if persistent_cache is not None:
+                stored = persistent_cache.get(key[0], program_id)
+                if stored is not None:
+                    PDA.cache.put(key, stored)
+                    results[position] = stored
+                    continue
+            missing.setdefault(key, []).append(position)
+
+        if not missing:
+            return [r for r in results if r is not None]
+
+        derived = _derive_in_pool(
+            [seeds for seeds, _ in missing], program_id, max_workers
+        )
+
+        derived_entries: list[tuple[tuple[bytes, ...], tuple[Pubkey, int]]] = []
+        for (key, positions), (address_bytes, bump) in zip(
+            missing.items(), derived, strict=True
+        ):
+            result = (Pubkey.from_bytes(address_bytes), bump)
+            PDA.cache.put(key, result)
+            derived_entries.append((key[0], result))
+            for position in positions:
+                results[position] = result
+
+        if persistent_cache is not None:
+            persistent_cache.put_many(derived_entries, program_id)
+
+        return [r for r in results if r is not None]
+
+
+def _program_config_seeds() -> tuple[bytes, ...]:
+    return (SEED_PREFIX, SEED_PROGRAM_CONFIG)
+
+
+def _multisig_seeds(create_key: Pubkey) -> tuple[bytes, ...]:
+    return (SEED_PREFIX, SEED_MULTISIG, create_key.__bytes__())
+
+
+def _vault_seeds(multisig_pda: Pubkey, index: int) -> tuple[bytes, ...]:
+    assert 0 <= index < 256, "Invalid vault index"
+
+    return (SEED_PREFIX, multisig_pda.__bytes__(), SEED_VAULT, to_u8_bytes(index))
+
+
+def _ephemeral_signer_seeds(
+    transaction_pda: Pubkey, ephemeral_signer_index: int
+) -> tuple[bytes, ...]:
+    return (
+        SEED_PREFIX,
+        transaction_pda.__bytes__(),
+        SEED_EPHEMERAL_SIGNER,
+        to_u8_bytes(ephemeral_signer_index),
+    )
+
+
+def _transaction_seeds(multisig_pda: Pubkey, index: int) -> tuple[bytes, ...]:
+    return (
+        SEED_PREFIX,
+        multisig_pda.__bytes__(),
+        SEED_TRANSACTION,
+        to_u64_bytes(index),
+    )
+
+
+def _proposal_seeds(multisig_pda: Pubkey, transaction_index: int) -> tuple[bytes, ...]:
+    return (
+        SEED_PREFIX,
+        multisig_pda.__bytes__(),
+        SEED_TRANSACTION,
+        to_u64_bytes(transaction_index),
+        SEED_PROPOSAL,
+    )
+
+
+def _batch_transaction_seeds(
+    multisig_pda: Pubkey, batch_index: int, transaction_index: int
+) -> tuple[bytes, ...]:
+    return (
+        SEED_PREFIX,
+        multisig_pda.__bytes__(),
+        SEED_TRANSACTION,
+        to_u64_bytes(batch_index),
+        SEED_BATCH_TRANSACTION,
+        to_u32_bytes(transaction_index),
+    )
+
+
+def _spending_limit_seeds(
+    multisig_pda: Pubkey, create_key: Pubkey
+) -> tuple[bytes, ...]:
+    return (
+        SEED_PREFIX,
+        multisig_pda.__bytes__(),
+        SEED_SPENDING_LIMIT,
+        create_key.__bytes__(),
+    )
+
+
+def _transaction_buffer_seeds(
+    multisig_pda: Pubkey, creator: Pubkey, buffer_index: int
+) -> tuple[bytes, ...]:
+    assert 0 <= buffer_index < 256, "Invalid buffer index"
+
+    return (
+        SEED_PREFIX,
+        multisig_pda.__bytes__(),
+        SEED_TRANSACTION_BUFFER,
+        creator.__bytes__(),
+        to_u8_bytes(buffer_index),
+    )
+
+
+def _associated_token_seeds(
+    owner: Pubkey, mint: Pubkey, token_program_id: Pubkey
+) -> tuple[bytes, ...]:
+    return (owner.__bytes__(), token_program_id.__bytes__(), mint.__bytes__())
+
+
+def _derive_in_pool(
+    seeds_list: list[tuple[bytes, ...]], program_id: Pubkey, max_workers: int | None
+) -> list[tuple[bytes, int]]:
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(seeds_list) < DERIVE_MANY_PARALLEL_THRESHOLD:
+        return _find_program_addresses(seeds_list, bytes(program_id))
+
+    chunk_size = -(-len(seeds_list) // (workers * 4))
+    chunks = [
+        seeds_list[i : i + chunk_size] for i in range(0, len(seeds_list), chunk_size)
+    ]
+    derived: list[tuple[bytes, int]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_result in executor.map(
+            _find_program_addresses, chunks, [bytes(program_id)] * len(chunks)
+        ):
+            derived.extend(chunk_result)
+    return derived
+
+
+def _find_program_addresses(
+    seeds_list: list[tuple[bytes, ...]], program_id_bytes: bytes
+) -> list[tuple[bytes, int]]:
+    # Runs inside pool workers, so it only exchanges picklable primitives.
+    program_id = Pubkey.from_bytes(program_id_bytes)
+    results: list[tuple[bytes, int]] = []
+    for seeds in seeds_list:
+        address, bump = Pubkey.find_program_address(list(seeds), program_id)
+        results.append((bytes(address), bump))
+    return results
+
+
+_SEEDS_BY_KIND: dict[str, Callable[..., tuple[bytes, ...]]] = {
+    "program_config": _program_config_seeds,
+    "multisig": _multisig_seeds,
+    "vault": _vault_seeds,
+    "ephemeral_signer": _ephemeral_signer_seeds,
+    "transaction": _transaction_seeds,
+    "proposal": _proposal_seeds,
+    "batch_transaction": _batch_transaction_seeds,
+    "spending_limit": _spending_limit_seeds,
+    "transaction_buffer": _transaction_buffer_seeds,
+}
@@ -0,0 +1,355 @@
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from anchorpy.error import ProgramError
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.errors import custom
+from ..generated.types import proposal_status
+from ..generated.types.config_action import ConfigActionKind
+from .compact import CompactProposal
+from .member_index import MemberIndex
+from .types import Permission
+
+logger = logging.getLogger(__name__)
+
+AnyProposal = Proposal | CompactProposal
+
+
+def _check_member(
+    multisig: Multisig,
+    member: Pubkey,
+    permission: Permission,
+    member_index: MemberIndex | None,
+) -> ProgramError | None:
+    if member_index is not None:
+        if member not in member_index:
+            return custom.NotAMember()
+        if not member_index.has(member, permission):
+            return custom.Unauthorized()
+        return None
+
+    for multisig_member in multisig.members:
+        if multisig_member.key == member:
+            if multisig_member.permissions.mask & permission != permission:
+                return custom.Unauthorized()
+            return None
+    return custom.NotAMember()
+
+
+def _is_stale(multisig: Multisig, transaction_index: int) -> bool:
+    return transaction_index <= multisig.stale_transaction_index
+
+
+def _check_time_lock(
+    multisig: Multisig, proposal: AnyProposal, now: int | None
+) -> ProgramError | None:
+    status = proposal.status
+    if not isinstance(status, proposal_status.Approved):
+        return custom.InvalidProposalStatus()
+    if now is None:
+        now = int(time.time())
+    if now - status.value["timestamp"] < multisig.time_lock:
+        return custom.TimeLockNotReleased()
+    return None
+
+
+def predict_transaction_create(
+    multisig: Multisig,
+    creator: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    """Failure of `vault_transaction_create` or `batch_create`, if any."""
+    return _check_member(multisig, creator, Permission.initiate, member_index)
+
+
+def predict_config_transaction_create(
+    multisig: Multisig,
+    creator: Pubkey,
+    actions: Sequence[ConfigActionKind],
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    if multisig.config_authority != Pubkey.default():
+        return custom.NotSupportedForControlled()
+    error = _check_member(multisig, creator, Permission.initiate, member_index)
+    if error is not None:
+        return error
+    if not actions:
+        return custom.NoActions()
+    return None
+
+
+def predict_proposal_create(
+    multisig: Multisig,
+    transaction_index: int,
+    creator: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    # The program checks the transaction index before the creator
+    if transaction_index > multisig.transaction_index:
+        return custom.InvalidTransactionIndex()
+    if _is_stale(multisig, transaction_index):
+        return custom.StaleProposal()
+    # Either permission allows creating a proposal
+    error = _check_member(multisig, creator, Permission.initiate, member_index)
+    if isinstance(error, custom.Unauthorized):
+        error = _check_member(multisig, creator, Permission.vote, member_index)
+    return error
+
+
+def predict_proposal_activate(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    error = _check_member(multisig, member, Permission.initiate, member_index)
+    if error is not None:
+        return error
+    if proposal.status.kind != "Draft":
+        return custom.InvalidProposalStatus()
+    if _is_stale(multisig, proposal.transaction_index):
+        return custom.StaleProposal()
+    return None
+
+
+def _predict_vote(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    member_index: MemberIndex | None,
+) -> ProgramError | None:
+    error = _check_member(multisig, member, Permission.vote, member_index)
+    if error is not None:
+        return error
+    if proposal.status.kind != "Active":
+        return custom.InvalidProposalStatus()
+    if _is_stale(multisig, proposal.transaction_index):
+        return custom.StaleProposal()
+    return None
+
+
+def predict_proposal_approve(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    error = _predict_vote(multisig, proposal, member, member_index)
+    if error is None and member in proposal.approved:
+        return custom.AlreadyApproved()
+    return error
+
+
+def predict_proposal_reject(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    error = _predict_vote(multisig, proposal, member, member_index)
+    if error is None and member in proposal.rejected:
+        return custom.AlreadyRejected()
+    return error
+
+
+def predict_proposal_cancel(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    # Approved proposals can be cancelled even when stale
+    error = _check_member(multisig, member, Permission.vote, member_index)
+    if error is not None:
+        return error
+    if proposal.status.kind != "Approved":
+        return custom.InvalidProposalStatus()
+    if member in proposal.cancelled:
+        return custom.AlreadyCancelled()
+    return None
+
+
+def predict_vault_transaction_execute(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    now: int | None = None,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    """
+    Failure of `vault_transaction_execute` or `batch_execute_transaction`,
+    if any. Approved vault transactions stay executable once stale.
+    """
+    error = _check_member(multisig, member, Permission.execute, member_index)
+    if error is not None:
+        return error
+    if proposal.status.kind != "Approved":
+        return custom.InvalidProposalStatus()
+    return _check_time_lock(multisig, proposal, now)
+
+
+def predict_config_transaction_execute(
+    multisig: Multisig,
+    proposal: AnyProposal,
+    member: Pubkey,
+    now: int | None = None,
+    member_index: MemberIndex | None = None,
+) -> ProgramError | None:
+    if multisig.config_authority != Pubkey.default():
+        return custom.NotSupportedForControlled()
+    error = _check_member(multisig, member, Permission.execute, member_index)
+    if error is not None:
+        return error
+    if proposal.status.kind != "Approved":
+        return custom.InvalidProposalStatus()
+    error = _check_time_lock(multisig, proposal, now)
+    if error is not None:
+        return error
+    # Unlike vault transactions, stale config transactions can't be executed
+    if _is_stale(multisig, proposal.transaction_index):
+        return custom.StaleProposal()
+    return None
+
+
+@dataclass
+class PreflightStats:
+    checks: int = 0
+    predicted_failures: int = 0
+    round_trips_saved: int = 0
+
+
+class PreflightValidator:
+    """
+    Predicts on-chain failures from cached `Multisig`/`Proposal` state, so a
+    transaction that is bound to fail isn't built, signed and sent.
+
+    In strict mode a predicted failure is raised as the generated program
+    error (e.g. `NotAMember`) and counted as a saved round trip. In advisory
+    mode it is logged and returned, and the caller may send anyway.
+
+    The cached state may be outdated, so a prediction is only as good as the
+    snapshot: a passing check doesn't guarantee success.
+    """
+
+    def __init__(self, strict: bool = True):
+        self.strict = strict
+        self.stats = PreflightStats()
+
+    def _check(self, error: ProgramError | None) -> ProgramError | None:
+        self.stats.checks += 1
+        if error is None:
+            return None
+
+        self.stats.predicted_failures += 1
+        if self.strict:
+            self.stats.round_trips_saved += 1
+            raise error
+        logger.warning("Preflight predicts failure: %s", error)
+        return error
+
+    def transaction_create(
+        self,
+        multisig: Multisig,
+        creator: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(predict_transaction_create(multisig, creator, member_index))
+
+    def config_transaction_create(
+        self,
+        multisig: Multisig,
+        creator: Pubkey,
+        actions: Sequence[ConfigActionKind],
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_config_transaction_create(multisig, creator, actions, member_index)
+        )
+
+    def proposal_create(
+        self,
+        multisig: Multisig,
+        transaction_index: int,
+        creator: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_proposal_create(multisig, transaction_index, creator, member_index)
+        )
+
+    def proposal_activate(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_proposal_activate(multisig, proposal, member, member_index)
+        )
+
+    def proposal_approve(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_proposal_approve(multisig, proposal, member, member_index)
+        )
+
+    def proposal_reject(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_proposal_reject(multisig, proposal, member, member_index)
+        )
+
+    def proposal_cancel(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_proposal_cancel(multisig, proposal, member, member_index)
+        )
+
+    def vault_transaction_execute(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        now: int | None = None,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_vault_transaction_execute(
+                multisig, proposal, member, now, member_index
+            )
+        )
+
+    def config_transaction_execute(
+        self,
+        multisig: Multisig,
+        proposal: AnyProposal,
+        member: Pubkey,
+        now: int | None = None,
+        member_index: MemberIndex | None = None,
+    ) -> ProgramError | None:
+        return self._check(
+            predict_config_transaction_execute(
+                multisig, proposal, member, now, member_index
+            )
+        )
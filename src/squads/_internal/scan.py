@@ -0,0 +1,114 @@
+from anchorpy.coder.accounts import ACCOUNT_DISCRIMINATOR_SIZE
+from based58 import b58encode
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.rpc.types import DataSliceOpts, MemcmpOpts
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.batch import Batch
+from ..generated.accounts.config_transaction import ConfigTransaction
+from ..generated.accounts.proposal import Proposal
+from ..generated.accounts.spending_limit import SpendingLimit
+from ..generated.accounts.transaction_buffer import TransactionBuffer
+from ..generated.accounts.vault_transaction import VaultTransaction
+from ..generated.program_id import PROGRAM_ID
+from .fetch import GeneratedAccount
+
+# Accounts whose layout starts with the `multisig` they belong to, right
+# after the discriminator.
+MULTISIG_SCOPED_ACCOUNTS: tuple[type, ...] = (
+    Batch,
+    ConfigTransaction,
+    Proposal,
+    SpendingLimit,
+    TransactionBuffer,
+    VaultTransaction,
+)
+MULTISIG_FIELD_OFFSET = ACCOUNT_DISCRIMINATOR_SIZE
+
+
+def program_account_filters(
+    account_class: type[GeneratedAccount], multisig_pda: Pubkey | None = None
+) -> list[MemcmpOpts]:
+    """
+    `getProgramAccounts` filters matching the accounts of `account_class`,
+    optionally only those belonging to `multisig_pda`.
+    """
+    filters = [
+        MemcmpOpts(
+            offset=0, bytes=b58encode(account_class.discriminator).decode("ascii")
+        )
+    ]
+    if multisig_pda is not None:
+        if account_class not in MULTISIG_SCOPED_ACCOUNTS:
+            raise ValueError(
+                f"{account_class.__name__} accounts can't be filtered by multisig"
+            )
+        filters.append(
+            MemcmpOpts(offset=MULTISIG_FIELD_OFFSET, bytes=str(multisig_pda))
+        )
+    return filters
+
+
+async def scan_program_accounts[T: GeneratedAccount](
+    connection: AsyncClient,
+    account_class: type[T],
+    multisig_pda: Pubkey | None = None,
+    commitment: Commitment | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+) -> list[tuple[Pubkey, T]]:
+    """
+    Finds every `account_class` account of the program with a single
+    `getProgramAccounts` call filtered server-side, and returns
+    `(address, account)` pairs decoded from its response.
+
+    The RPC returns every match in one response, so large scans are held
+    in memory at once; use `scan_program_account_data` to transfer less.
+
+    With `multisig_pda` only accounts of that multisig are returned. Unlike
+    walking PDAs by transaction index, this also finds accounts whose
+    addresses can't be derived, e.g. spending limits.
+
+    Usage:
+        for address, proposal in await scan_program_accounts(
+            connection, Proposal, multisig_pda
+        ):
+            ...
+    """
+    resp = await connection.get_program_accounts(
+        program_id,
+        commitment=commitment,
+        encoding="base64",
+        filters=program_account_filters(account_class, multisig_pda),
+    )
+    return [
+        (keyed_account.pubkey, account_class.decode(keyed_account.account.data))
+        for keyed_account in resp.value
+    ]
+
+
+async def scan_program_account_data(
+    connection: AsyncClient,
+    account_class: type[GeneratedAccount],
+    data_slice: DataSliceOpts,
+    multisig_pda: Pubkey | None = None,
+    commitment: Commitment | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+) -> list[tuple[Pubkey, bytes]]:
+    """
+    Like `scan_program_accounts`, but only `data_slice` of each account's
+    data is transferred and it is returned undecoded. Useful for header-only
+    scans, e.g. `DataSliceOpts(offset=0, length=49)` reads a proposal's
+    multisig, transaction index and status tag.
+    """
+    resp = await connection.get_program_accounts(
+        program_id,
+        commitment=commitment,
+        encoding="base64",
+        data_slice=data_slice,
+        filters=program_account_filters(account_class, multisig_pda),
+    )
+    return [
+        (keyed_account.pubkey, bytes(keyed_account.account.data))
+        for keyed_account in resp.value
+    ]
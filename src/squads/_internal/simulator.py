@@ -0,0 +1,441 @@
+import bisect
+import dataclasses
+from collections.abc import Sequence
+
+from anchorpy.error import ProgramError
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.config_transaction import ConfigTransaction
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.accounts.spending_limit import SpendingLimit
+from ..generated.errors import anchor, custom
+from ..generated.program_id import PROGRAM_ID
+from ..generated.types import config_action, proposal_status
+from ..generated.types.config_action import ConfigActionKind
+from ..generated.types.member import Member
+from .member_index import MemberIndex
+from .pda import PDA
+from .preflight import (
+    predict_config_transaction_create,
+    predict_config_transaction_execute,
+    predict_proposal_activate,
+    predict_proposal_approve,
+    predict_proposal_cancel,
+    predict_proposal_create,
+    predict_proposal_reject,
+    predict_transaction_create,
+    predict_vault_transaction_execute,
+)
+from .snapshot import MultisigState
+from .types import Permission, Permissions
+
+MAX_TIME_LOCK = 3 * 30 * 24 * 60 * 60  # 90 days
+MAX_MEMBERS = 65535
+DAY = 24 * 60 * 60
+PERIOD_SECONDS: dict[str, int | None] = {
+    "OneTime": None,
+    "Day": DAY,
+    "Week": 7 * DAY,
+    "Month": 30 * DAY,
+}
+
+
+def _raise_if(error: ProgramError | None) -> None:
+    if error is not None:
+        raise error
+
+
+def _copy_multisig(multisig: Multisig) -> Multisig:
+    # Pubkeys, members and statuses are never mutated, only replaced, so
+    # copying the containers isolates the simulation from the caller.
+    return dataclasses.replace(multisig, members=list(multisig.members))
+
+
+def _copy_proposal(proposal: Proposal) -> Proposal:
+    return dataclasses.replace(
+        proposal,
+        approved=list(proposal.approved),
+        rejected=list(proposal.rejected),
+        cancelled=list(proposal.cancelled),
+    )
+
+
+def _check_members(members: list[Member]) -> None:
+    if len(members) > MAX_MEMBERS:
+        raise custom.TooManyMembers()
+    if len({bytes(member.key) for member in members}) != len(members):
+        raise custom.DuplicateMember()
+    known = Permissions.all().mask
+    if any(member.permissions.mask & ~known for member in members):
+        raise custom.UnknownPermission()
+
+
+def check_multisig_invariant(multisig: Multisig) -> None:
+    """Raises the program error `Multisig::invariant` fails with, if any."""
+    _check_members(multisig.members)
+
+    def count(permission: Permission) -> int:
+        return sum(1 for m in multisig.members if m.permissions.mask & permission)
+
+    if count(Permission.initiate) == 0:
+        raise custom.NoProposers()
+    if count(Permission.execute) == 0:
+        raise custom.NoExecutors()
+    num_voters = count(Permission.vote)
+    if num_voters == 0:
+        raise custom.NoVoters()
+    if not 0 < multisig.threshold <= num_voters:
+        raise custom.InvalidThreshold()
+    if multisig.stale_transaction_index > multisig.transaction_index:
+        raise custom.InvalidStaleTransactionIndex()
+    if multisig.time_lock > MAX_TIME_LOCK:
+        raise custom.TimeLockExceedsMaxAllowed()
+
+
+class MultisigSimulator:
+    """
+    In-memory model of the Squads program's state machine for one multisig.
+
+    Instructions are applied to the generated `Multisig`, `Proposal` and
+    `SpendingLimit` dataclasses with the program's rules: the same checks as
+    the preflight validator (raising the generated program errors), vote
+    thresholds, config actions with stale-transaction invalidation and
+    spending-limit period resets. Failing instructions leave the state
+    untouched.
+
+    Time is `now` (unix seconds), which the caller controls, e.g. with
+    `advance`. The simulator works on copies of the accounts it is given, so
+    the caller's objects (e.g. a `MultisigState`) are never modified.
+    """
+
+    def __init__(
+        self,
+        multisig_pda: Pubkey,
+        multisig: Multisig,
+        now: int = 0,
+        program_id: Pubkey = PROGRAM_ID,
+    ):
+        self.multisig_pda = multisig_pda
+        self.multisig = _copy_multisig(multisig)
+        self.now = now
+        self.program_id = program_id
+        self.member_index = MemberIndex.from_multisig(self.multisig)
+        self.proposals: dict[int, Proposal] = {}
+        # Transaction index -> config actions, `None` for vault transactions
+        self.transactions: dict[int, list[ConfigActionKind] | None] = {}
+        self.spending_limits: dict[Pubkey, SpendingLimit] = {}
+
+    @classmethod
+    def from_state(cls, state: MultisigState, now: int = 0) -> "MultisigSimulator":
+        """Starts from a `load_multisig_state` snapshot."""
+        simulator = cls(state.multisig_pda, state.multisig, now)
+        simulator.proposals = {
+            index: _copy_proposal(proposal)
+            for index, proposal in state.proposals.items()
+        }
+        simulator.transactions = {
+            index: list(transaction.actions)
+            if isinstance(transaction, ConfigTransaction)
+            else None
+            for index, transaction in state.transactions.items()
+        }
+        return simulator
+
+    def advance(self, seconds: int) -> None:
+        self.now += seconds
+
+    def _proposal(self, transaction_index: int) -> Proposal:
+        proposal = self.proposals.get(transaction_index)
+        if proposal is None:
+            raise anchor.AccountNotInitialized()
+        return proposal
+
+    def _transaction(
+        self, transaction_index: int, config: bool
+    ) -> list[ConfigActionKind] | None:
+        """
+        Config actions of the transaction at `transaction_index`, raising
+        the error Anchor fails with when the account is missing or of the
+        other transaction type.
+        """
+        if transaction_index not in self.transactions:
+            raise anchor.AccountNotInitialized()
+        actions = self.transactions[transaction_index]
+        if (actions is not None) != config:
+            raise anchor.AccountDiscriminatorMismatch()
+        return actions
+
+    def _cutoff(self) -> int:
+        return self.member_index.count(Permission.vote) - self.multisig.threshold + 1
+
+    # Transactions
+
+    def vault_transaction_create(self, creator: Pubkey) -> int:
+        _raise_if(predict_transaction_create(self.multisig, creator, self.member_index))
+        self.multisig.transaction_index += 1
+        self.transactions[self.multisig.transaction_index] = None
+        return self.multisig.transaction_index
+
+    def config_transaction_create(
+        self, creator: Pubkey, actions: Sequence[ConfigActionKind]
+    ) -> int:
+        _raise_if(
+            predict_config_transaction_create(
+                self.multisig, creator, actions, self.member_index
+            )
+        )
+        self.multisig.transaction_index += 1
+        self.transactions[self.multisig.transaction_index] = list(actions)
+        return self.multisig.transaction_index
+
+    # Proposals
+
+    def proposal_create(
+        self, transaction_index: int, creator: Pubkey, draft: bool = False
+    ) -> Proposal:
+        _raise_if(
+            predict_proposal_create(
+                self.multisig, transaction_index, creator, self.member_index
+            )
+        )
+        if transaction_index in self.proposals:
+            raise ValueError(f"Proposal {transaction_index} already exists")
+
+        status_type = proposal_status.Draft if draft else proposal_status.Active
+        bump = PDA.get_proposal_pda(
+            self.multisig_pda, transaction_index, self.program_id
+        )[1]
+        proposal = Proposal(
+            self.multisig_pda,
+            transaction_index,
+            status_type({"timestamp": self.now}),
+            bump,
+            [],
+            [],
+            [],
+        )
+        self.proposals[transaction_index] = proposal
+        return proposal
+
+    def proposal_activate(self, transaction_index: int, member: Pubkey) -> Proposal:
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_proposal_activate(
+                self.multisig, proposal, member, self.member_index
+            )
+        )
+        proposal.status = proposal_status.Active({"timestamp": self.now})
+        return proposal
+
+    def proposal_approve(self, transaction_index: int, member: Pubkey) -> Proposal:
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_proposal_approve(self.multisig, proposal, member, self.member_index)
+        )
+        if member in proposal.rejected:
+            proposal.rejected.remove(member)
+        bisect.insort(proposal.approved, member, key=bytes)
+        if len(proposal.approved) >= self.multisig.threshold:
+            proposal.status = proposal_status.Approved({"timestamp": self.now})
+        return proposal
+
+    def proposal_reject(self, transaction_index: int, member: Pubkey) -> Proposal:
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_proposal_reject(self.multisig, proposal, member, self.member_index)
+        )
+        if member in proposal.approved:
+            proposal.approved.remove(member)
+        bisect.insort(proposal.rejected, member, key=bytes)
+        if len(proposal.rejected) >= self._cutoff():
+            proposal.status = proposal_status.Rejected({"timestamp": self.now})
+        return proposal
+
+    def proposal_cancel(self, transaction_index: int, member: Pubkey) -> Proposal:
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_proposal_cancel(self.multisig, proposal, member, self.member_index)
+        )
+        # Cancellations of removed members no longer count
+        proposal.cancelled = [
+            key for key in proposal.cancelled if key in self.member_index
+        ]
+        bisect.insort(proposal.cancelled, member, key=bytes)
+        if len(proposal.cancelled) >= self.multisig.threshold:
+            proposal.status = proposal_status.Cancelled({"timestamp": self.now})
+        return proposal
+
+    # Execution
+
+    def vault_transaction_execute(
+        self, transaction_index: int, member: Pubkey
+    ) -> Proposal:
+        self._transaction(transaction_index, config=False)
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_vault_transaction_execute(
+                self.multisig, proposal, member, self.now, self.member_index
+            )
+        )
+        proposal.status = proposal_status.Executed({"timestamp": self.now})
+        return proposal
+
+    def config_transaction_execute(
+        self, transaction_index: int, member: Pubkey
+    ) -> Proposal:
+        actions = self._transaction(transaction_index, config=True)
+        assert actions is not None
+        proposal = self._proposal(transaction_index)
+        _raise_if(
+            predict_config_transaction_execute(
+                self.multisig, proposal, member, self.now, self.member_index
+            )
+        )
+
+        # Actions apply atomically: work on copies and commit once valid
+        multisig = dataclasses.replace(
+            self.multisig, members=list(self.multisig.members)
+        )
+        spending_limits = dict(self.spending_limits)
+        for action in actions:
+            _apply_config_action(self, multisig, spending_limits, action)
+        check_multisig_invariant(multisig)
+
+        self.multisig = multisig
+        self.spending_limits = spending_limits
+        for action in actions:
+            self.member_index.apply(action)
+        proposal.status = proposal_status.Executed({"timestamp": self.now})
+        return proposal
+
+    def spending_limit_use(
+        self,
+        spending_limit_pda: Pubkey,
+        member: Pubkey,
+        amount: int,
+        mint: Pubkey,
+        destination: Pubkey,
+    ) -> SpendingLimit:
+        spending_limit = self.spending_limits.get(spending_limit_pda)
+        if spending_limit is None:
+            raise anchor.AccountNotInitialized()
+        if member not in spending_limit.members:
+            raise custom.Unauthorized()
+        if mint != spending_limit.mint:
+            raise custom.InvalidMint()
+        if (
+            spending_limit.destinations
+            and destination not in spending_limit.destinations
+        ):
+            raise custom.InvalidDestination()
+
+        reset_period = PERIOD_SECONDS[spending_limit.period.kind]
+        remaining_amount = spending_limit.remaining_amount
+        last_reset = spending_limit.last_reset
+        if reset_period is not None:
+            passed = self.now - last_reset
+            if passed > reset_period:
+                remaining_amount = spending_limit.amount
+                last_reset += passed // reset_period * reset_period
+        if amount > remaining_amount:
+            raise custom.SpendingLimitExceeded()
+
+        spending_limit.remaining_amount = remaining_amount - amount
+        spending_limit.last_reset = last_reset
+        return spending_limit
+
+
+def _invalidate_prior_transactions(multisig: Multisig) -> None:
+    multisig.stale_transaction_index = multisig.transaction_index
+
+
+def _apply_config_action(
+    simulator: MultisigSimulator,
+    multisig: Multisig,
+    spending_limits: dict[Pubkey, SpendingLimit],
+    action: ConfigActionKind,
+) -> None:
+    if isinstance(action, config_action.AddMember):
+        _add_member(multisig, action)
+    elif isinstance(action, config_action.RemoveMember):
+        _remove_member(multisig, action)
+    elif isinstance(action, config_action.ChangeThreshold):
+        multisig.threshold = action.value["new_threshold"]
+        _invalidate_prior_transactions(multisig)
+    elif isinstance(action, config_action.SetTimeLock):
+        multisig.time_lock = action.value["new_time_lock"]
+        _invalidate_prior_transactions(multisig)
+    elif isinstance(action, config_action.SetRentCollector):
+        # Changing the rent collector does not invalidate prior transactions
+        multisig.rent_collector = action.value["new_rent_collector"]
+    elif isinstance(action, config_action.AddSpendingLimit):
+        _add_spending_limit(simulator, spending_limits, action)
+    else:
+        _remove_spending_limit(spending_limits, action)
+
+
+def _add_member(multisig: Multisig, action: config_action.AddMember) -> None:
+    new_member = action.value["new_member"]
+    if any(member.key == new_member.key for member in multisig.members):
+        raise custom.DuplicateMember()
+    multisig.members.append(new_member)
+    multisig.members.sort(key=lambda member: bytes(member.key))
+    _invalidate_prior_transactions(multisig)
+
+
+def _remove_member(multisig: Multisig, action: config_action.RemoveMember) -> None:
+    old_member = action.value["old_member"]
+    if len(multisig.members) == 1:
+        raise custom.RemoveLastMember()
+    for position, member in enumerate(multisig.members):
+        if member.key == old_member:
+            del multisig.members[position]
+            break
+    else:
+        raise custom.NotAMember()
+    _invalidate_prior_transactions(multisig)
+
+
+def _add_spending_limit(
+    simulator: MultisigSimulator,
+    spending_limits: dict[Pubkey, SpendingLimit],
+    action: config_action.AddSpendingLimit,
+) -> None:
+    value = action.value
+    if value["amount"] == 0:
+        raise custom.SpendingLimitInvalidAmount()
+    if not value["members"]:
+        raise custom.EmptyMembers()
+    members = sorted(value["members"], key=bytes)
+    if len(set(members)) != len(members):
+        raise custom.DuplicateMember()
+
+    spending_limit_pda, bump = PDA.get_spending_limit_pda(
+        simulator.multisig_pda, value["create_key"], simulator.program_id
+    )
+    # The program `init`s the account, which fails if it already exists
+    if spending_limit_pda in spending_limits:
+        raise ValueError(f"Spending limit {spending_limit_pda} already exists")
+    spending_limits[spending_limit_pda] = SpendingLimit(
+        simulator.multisig_pda,
+        value["create_key"],
+        value["vault_index"],
+        value["mint"],
+        value["amount"],
+        value["period"],
+        value["amount"],
+        simulator.now,
+        bump,
+        members,
+        list(value["destinations"]),
+    )
+
+
+def _remove_spending_limit(
+    spending_limits: dict[Pubkey, SpendingLimit],
+    action: config_action.RemoveSpendingLimit,
+) -> None:
+    spending_limit = spending_limits.pop(action.value["spending_limit"], None)
+    if spending_limit is None:
+        raise custom.MissingAccount()
@@ -0,0 +1,288 @@
+from collections.abc import Sequence
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+
+PUBKEY_SIZE = 32
+HASH_SIZE = 32
+SIGNATURE_SIZE = 64
+MESSAGE_HEADER_SIZE = 3
+VERSION_PREFIX_SIZE = 1
+# A lookup entry of a Squads `TransactionMessage`: the table key plus the u8
+# length prefixes of its writable and readonly index lists.
+WRAPPED_LOOKUP_OVERHEAD = PUBKEY_SIZE + 1 + 1
+
+# (is_signer, is_writable, is_invoked)
+KeyMeta = tuple[bool, bool, bool]
+# Static keys are classified as `None`, looked up keys as
+# (lookup table position, is_writable).
+KeyClass = tuple[int, bool] | None
+
+
+def compact_u16_size(value: int) -> int:
+    """Number of bytes `value` takes as a compact-u16 (shortvec) length."""
+    if value < 0x80:
+        return 1
+    if value < 0x4000:
+        return 2
+    return 3
+
+
+def _lookups_size(lookups: Sequence[tuple[int, int]]) -> int:
+    return sum(
+        PUBKEY_SIZE
+        + compact_u16_size(num_writable)
+        + num_writable
+        + compact_u16_size(num_readonly)
+        + num_readonly
+        for num_writable, num_readonly in lookups
+    )
+
+
+def wrapped_instruction_size(num_accounts: int, data_len: int) -> int:
+    """
+    Size of an instruction in a Squads `TransactionMessage`: program index,
+    u8-prefixed account indexes and u16-prefixed data.
+    """
+    return 1 + 1 + num_accounts + 2 + data_len
+
+
+def wrapped_message_size(
+    num_account_keys: int,
+    instructions_size: int,
+    lookups: Sequence[tuple[int, int]],
+) -> int:
+    """
+    Size of a Squads `TransactionMessage` with `num_account_keys` static
+    keys, instructions totalling `instructions_size` bytes and one lookup
+    entry per (num_writable, num_readonly) pair in `lookups`.
+    """
+    return (
+        MESSAGE_HEADER_SIZE
+        + 1
+        + PUBKEY_SIZE * num_account_keys
+        + 1
+        + instructions_size
+        + 1
+        + sum(
+            WRAPPED_LOOKUP_OVERHEAD + num_writable + num_readonly
+            for num_writable, num_readonly in lookups
+        )
+    )
+
+
+def message_v0_size(message: MessageV0) -> int:
+    """
+    Wire size of a compiled `MessageV0`, version prefix included, computed
+    from its structure instead of serializing it.
+    """
+    size = (
+        VERSION_PREFIX_SIZE
+        + MESSAGE_HEADER_SIZE
+        + compact_u16_size(len(message.account_keys))
+        + PUBKEY_SIZE * len(message.account_keys)
+        + HASH_SIZE
+        + compact_u16_size(len(message.instructions))
+    )
+    for ix in message.instructions:
+        size += (
+            1
+            + compact_u16_size(len(ix.accounts))
+            + len(ix.accounts)
+            + compact_u16_size(len(ix.data))
+            + len(ix.data)
+        )
+    lookups = message.address_table_lookups
+    size += compact_u16_size(len(lookups)) + _lookups_size(
+        [
+            (len(lookup.writable_indexes), len(lookup.readonly_indexes))
+            for lookup in lookups
+        ]
+    )
+    return size
+
+
+def versioned_transaction_size(message: MessageV0) -> int:
+    """Wire size of a signed `VersionedTransaction` carrying `message`."""
+    num_signatures = message.header.num_required_signatures
+    return (
+        compact_u16_size(num_signatures)
+        + SIGNATURE_SIZE * num_signatures
+        + message_v0_size(message)
+    )
+
+
+class MessageSizeEstimator:
+    """
+    Tracks the exact encoded size of a message while instructions are added
+    to it, without compiling or signing anything.
+
+    Keys are classified the same way `MessageV0.try_compile` does: signers,
+    invoked programs and keys missing from every lookup table are static;
+    any other key is loaded from the first table that contains it.
+
+    With `wrapped=True` the size is that of the Squads `TransactionMessage`
+    encoding produced by `compile_to_wrapped_message_v0` (u8/u16 length
+    prefixes, no blockhash, programs may be loaded from lookup tables), i.e.
+    what `vault_transaction_message_size` reports once compiled.
+    """
+
+    def __init__(
+        self,
+        payer_key: Pubkey,
+        address_lookup_table_accounts: Sequence[AddressLookupTableAccount]
+        | None = None,
+        wrapped: bool = False,
+    ):
+        self.wrapped = wrapped
+        self.lookup_tables = list(address_lookup_table_accounts or [])
+        self._lookup_positions: dict[Pubkey, int] = {}
+        for position, lookup_table in enumerate(self.lookup_tables):
+            for address in lookup_table.addresses:
+                self._lookup_positions.setdefault(address, position)
+
+        self._metas: dict[Pubkey, KeyMeta] = {}
+        self.num_signers = 0
+        self.num_static_keys = 0
+        self._lookups = [[0, 0] for _ in self.lookup_tables]
+        self.num_instructions = 0
+        self._instructions_size = 0
+
+        self._set_meta(payer_key, (True, True, False))
+
+    def _classify(self, key: Pubkey, meta: KeyMeta) -> KeyClass:
+        is_signer, is_writable, is_invoked = meta
+        if is_signer or (is_invoked and not self.wrapped):
+            return None
+        position = self._lookup_positions.get(key)
+        if position is None:
+            return None
+        return position, is_writable
+
+    def _count(self, key: Pubkey, meta: KeyMeta, delta: int) -> None:
+        key_class = self._classify(key, meta)
+        if key_class is None:
+            self.num_static_keys += delta
+            if meta[0]:
+                self.num_signers += delta
+        else:
+            position, is_writable = key_class
+            self._lookups[position][0 if is_writable else 1] += delta
+
+    def _set_meta(self, key: Pubkey, meta: KeyMeta) -> KeyMeta | None:
+        previous = self._metas.get(key)
+        if previous == meta:
+            return previous
+        if previous is not None:
+            self._count(key, previous, -1)
+        self._metas[key] = meta
+        self._count(key, meta, 1)
+        return previous
+
+    def _merge_meta(self, key: Pubkey, meta: KeyMeta) -> KeyMeta:
+        previous = self._metas.get(key)
+        if previous is None:
+            return meta
+        return (
+            previous[0] or meta[0],
+            previous[1] or meta[1],
+            previous[2] or meta[2],
+        )
+
+    def _instruction_size(self, ix: Instruction) -> int:
+        num_accounts = len(ix.accounts)
+        data_len = len(ix.data)
+        if self.wrapped:
+            return wrapped_instruction_size(num_accounts, data_len)
+        return (
+            1
+            + compact_u16_size(num_accounts)
+            + num_accounts
+            + compact_u16_size(data_len)
+            + data_len
+        )
+
+    def add(self, ix: Instruction) -> list[tuple[Pubkey, KeyMeta | None]]:
+        """
+        Adds `ix` to the message. Returns the previous meta of every key the
+        instruction changed, which `remove` uses to undo the addition.
+        """
+        changes: list[tuple[Pubkey, KeyMeta | None]] = []
+        for account in ix.accounts:
+            meta = self._merge_meta(
+                account.pubkey, (account.is_signer, account.is_writable, False)
+            )
+            if self._metas.get(account.pubkey) != meta:
+                changes.append((account.pubkey, self._set_meta(account.pubkey, meta)))
+        meta = self._merge_meta(ix.program_id, (False, False, True))
+        if self._metas.get(ix.program_id) != meta:
+            changes.append((ix.program_id, self._set_meta(ix.program_id, meta)))
+
+        self.num_instructions += 1
+        self._instructions_size += self._instruction_size(ix)
+        return changes
+
+    def remove(
+        self, ix: Instruction, changes: list[tuple[Pubkey, KeyMeta | None]]
+    ) -> None:
+        """Undoes the `add` of `ix` that returned `changes`."""
+        self.num_instructions -= 1
+        self._instructions_size -= self._instruction_size(ix)
+        for key, previous in reversed(changes):
+            self._count(key, self._metas[key], -1)
+            if previous is None:
+                del self._metas[key]
+            else:
+                self._metas[key] = previous
+                self._count(key, previous, 1)
+
+    def try_add(
+        self, ix: Instruction, max_size: int, max_accounts: int | None = None
+    ) -> bool:
+        """
+        Adds `ix` only if the result still fits in `max_size` bytes and, when
+        `max_accounts` is given, loads at most that many accounts.
+        """
+        changes = self.add(ix)
+        size = self.message_size if self.wrapped else self.transaction_size
+        if size <= max_size and (
+            max_accounts is None or self.num_accounts <= max_accounts
+        ):
+            return True
+        self.remove(ix, changes)
+        return False
+
+    @property
+    def num_accounts(self) -> int:
+        """Unique accounts the message loads, static and looked up."""
+        return len(self._metas)
+
+    @property
+    def message_size(self) -> int:
+        lookups = [(w, r) for w, r in self._lookups if w + r]
+        if self.wrapped:
+            return wrapped_message_size(
+                self.num_static_keys, self._instructions_size, lookups
+            )
+        return (
+            VERSION_PREFIX_SIZE
+            + MESSAGE_HEADER_SIZE
+            + compact_u16_size(self.num_static_keys)
+            + PUBKEY_SIZE * self.num_static_keys
+            + HASH_SIZE
+            + compact_u16_size(self.num_instructions)
+            + self._instructions_size
+            + compact_u16_size(len(lookups))
+            + _lookups_size(lookups)
+        )
+
+    @property
+    def transaction_size(self) -> int:
+        """Size of the signed transaction; only meaningful for wire messages."""
+        return (
+            compact_u16_size(self.num_signers)
+            + SIGNATURE_SIZE * self.num_signers
+            + self.message_size
+        )
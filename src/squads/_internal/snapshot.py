@@ -0,0 +1,163 @@
+import asyncio
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from anchorpy.coder.accounts import ACCOUNT_DISCRIMINATOR_SIZE
+from anchorpy.error import AccountInvalidDiscriminator
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.batch import Batch
+from ..generated.accounts.config_transaction import ConfigTransaction
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.accounts.vault_transaction import VaultTransaction
+from ..generated.program_id import PROGRAM_ID
+from .fetch import DEFAULT_MAX_CONCURRENT_REQUESTS, get_multiple_accounts_chunked
+from .member_index import MemberIndex
+from .pda import PDA
+
+MultisigTransaction = VaultTransaction | ConfigTransaction | Batch
+
+# The transaction PDA of an index holds whichever kind of transaction was
+# created at that index.
+_TRANSACTION_CLASSES: dict[bytes, type[MultisigTransaction]] = {
+    cls.discriminator: cls for cls in (VaultTransaction, ConfigTransaction, Batch)
+}
+
+
+@dataclass
+class MultisigState:
+    """
+    Snapshot of a multisig and its transactions and proposals.
+
+    `transactions` and `proposals` are keyed by transaction index; indexes
+    without an account (never created, or closed) are absent. `slot` is the
+    lowest context slot the accounts were read at.
+    """
+
+    multisig_pda: Pubkey
+    multisig: Multisig
+    indexes: range
+    slot: int
+    transactions: dict[int, MultisigTransaction] = field(
+        default_factory=dict[int, MultisigTransaction]
+    )
+    proposals: dict[int, Proposal] = field(default_factory=dict[int, Proposal])
+
+    @cached_property
+    def member_index(self) -> MemberIndex:
+        return MemberIndex.from_multisig(self.multisig)
+
+    @property
+    def vault_transactions(self) -> dict[int, VaultTransaction]:
+        return {
+            index: transaction
+            for index, transaction in self.transactions.items()
+            if isinstance(transaction, VaultTransaction)
+        }
+
+    @property
+    def config_transactions(self) -> dict[int, ConfigTransaction]:
+        return {
+            index: transaction
+            for index, transaction in self.transactions.items()
+            if isinstance(transaction, ConfigTransaction)
+        }
+
+    @property
+    def batches(self) -> dict[int, Batch]:
+        return {
+            index: transaction
+            for index, transaction in self.transactions.items()
+            if isinstance(transaction, Batch)
+        }
+
+
+def _decode_transaction(account: Account, program_id: Pubkey) -> MultisigTransaction:
+    if account.owner != program_id:
+        raise ValueError("Account does not belong to this program")
+    cls = _TRANSACTION_CLASSES.get(bytes(account.data[:ACCOUNT_DISCRIMINATOR_SIZE]))
+    if cls is None:
+        raise AccountInvalidDiscriminator(
+            "The discriminator for this account is invalid"
+        )
+    return cls.decode(account.data)
+
+
+def _decode_proposal(account: Account, program_id: Pubkey) -> Proposal:
+    if account.owner != program_id:
+        raise ValueError("Account does not belong to this program")
+    return Proposal.decode(account.data)
+
+
+async def load_multisig_state(
+    connection: AsyncClient,
+    multisig_pda: Pubkey,
+    indexes: range | None = None,
+    commitment: Commitment | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> MultisigState:
+    """
+    Loads a multisig together with the transaction and proposal accounts of
+    every transaction index in `indexes` (by default all of them, i.e.
+    `range(1, multisig.transaction_index + 1)`).
+
+    The transaction and proposal accounts are read with chunked
+    `getMultipleAccounts` calls, up to `max_concurrency` in flight, and
+    decoded by their discriminator.
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(indexes, range) or indexes is None
+    assert isinstance(program_id, Pubkey)
+
+    resp = await connection.get_account_info(
+        multisig_pda, commitment=commitment, encoding="base64"
+    )
+    if resp.value is None:
+        raise ValueError("Multisig account not found")
+    if resp.value.owner != program_id:
+        raise ValueError("Account does not belong to this program")
+    multisig = Multisig.decode(resp.value.data)
+
+    if indexes is None:
+        indexes = range(1, multisig.transaction_index + 1)
+
+    # Deriving thousands of addresses takes a while, so keep it off the
+    # event loop
+    params = [(multisig_pda, index) for index in indexes]
+    transaction_pdas = await asyncio.to_thread(
+        PDA.derive_many, "transaction", params, program_id
+    )
+    proposal_pdas = await asyncio.to_thread(
+        PDA.derive_many, "proposal", params, program_id
+    )
+
+    slot, accounts = await get_multiple_accounts_chunked(
+        connection,
+        [pda for pda, _ in transaction_pdas] + [pda for pda, _ in proposal_pdas],
+        commitment=commitment,
+        max_concurrency=max_concurrency,
+    )
+
+    if accounts:
+        slot = min(slot, resp.context.slot)
+    else:
+        slot = resp.context.slot
+
+    state = MultisigState(multisig_pda, multisig, indexes, slot)
+    for index, transaction_account, proposal_account in zip(
+        indexes, accounts[: len(indexes)], accounts[len(indexes) :], strict=True
+    ):
+        if transaction_account is not None:
+            state.transactions[index] = _decode_transaction(
+                transaction_account, program_id
+            )
+        if proposal_account is not None:
+            state.proposals[index] = _decode_proposal(proposal_account, program_id)
+
+    return state
@@ -0,0 +1,93 @@
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.types import proposal_status
+from .compact import CompactProposal
+from .member_index import MemberIndex
+from .types import Permission
+
+
+@dataclass(frozen=True, slots=True)
+class ProposalTally:
+    """
+    Vote count of one proposal against its multisig.
+
+    `approvals`/`rejections` only count current members with the `Vote`
+    permission. `time_lock_elapsed` is `None` unless the proposal is
+    `Approved`.
+    """
+
+    transaction_index: int
+    status: str
+    approvals: int
+    rejections: int
+    threshold: int
+    cutoff: int
+    stale: bool
+    executable_at: int | None
+    time_lock_elapsed: bool | None
+
+    @property
+    def threshold_reached(self) -> bool:
+        return self.approvals >= self.threshold
+
+    @property
+    def cutoff_reached(self) -> bool:
+        return self.rejections >= self.cutoff
+
+
+def tally_proposals(
+    multisig: Multisig,
+    proposals: Sequence[Proposal | CompactProposal],
+    now: int | None = None,
+    member_index: MemberIndex | None = None,
+) -> list[ProposalTally]:
+    """
+    Tallies every proposal of `multisig` in one pass.
+
+    Each vote list becomes a bitmask over the positions of `member_index`
+    (built from `multisig` when not given), and approvals and rejections are
+    the popcount of that mask and the `Vote` bitset, so no member list is
+    scanned per proposal. The thresholds follow the program:
+
+    - approved once approvals reach `threshold`,
+    - rejected once rejections reach the cutoff, i.e.
+      `voters - threshold + 1`,
+    - stale when `transaction_index <= stale_transaction_index`,
+    - the time lock has elapsed once `now` (unix seconds, default: current
+      time) is at least the `Approved` timestamp plus `time_lock`.
+    """
+    if now is None:
+        now = int(time.time())
+
+    if member_index is None:
+        member_index = MemberIndex.from_multisig(multisig)
+    voters = member_index.bitset(Permission.vote)
+    cutoff = voters.bit_count() - multisig.threshold + 1
+
+    tallies: list[ProposalTally] = []
+    for proposal in proposals:
+        status = proposal.status
+        executable_at: int | None = None
+        time_lock_elapsed: bool | None = None
+        if isinstance(status, proposal_status.Approved):
+            executable_at = status.value["timestamp"] + multisig.time_lock
+            time_lock_elapsed = now >= executable_at
+
+        tallies.append(
+            ProposalTally(
+                proposal.transaction_index,
+                status.kind,
+                (member_index.mask(proposal.approved) & voters).bit_count(),
+                (member_index.mask(proposal.rejected) & voters).bit_count(),
+                multisig.threshold,
+                cutoff,
+                proposal.transaction_index <= multisig.stale_transaction_index,
+                executable_at,
+                time_lock_elapsed,
+            )
+        )
+    return tallies
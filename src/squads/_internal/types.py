@@ -79,7 +79,7 @@ class MessageAddressTableConstruct:
 
     def to_encodable(self) -> dict[str, Any]:
         return {
-            "account_key": str(self.account_key),
+            "account_key": self.account_key,
             "writable_indexes": self.writable_indexes,
             "readonly_indexes": self.readonly_indexes,
         }
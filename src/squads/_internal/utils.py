@@ -1,36 +1,68 @@
 from collections.abc import Sequence
 
 from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.rpc.types import TxOpts
 from solders.address_lookup_table_account import AddressLookupTableAccount
 from solders.hash import Hash
 from solders.instruction import AccountMeta, Instruction
 from solders.message import MessageAddressTableLookup, MessageV0
 from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from solders.transaction_status import (
+    InstructionErrorCustom,
+    TransactionErrorInstructionError,
+)
 
 from ..accounts import PDA
-from ..generated.types.multisig_compiled_instruction import (
-    MultisigCompiledInstructionJSON,
-)
-from ..generated.types.multisig_message_address_table_lookup import (
-    MultisigMessageAddressTableLookupJSON,
-)
-from ..generated.types.vault_transaction_message import (
-    VaultTransactionMessage,
-    VaultTransactionMessageJSON,
-)
+from ..generated import errors
+from ..generated.types.vault_transaction_message import VaultTransactionMessage
+from .blockhash import get_blockhash_provider
 from .compiled_keys import AccountKeysFromLookups, CompiledKeys, MessageAccountKeys
-from .types import TransactionMessageConstruct
+from .encoding import encode_vault_transaction_message
+from .lookup_table_cache import AddressLookupTableCache, fetch_address_lookup_tables
+from .views import VaultTransactionMessageView
 
 
 async def get_recent_blockhash(connection: AsyncClient) -> Hash:
+    provider = get_blockhash_provider(connection)
+    if provider is not None:
+        return await provider.get_blockhash()
     return (await connection.get_latest_blockhash()).value.blockhash
 
 
+async def send_and_confirm_transaction(
+    connection: AsyncClient,
+    tx: VersionedTransaction,
+    send_options: TxOpts | None,
+    commitment: Commitment | None,
+) -> Signature:
+    """
+    Sends `tx` and waits until it reaches `commitment`. Raises if the
+    transaction failed on chain.
+    """
+    signature = (await connection.send_transaction(tx, send_options)).value
+    resp = await connection.confirm_transaction(signature, commitment)
+    status = resp.value[0]
+    if status is not None and status.err is not None:
+        err = status.err
+        if isinstance(err, TransactionErrorInstructionError) and isinstance(
+            err.err, InstructionErrorCustom
+        ):
+            program_error = errors.from_code(err.err.code)
+            if program_error is not None:
+                raise program_error
+        raise RuntimeError(f"Transaction {signature} failed: {err}")
+    return signature
+
+
 def compile_to_wrapped_message_v0(
     payer_key: Pubkey,
     recent_blockhash: Hash,
     instructions: Sequence[Instruction],
     address_lookup_table_accounts: Sequence[AddressLookupTableAccount] | None = None,
+    optimize_lookup_tables: bool = False,
 ) -> MessageV0:
     """
     Compiles transaction components into a MessageV0 object, using a custom
@@ -49,6 +81,9 @@ def compile_to_wrapped_message_v0(
         address_lookup_table_accounts: An optional sequence of address lookup
                                        table accounts to use for compressing
                                        the message.
+        optimize_lookup_tables: Drain keys into the smallest useful set of
+                                lookup tables instead of taking the tables
+                                greedily in the given order.
 
     Returns:
         A MessageV0 object ready for transaction signing and sending.
@@ -59,6 +94,10 @@ def compile_to_wrapped_message_v0(
     account_keys_from_lookups: AccountKeysFromLookups = AccountKeysFromLookups.empty()
 
     active_address_lookup_table_accounts = address_lookup_table_accounts or []
+    if optimize_lookup_tables and active_address_lookup_table_accounts:
+        active_address_lookup_table_accounts = compiled_keys.select_lookup_tables(
+            active_address_lookup_table_accounts
+        )
     # Iterate over a copy of items if modifying the dict during iteration
     for lookup_table in active_address_lookup_table_accounts:
         extract_result = compiled_keys.extract_table_lookup(lookup_table)
@@ -84,8 +123,21 @@ def compile_to_wrapped_message_v0(
     )
 
 
+def select_address_lookup_tables(
+    payer_key: Pubkey,
+    instructions: Sequence[Instruction],
+    address_lookup_table_accounts: Sequence[AddressLookupTableAccount],
+) -> list[AddressLookupTableAccount]:
+    """
+    Reports which lookup tables `compile_to_wrapped_message_v0` would use
+    with `optimize_lookup_tables=True`, in the order it drains them.
+    """
+    compiled_keys = CompiledKeys.compile(instructions, payer_key)
+    return compiled_keys.select_lookup_tables(address_lookup_table_accounts)
+
+
 def is_static_writable_index(
-    message: VaultTransactionMessage,
+    message: VaultTransactionMessage | VaultTransactionMessageView,
     index: int,
 ) -> bool:
     num_acc_keys = len(message.account_keys)
@@ -110,7 +162,9 @@ def is_static_writable_index(
     return False
 
 
-def is_signer_index(message: VaultTransactionMessage, index: int) -> bool:
+def is_signer_index(
+    message: VaultTransactionMessage | VaultTransactionMessageView, index: int
+) -> bool:
     return index < message.num_signers
 
 
@@ -119,98 +173,73 @@ def transaction_message_to_multisig_transaction_message_bytes(
     transaction_recent_blockhash: Hash,
     transaction_instructions: list[Instruction],
     address_lookup_table_accounts: list[AddressLookupTableAccount] | None,
+    optimize_lookup_tables: bool = False,
 ) -> bytes:
     compiled_message = compile_to_wrapped_message_v0(
         payer_key=transaction_payer,
         recent_blockhash=transaction_recent_blockhash,
         instructions=transaction_instructions,
         address_lookup_table_accounts=address_lookup_table_accounts,
+        optimize_lookup_tables=optimize_lookup_tables,
     )
 
-    compiled_instructions = [
-        MultisigCompiledInstructionJSON(
-            program_id_index=ix.program_id_index,
-            account_indexes=list(ix.accounts),
-            data=list(ix.data),
-        )
-        for ix in compiled_message.instructions
-    ]
-
-    lut_table_lookups: list[MultisigMessageAddressTableLookupJSON] = []
-
-    for lut in compiled_message.address_table_lookups:
-        lut_table_lookups.append(
-            MultisigMessageAddressTableLookupJSON(
-                account_key=str(lut.account_key),
-                writable_indexes=list(lut.writable_indexes),
-                readonly_indexes=list(lut.readonly_indexes),
-            )
-        )
-
-    acc_keys = [str(key) for key in compiled_message.account_keys]
-
-    construct_dict = VaultTransactionMessageJSON(
-        num_signers=compiled_message.header.num_required_signatures,
-        num_writable_signers=compiled_message.header.num_required_signatures
-        - compiled_message.header.num_readonly_signed_accounts,
-        num_writable_non_signers=len(compiled_message.account_keys)
-        - compiled_message.header.num_required_signatures
-        - compiled_message.header.num_readonly_unsigned_accounts,
-        account_keys=acc_keys,
-        instructions=compiled_instructions,
-        address_table_lookups=lut_table_lookups,
-    )
-    tx_msg_construct = TransactionMessageConstruct.from_json(construct_dict)
-    tx_msg_bytes = tx_msg_construct.layout.build(tx_msg_construct.to_encodable())
-
-    return tx_msg_bytes
+    return encode_vault_transaction_message(compiled_message)
 
 
 async def _create_address_lookup_table_accounts(
-    connection: AsyncClient, address_lookup_table_keys: list[Pubkey]
+    connection: AsyncClient,
+    address_lookup_table_keys: list[Pubkey],
+    lookup_table_cache: AddressLookupTableCache | None = None,
+    min_lengths: dict[Pubkey, int] | None = None,
 ) -> dict[Pubkey, AddressLookupTableAccount]:
-    # Initialize an empty dictionary
-    lookup_tasks: list[tuple[Pubkey, AddressLookupTableAccount]] = []
-
-    # Process each key sequentially
-    for key in address_lookup_table_keys:
-        # Fetch the lookup table
-        response = await connection.get_account_info(key, encoding="jsonParsed")
-        value = response.value
-
-        # Check if the value exists
-        if not value:
-            raise ValueError(f"Address lookup table account {key} not found")
-
-        # Add to the dictionary
-        value_obj = AddressLookupTableAccount.from_bytes(value.data)
-        lookup_tasks.extend([(key, value_obj)])
+    if lookup_table_cache is not None:
+        return await lookup_table_cache.get_many(
+            connection, address_lookup_table_keys, min_lengths
+        )
 
-    return dict(lookup_tasks)
+    _, lookup_tables = await fetch_address_lookup_tables(
+        connection, address_lookup_table_keys
+    )
+    return {
+        key: AddressLookupTableAccount(key, lookup_table.addresses)
+        for key, lookup_table in lookup_tables.items()
+    }
 
 
 async def accounts_for_transaction_execute(
     connection: AsyncClient,
     transaction_pda: Pubkey,
     vault_pda: Pubkey,
-    message: VaultTransactionMessage,
+    message: VaultTransactionMessage | VaultTransactionMessageView,
     ephemeral_signer_bumps: Sequence[int],
     program_id: Pubkey | None,
+    lookup_table_cache: AddressLookupTableCache | None = None,
 ) -> tuple[list[AccountMeta], list[AddressLookupTableAccount]]:
-    ephemeral_signer_pdas = [
-        PDA.get_ephemeral_signer_pda(
+    # The bumps are stored on the transaction account, so each ephemeral
+    # signer is a single hash instead of a bump search.
+    ephemeral_signer_pdas = {
+        PDA.get_ephemeral_signer_pda_with_bump(
             transaction_pda=transaction_pda,
             ephemeral_signer_index=additional_signer_index,
+            bump=bump,
             program_id=program_id,
         )[0]
-        for additional_signer_index, _ in enumerate(ephemeral_signer_bumps)
-    ]
+        for additional_signer_index, bump in enumerate(ephemeral_signer_bumps)
+    }
 
     address_lookup_table_keys = [
         lookup.account_key for lookup in message.address_table_lookups
     ]
+    # Number of addresses each table must hold to resolve the message.
+    min_lengths = {
+        lookup.account_key: max(
+            [*lookup.writable_indexes, *lookup.readonly_indexes], default=-1
+        )
+        + 1
+        for lookup in message.address_table_lookups
+    }
     address_lookup_dict = await _create_address_lookup_table_accounts(
-        connection, address_lookup_table_keys
+        connection, address_lookup_table_keys, lookup_table_cache, min_lengths
     )
 
     # Populate account metas required for execution of the transaction.
@@ -224,7 +253,7 @@ async def accounts_for_transaction_execute(
 
     # Then add static account keys included into the message.
     for index, key in enumerate(message.account_keys):
-        is_ephemeral_signer = any(key == k for k in ephemeral_signer_pdas)
+        is_ephemeral_signer = key in ephemeral_signer_pdas
 
         pubkey = key
         # vaultPda and ephemeralSignerPdas cannot be marked as signers,
@@ -260,7 +289,7 @@ async def accounts_for_transaction_execute(
                 lookup_account.key,
             )
 
-            meta = AccountMeta(pubkey, True, False)
+            meta = AccountMeta(pubkey, is_signer=False, is_writable=True)
             account_metas.extend([meta])
 
         for idx in lookup.readonly_indexes:
@@ -0,0 +1,212 @@
+from functools import cached_property
+
+from anchorpy.coder.accounts import ACCOUNT_DISCRIMINATOR_SIZE
+from anchorpy.error import AccountInvalidDiscriminator
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solders.pubkey import Pubkey
+
+from ..generated.accounts.vault_transaction import VaultTransaction
+from ..generated.program_id import PROGRAM_ID
+
+PUBKEY_SIZE = 32
+VEC_LEN_SIZE = 4
+
+
+def _read_u32(data: memoryview, offset: int) -> int:
+    return int.from_bytes(data[offset : offset + 4], "little")
+
+
+def _read_pubkey(data: memoryview, offset: int) -> Pubkey:
+    return Pubkey.from_bytes(bytes(data[offset : offset + PUBKEY_SIZE]))
+
+
+class CompiledInstructionView:
+    """Lazy counterpart of `MultisigCompiledInstruction`."""
+
+    def __init__(self, data: memoryview, offset: int):
+        self._data = data
+        self._offset = offset
+        self.program_id_index: int = data[offset]
+
+        accounts_len = _read_u32(data, offset + 1)
+        accounts_start = offset + 1 + VEC_LEN_SIZE
+        data_len_offset = accounts_start + accounts_len
+        data_len = _read_u32(data, data_len_offset)
+        data_start = data_len_offset + VEC_LEN_SIZE
+
+        self.account_indexes: memoryview = data[
+            accounts_start : accounts_start + accounts_len
+        ]
+        self.data: memoryview = data[data_start : data_start + data_len]
+        self.end: int = data_start + data_len
+
+
+class MessageAddressTableLookupView:
+    """Lazy counterpart of `MultisigMessageAddressTableLookup`."""
+
+    def __init__(self, data: memoryview, offset: int):
+        self._data = data
+        self._offset = offset
+
+        writable_len_offset = offset + PUBKEY_SIZE
+        writable_len = _read_u32(data, writable_len_offset)
+        writable_start = writable_len_offset + VEC_LEN_SIZE
+        readonly_len_offset = writable_start + writable_len
+        readonly_len = _read_u32(data, readonly_len_offset)
+        readonly_start = readonly_len_offset + VEC_LEN_SIZE
+
+        self.writable_indexes: memoryview = data[
+            writable_start : writable_start + writable_len
+        ]
+        self.readonly_indexes: memoryview = data[
+            readonly_start : readonly_start + readonly_len
+        ]
+        self.end: int = readonly_start + readonly_len
+
+    @cached_property
+    def account_key(self) -> Pubkey:
+        return _read_pubkey(self._data, self._offset)
+
+
+class VaultTransactionMessageView:
+    """
+    Lazy counterpart of `VaultTransactionMessage`.
+
+    Sections are located and decoded on first access; instruction data and
+    lookup indexes are zero-copy slices of the account data.
+    """
+
+    def __init__(self, data: memoryview, offset: int):
+        self._data = data
+        self._offset = offset
+        self.num_signers: int = data[offset]
+        self.num_writable_signers: int = data[offset + 1]
+        self.num_writable_non_signers: int = data[offset + 2]
+
+    @property
+    def _account_keys_offset(self) -> int:
+        return self._offset + 3
+
+    @cached_property
+    def num_account_keys(self) -> int:
+        return _read_u32(self._data, self._account_keys_offset)
+
+    @cached_property
+    def account_keys(self) -> list[Pubkey]:
+        start = self._account_keys_offset + VEC_LEN_SIZE
+        return [
+            _read_pubkey(self._data, start + i * PUBKEY_SIZE)
+            for i in range(self.num_account_keys)
+        ]
+
+    @cached_property
+    def _instructions_offset(self) -> int:
+        return (
+            self._account_keys_offset
+            + VEC_LEN_SIZE
+            + self.num_account_keys * PUBKEY_SIZE
+        )
+
+    @cached_property
+    def instructions(self) -> list[CompiledInstructionView]:
+        count = _read_u32(self._data, self._instructions_offset)
+        offset = self._instructions_offset + VEC_LEN_SIZE
+        instructions: list[CompiledInstructionView] = []
+        for _ in range(count):
+            instruction = CompiledInstructionView(self._data, offset)
+            instructions.append(instruction)
+            offset = instruction.end
+        return instructions
+
+    @cached_property
+    def _address_table_lookups_offset(self) -> int:
+        instructions = self.instructions
+        if instructions:
+            return instructions[-1].end
+        return self._instructions_offset + VEC_LEN_SIZE
+
+    @cached_property
+    def address_table_lookups(self) -> list[MessageAddressTableLookupView]:
+        count = _read_u32(self._data, self._address_table_lookups_offset)
+        offset = self._address_table_lookups_offset + VEC_LEN_SIZE
+        lookups: list[MessageAddressTableLookupView] = []
+        for _ in range(count):
+            lookup = MessageAddressTableLookupView(self._data, offset)
+            lookups.append(lookup)
+            offset = lookup.end
+        return lookups
+
+
+class VaultTransactionView:
+    """
+    Read-only, lazily decoded `VaultTransaction`.
+
+    Exposes the same attributes as the generated dataclass, but only decodes
+    a field when it is accessed, so callers that need e.g. `vault_index` and
+    `ephemeral_signer_bumps` never pay for parsing the instructions.
+    """
+
+    discriminator = VaultTransaction.discriminator
+
+    def __init__(self, data: bytes | memoryview):
+        view = memoryview(data)
+        if view[:ACCOUNT_DISCRIMINATOR_SIZE].tobytes() != self.discriminator:
+            raise AccountInvalidDiscriminator(
+                "The discriminator for this account is invalid"
+            )
+        self._data = view
+        self.bump: int = view[80]
+        self.vault_index: int = view[81]
+        self.vault_bump: int = view[82]
+
+    @classmethod
+    async def fetch(
+        cls,
+        conn: AsyncClient,
+        address: Pubkey,
+        commitment: Commitment | None = None,
+        program_id: Pubkey = PROGRAM_ID,
+    ) -> "VaultTransactionView | None":
+        resp = await conn.get_account_info(address, commitment=commitment)
+        info = resp.value
+        if info is None:
+            return None
+        if info.owner != program_id:
+            raise ValueError("Account does not belong to this program")
+        return cls(info.data)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "VaultTransactionView":
+        return cls(data)
+
+    @cached_property
+    def multisig(self) -> Pubkey:
+        return _read_pubkey(self._data, 8)
+
+    @cached_property
+    def creator(self) -> Pubkey:
+        return _read_pubkey(self._data, 40)
+
+    @cached_property
+    def index(self) -> int:
+        return int.from_bytes(self._data[72:80], "little")
+
+    @cached_property
+    def _ephemeral_signer_bumps_len(self) -> int:
+        return _read_u32(self._data, 83)
+
+    @cached_property
+    def ephemeral_signer_bumps(self) -> bytes:
+        start = 83 + VEC_LEN_SIZE
+        return bytes(self._data[start : start + self._ephemeral_signer_bumps_len])
+
+    @cached_property
+    def message(self) -> VaultTransactionMessageView:
+        return VaultTransactionMessageView(
+            self._data, 83 + VEC_LEN_SIZE + self._ephemeral_signer_bumps_len
+        )
+
+    def to_vault_transaction(self) -> VaultTransaction:
+        """Fully decodes the account into the generated dataclass."""
+        return VaultTransaction.decode(bytes(self._data))
@@ -1,3 +1,6 @@
+from .batch_add_transaction_many import batch_add_transaction_many
+from .batch_create import batch_create
+from .batch_execute import batch_execute
 from .config_transaction_create import config_transaction_create
 from .config_transaction_execute import config_transaction_execute
 from .multisig_add_member import multisig_add_member
@@ -9,14 +12,20 @@ from .multisig_remove_spending_limit import multisig_remove_spending_limit
 from .multisig_set_config_authority import multisig_set_config_authority
 from .proposal_activate import proposal_activate
 from .proposal_approve import proposal_approve
+from .proposal_approve_many import proposal_approve_many
 from .proposal_cancel_v2 import proposal_cancel_v2
 from .proposal_create import proposal_create
 from .proposal_reject import proposal_reject
 from .spending_limit_use import spending_limit_use
+from .transaction_buffer_upload import transaction_buffer_upload
 from .vault_transaction_create import vault_transaction_create
+from .vault_transaction_create_from_buffer import vault_transaction_create_from_buffer
 from .vault_transaction_execute import vault_transaction_execute
 
 __all__ = [
+    "batch_add_transaction_many",
+    "batch_create",
+    "batch_execute",
     "config_transaction_create",
     "config_transaction_execute",
     "multisig_add_member",
@@ -28,10 +37,13 @@ __all__ = [
     "multisig_set_config_authority",
     "proposal_activate",
     "proposal_approve",
+    "proposal_approve_many",
     "proposal_cancel_v2",
     "proposal_create",
     "proposal_reject",
     "spending_limit_use",
+    "transaction_buffer_upload",
     "vault_transaction_create",
+    "vault_transaction_create_from_buffer",
     "vault_transaction_execute",
 ]
@@ -0,0 +1,140 @@
+from typing import Annotated
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.types import TxOpts
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import Signer, VersionedTransaction
+
+from .._internal.utils import get_recent_blockhash, send_and_confirm_transaction
+from ..accounts import PDA, Batch
+from ..generated.program_id import PROGRAM_ID
+from ..transactions import batch_add_transaction_many as create_transactions
+
+
+class BatchAddTransactionError(Exception):
+    """
+    Raised when a transaction of `batch_add_transaction_many` fails after
+    earlier ones landed. The cause is chained as `__cause__`.
+    """
+
+    def __init__(self, transaction_indexes: list[int], signatures: list[Signature]):
+        super().__init__(
+            f"Adding to the batch failed after {len(transaction_indexes)} "
+            "transactions were added"
+        )
+        self.transaction_indexes = transaction_indexes
+        """Batch transaction indexes that were added before the failure."""
+        self.signatures = signatures
+        """Signatures of the confirmed transactions that added them."""
+
+
+async def batch_add_transaction_many(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    member: Annotated[Signer, "Creator of the batch"],
+    transaction_payer: Annotated[Pubkey, "Payer of the transactions for the multisig"],
+    transactions: Annotated[
+        list[list[Instruction]], "Instructions of every transaction to add"
+    ],
+    ephemeral_signers: int = 0,
+    address_lookup_table_accounts: list[AddressLookupTableAccount] | None = None,
+    rent_payer: Annotated[Signer | None, "If not provided, `member` is used"] = None,
+    send_options: TxOpts | None = None,
+    commitment: Commitment = Confirmed,
+    program_id: Pubkey = PROGRAM_ID,
+    optimize_lookup_tables: bool = False,
+) -> list[Signature]:
+    """
+    Append `transactions` to the batch, packing several additions into each
+    transaction.
+
+    Indexes are assigned by the program in arrival order, so the packed
+    transactions are sent one after another, each confirmed before the
+    next. Numbering continues after the batch's current size, so a failed
+    call can be retried with the transactions that were not added yet.
+
+    Returns the signature of every sent transaction. If a transaction fails
+    after earlier ones landed, raises `BatchAddTransactionError` with the
+    batch transaction indexes that were already added.
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(batch_index, int)
+    assert isinstance(member, Signer)
+    assert isinstance(transaction_payer, Pubkey)
+    assert isinstance(transactions, list)
+    assert isinstance(ephemeral_signers, int)
+    assert (
+        isinstance(address_lookup_table_accounts, list)
+        or address_lookup_table_accounts is None
+    )
+    assert isinstance(rent_payer, Signer) or rent_payer is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey)
+    assert isinstance(optimize_lookup_tables, bool)
+
+    batch_pda = PDA.get_transaction_pda(multisig_pda, batch_index, program_id)[0]
+    batch = await Batch.fetch(connection, batch_pda, commitment, program_id)
+    assert batch is not None, "Batch account not found"
+
+    txs = create_transactions(
+        await get_recent_blockhash(connection),
+        fee_payer,
+        multisig_pda,
+        batch_index,
+        batch.size + 1,
+        member,
+        rent_payer,
+        ephemeral_signers,
+        transaction_payer,
+        transactions,
+        address_lookup_table_accounts,
+        program_id,
+        optimize_lookup_tables,
+    )
+
+    signers_list = list({fee_payer, member, rent_payer or member})
+    signatures: list[Signature] = []
+    added: list[int] = []
+    for i, (tx, positions) in enumerate(txs):
+        try:
+            if i > 0:
+                # Sending is sequential, so refresh the blockhash of later
+                # transactions instead of letting a long batch expire.
+                tx = _with_blockhash(
+                    tx, await get_recent_blockhash(connection), signers_list
+                )
+            signature = await send_and_confirm_transaction(
+                connection, tx, send_options, commitment
+            )
+        except Exception as e:
+            if not added:
+                raise
+            raise BatchAddTransactionError(added, signatures) from e
+        signatures.append(signature)
+        added.extend(batch.size + 1 + position for position in positions)
+    return signatures
+
+
+def _with_blockhash(
+    tx: VersionedTransaction, blockhash: Hash, signers: list[Signer]
+) -> VersionedTransaction:
+    message = tx.message
+    assert isinstance(message, MessageV0)
+    message_v0 = MessageV0(
+        message.header,
+        message.account_keys,
+        blockhash,
+        message.instructions,
+        message.address_table_lookups,
+    )
+    return VersionedTransaction(message_v0, signers)
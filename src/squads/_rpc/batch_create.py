@@ -0,0 +1,53 @@
+from typing import Annotated
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.types import TxOpts
+from solders.pubkey import Pubkey
+from solders.rpc.responses import SendTransactionResp
+from solders.transaction import Signer
+
+from .._internal.utils import get_recent_blockhash
+from ..generated.program_id import PROGRAM_ID
+from ..transactions import batch_create as create_transaction
+
+
+async def batch_create(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    batch_index: Annotated[int, "Next transaction index of the multisig"],
+    creator: Annotated[Signer, "Member of multisig creating the batch"],
+    vault_index: int,
+    rent_payer: Annotated[Signer | None, "If not provided, `creator` is used"] = None,
+    memo: str | None = None,
+    send_options: TxOpts | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+) -> SendTransactionResp:
+    """Create a batch. Its draft proposal is created with `proposal_create`."""
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(batch_index, int)
+    assert isinstance(creator, Signer)
+    assert isinstance(vault_index, int)
+    assert isinstance(rent_payer, Signer) or rent_payer is None
+    assert isinstance(memo, str) or memo is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey)
+
+    tx = create_transaction(
+        await get_recent_blockhash(connection),
+        fee_payer,
+        multisig_pda,
+        batch_index,
+        creator,
+        rent_payer,
+        vault_index,
+        memo,
+        program_id,
+    )
+
+    try:
+        return await connection.send_transaction(tx, send_options)
+    except Exception as e:
+        raise e from None
@@ -0,0 +1,201 @@
+from collections.abc import AsyncIterator, Sequence
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.types import TxOpts
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import Signer, VersionedTransaction
+
+from .._internal.contants import (
+    DEFAULT_INSTRUCTION_COMPUTE_UNIT_LIMIT,
+    MAX_COMPUTE_UNIT_LIMIT,
+    MAX_TX_ACCOUNT_LOCKS,
+)
+from .._internal.fetch import get_multiple_accounts_chunked
+from .._internal.lookup_table_cache import AddressLookupTableCache
+from .._internal.packing import pack_instructions
+from .._internal.utils import get_recent_blockhash, send_and_confirm_transaction
+from ..accounts import PDA, Batch
+from ..generated.accounts.vault_batch_transaction import VaultBatchTransaction
+from ..generated.program_id import PROGRAM_ID
+from ..instructions import batch_execute_transaction as create_instruction
+
+# Up to this many executions share a transaction without any of them getting
+# less than the compute budget it would have in a transaction of its own.
+MAX_EXECUTIONS_PER_TRANSACTION = (
+    MAX_COMPUTE_UNIT_LIMIT // DEFAULT_INSTRUCTION_COMPUTE_UNIT_LIMIT
+)
+
+
+async def batch_execute(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    member: Signer,
+    signers: Sequence[Signer] | None = None,
+    send_options: TxOpts | None = None,
+    commitment: Commitment = Confirmed,
+    program_id: Pubkey = PROGRAM_ID,
+    lookup_table_cache: AddressLookupTableCache | None = None,
+    max_accounts: int = MAX_TX_ACCOUNT_LOCKS,
+    max_executions_per_transaction: int | None = MAX_EXECUTIONS_PER_TRANSACTION,
+) -> AsyncIterator[tuple[int, Signature]]:
+    """
+    Execute the remaining transactions of an approved batch, in order.
+
+    Starts after the batch's `executed_transaction_index`, so an interrupted
+    run resumes where it stopped. Every transaction is confirmed before the
+    next is sent. Yields `(transaction_index, signature)` as each batch
+    transaction is executed.
+
+    Consecutive executions are packed into one transaction when they fit.
+    Each execution loads every account of its vault transaction, so besides
+    the size limit a transaction loads at most `max_accounts` unique
+    accounts. `max_executions_per_transaction` further caps the executions
+    per transaction. The compute limit of a transaction grows with its
+    instruction count only up to a cap, so the default is the largest count
+    that still leaves every execution its stand-alone budget; `None` packs
+    executions regardless of compute.
+
+    Usage:
+        async for transaction_index, signature in batch_execute(...):
+            ...
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(batch_index, int)
+    assert isinstance(member, Signer)
+    assert isinstance(signers, Sequence) or signers is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey)
+    assert isinstance(max_accounts, int)
+    assert (
+        isinstance(max_executions_per_transaction, int)
+        or max_executions_per_transaction is None
+    )
+    assert (
+        isinstance(lookup_table_cache, AddressLookupTableCache)
+        or lookup_table_cache is None
+    )
+
+    batch_pda = PDA.get_transaction_pda(multisig_pda, batch_index, program_id)[0]
+    batch = await Batch.fetch(connection, batch_pda, commitment, program_id)
+    assert batch is not None, "Batch account not found"
+
+    transaction_indexes = range(batch.executed_transaction_index + 1, batch.size + 1)
+    if not transaction_indexes:
+        return
+
+    batch_transactions = await _fetch_batch_transactions(
+        connection,
+        multisig_pda,
+        batch_index,
+        transaction_indexes,
+        commitment,
+        program_id,
+    )
+    if lookup_table_cache is None:
+        lookup_table_cache = AddressLookupTableCache()
+    await _prefetch_lookup_tables(
+        connection, batch_transactions, lookup_table_cache, commitment
+    )
+
+    ixs: list[Instruction] = []
+    lookup_table_accounts: dict[Pubkey, AddressLookupTableAccount] = {}
+    for transaction_index, batch_transaction in zip(
+        transaction_indexes, batch_transactions, strict=True
+    ):
+        ix, ix_lookup_table_accounts = await create_instruction(
+            connection,
+            multisig_pda,
+            batch_index,
+            transaction_index,
+            member.pubkey(),
+            program_id,
+            lookup_table_cache,
+            batch,
+            batch_transaction,
+        )
+        ixs.append(ix)
+        for lookup_table_account in ix_lookup_table_accounts:
+            lookup_table_accounts[lookup_table_account.key] = lookup_table_account
+
+    signers_list = [fee_payer, member]
+    if signers is not None:
+        signers_list.extend(signers)
+    signers_list = list(set(signers_list))
+
+    for group in pack_instructions(
+        fee_payer.pubkey(),
+        ixs,
+        list(lookup_table_accounts.values()),
+        max_accounts=max_accounts,
+        max_instructions=max_executions_per_transaction,
+    ):
+        message_v0 = MessageV0.try_compile(
+            fee_payer.pubkey(),
+            ixs[group.start : group.stop],
+            list(lookup_table_accounts.values()),
+            await get_recent_blockhash(connection),
+        )
+        signature = await send_and_confirm_transaction(
+            connection,
+            VersionedTransaction(message_v0, signers_list),
+            send_options,
+            commitment,
+        )
+        for i in group:
+            yield transaction_indexes[i], signature
+
+
+async def _fetch_batch_transactions(
+    connection: AsyncClient,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    transaction_indexes: range,
+    commitment: Commitment,
+    program_id: Pubkey,
+) -> list[VaultBatchTransaction]:
+    _, accounts = await get_multiple_accounts_chunked(
+        connection,
+        [
+            PDA.get_batch_transaction_pda(multisig_pda, batch_index, i, program_id)[0]
+            for i in transaction_indexes
+        ],
+        commitment=commitment,
+    )
+    batch_transactions: list[VaultBatchTransaction] = []
+    for account in accounts:
+        assert account is not None, "Batch transaction account not found"
+        if account.owner != program_id:
+            raise ValueError("Account does not belong to this program")
+        batch_transactions.append(VaultBatchTransaction.decode(account.data))
+    return batch_transactions
+
+
+async def _prefetch_lookup_tables(
+    connection: AsyncClient,
+    batch_transactions: list[VaultBatchTransaction],
+    lookup_table_cache: AddressLookupTableCache,
+    commitment: Commitment,
+) -> None:
+    # Fetch every lookup table the batch needs in one round trip, so that
+    # building the instructions is served from the cache.
+    min_lengths: dict[Pubkey, int] = {}
+    for batch_transaction in batch_transactions:
+        for lookup in batch_transaction.message.address_table_lookups:
+            min_lengths[lookup.account_key] = max(
+                min_lengths.get(lookup.account_key, 0),
+                max([*lookup.writable_indexes, *lookup.readonly_indexes], default=-1)
+                + 1,
+            )
+    if min_lengths:
+        await lookup_table_cache.get_many(
+            connection, list(min_lengths), min_lengths, commitment
+        )
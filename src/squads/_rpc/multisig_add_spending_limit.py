@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey
 from solders.rpc.responses import SendTransactionResp
 from solders.transaction import Signer
 
+from .._internal.utils import get_recent_blockhash
 from ..generated.program_id import PROGRAM_ID
 from ..generated.types.period import PeriodKind
 from ..transactions import multisig_add_spending_limit as create_transaction
@@ -48,10 +49,8 @@ async def multisig_add_spending_limit(
     assert isinstance(send_options, TxOpts) or send_options is None
     assert isinstance(program_id, Pubkey)
 
-    blockhash = (await connection.get_latest_blockhash()).value.blockhash
-
     tx = create_transaction(
-        blockhash,
+        await get_recent_blockhash(connection),
         fee_payer,
         multisig_pda,
         config_authority,
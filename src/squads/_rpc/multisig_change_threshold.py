@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey
 from solders.rpc.responses import SendTransactionResp
 from solders.transaction import Signer
 
+from .._internal.utils import get_recent_blockhash
 from ..transactions import multisig_change_threshold as create_transaction
 
 
@@ -36,10 +37,8 @@ async def multisig_change_threshold(
     except AssertionError:
         raise ValueError("Invalid argument") from None
 
-    blockhash = (await connection.get_latest_blockhash()).value.blockhash
-
     tx = create_transaction(
-        blockhash,
+        await get_recent_blockhash(connection),
         fee_payer.pubkey(),
         multisig_pda,
         config_authority,
@@ -0,0 +1,234 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from anchorpy.error import ProgramError
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.core import RPCException
+from solana.rpc.types import TxOpts
+from solders.account import Account
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import Signer, VersionedTransaction
+
+from .._internal.fetch import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    get_multiple_accounts_chunked,
+)
+from .._internal.member_index import MemberIndex
+from .._internal.preflight import predict_proposal_approve
+from .._internal.utils import get_recent_blockhash, send_and_confirm_transaction
+from ..accounts import PDA
+from ..generated import errors
+from ..generated.accounts.multisig import Multisig
+from ..generated.accounts.proposal import Proposal
+from ..generated.program_id import PROGRAM_ID
+from ..transactions import proposal_approve_many as create_transactions
+
+
+@dataclass
+class ProposalApproveOutcome:
+    multisig_pda: Pubkey
+    transaction_index: int
+    signature: Signature | None = None
+    """Signature of the confirmed transaction that carried the approval."""
+    error: Exception | None = None
+    """Why the approval was skipped or failed, e.g. a program error."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.signature is not None
+
+
+async def proposal_approve_many(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    member: Signer,
+    proposals: list[tuple[Pubkey, int]],
+    memo: str | None = None,
+    send_options: TxOpts | None = None,
+    program_id: Pubkey | None = PROGRAM_ID,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    commitment: Commitment = Confirmed,
+    preflight: bool = True,
+) -> list[ProposalApproveOutcome]:
+    """
+    Approve many proposals, packing as many approvals as fit into each
+    transaction and sending up to `max_concurrency` transactions at once.
+
+    With `preflight`, the multisigs and proposals are fetched in bulk first,
+    and approvals the program would reject (not a member, already approved,
+    not active, stale, ...) are reported without being sent, so they don't
+    fail the approvals packed with them.
+
+    Every transaction is confirmed at `commitment`. A transaction that fails
+    in simulation or on chain applies none of its approvals, so they are
+    split in halves and retried until the failing ones are isolated.
+
+    Returns one outcome per (multisig_pda, transaction_index) pair, in input
+    order. An outcome is only `ok` once its transaction is confirmed; errors
+    are reported on the outcomes instead of being raised.
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(member, Signer)
+    assert isinstance(proposals, list)
+    assert isinstance(memo, str) or memo is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey) or program_id is None
+    assert isinstance(max_concurrency, int) and max_concurrency > 0
+
+    outcomes = [
+        ProposalApproveOutcome(multisig_pda, transaction_index)
+        for multisig_pda, transaction_index in proposals
+    ]
+    pending = list(range(len(proposals)))
+    if preflight:
+        pending = await _preflight(
+            connection,
+            member.pubkey(),
+            proposals,
+            outcomes,
+            program_id or PROGRAM_ID,
+            commitment,
+        )
+    if pending:
+        await _BulkApprover(
+            connection,
+            fee_payer,
+            member,
+            proposals,
+            outcomes,
+            memo,
+            send_options,
+            program_id,
+            max_concurrency,
+            commitment,
+        ).approve(pending)
+    return outcomes
+
+
+class _BulkApprover:
+    def __init__(
+        self,
+        connection: AsyncClient,
+        fee_payer: Signer,
+        member: Signer,
+        proposals: Sequence[tuple[Pubkey, int]],
+        outcomes: list[ProposalApproveOutcome],
+        memo: str | None,
+        send_options: TxOpts | None,
+        program_id: Pubkey | None,
+        max_concurrency: int,
+        commitment: Commitment,
+    ):
+        self.connection = connection
+        self.fee_payer = fee_payer
+        self.member = member
+        self.proposals = proposals
+        self.outcomes = outcomes
+        self.memo = memo
+        self.send_options = send_options
+        self.program_id = program_id
+        self.commitment = commitment
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def approve(self, indexes: list[int]) -> None:
+        """Approves the proposals at `indexes`, packed into few transactions."""
+        txs = create_transactions(
+            await get_recent_blockhash(self.connection),
+            self.fee_payer,
+            [self.proposals[i] for i in indexes],
+            self.member,
+            self.memo,
+            self.program_id,
+        )
+        await asyncio.gather(
+            *(self.send(tx, [indexes[i] for i in group]) for tx, group in txs)
+        )
+
+    async def send(self, tx: VersionedTransaction, indexes: list[int]) -> None:
+        try:
+            async with self.semaphore:
+                signature = await send_and_confirm_transaction(
+                    self.connection, tx, self.send_options, self.commitment
+                )
+        except (ProgramError, RPCException) as e:
+            # The transaction did not apply, so its approvals can be retried
+            if len(indexes) > 1:
+                middle = len(indexes) // 2
+                await asyncio.gather(
+                    self.approve(indexes[:middle]), self.approve(indexes[middle:])
+                )
+                return
+            error: Exception = e
+            if isinstance(e, RPCException):
+                error = errors.from_tx_error(e) or e
+            self.outcomes[indexes[0]].error = error
+            return
+        except Exception as e:
+            for i in indexes:
+                self.outcomes[i].error = e
+            return
+        for i in indexes:
+            self.outcomes[i].signature = signature
+
+
+async def _preflight(
+    connection: AsyncClient,
+    member: Pubkey,
+    proposals: Sequence[tuple[Pubkey, int]],
+    outcomes: list[ProposalApproveOutcome],
+    program_id: Pubkey,
+    commitment: Commitment,
+) -> list[int]:
+    """
+    Records the predicted failure of every approval on its outcome and
+    returns the positions of the approvals worth sending.
+    """
+    multisig_pdas = list(dict.fromkeys(multisig_pda for multisig_pda, _ in proposals))
+    proposal_pdas = [
+        PDA.get_proposal_pda(multisig_pda, transaction_index, program_id)[0]
+        for multisig_pda, transaction_index in proposals
+    ]
+    _, accounts = await get_multiple_accounts_chunked(
+        connection, [*multisig_pdas, *proposal_pdas], commitment
+    )
+    multisigs: dict[Pubkey, tuple[Multisig, MemberIndex] | None] = {}
+    for multisig_pda, account in zip(multisig_pdas, accounts, strict=False):
+        multisig = _decode(Multisig, account, program_id)
+        multisigs[multisig_pda] = (
+            (multisig, MemberIndex.from_multisig(multisig)) if multisig else None
+        )
+
+    pending: list[int] = []
+    proposal_accounts = accounts[len(multisig_pdas) :]
+    for i, ((multisig_pda, _), account) in enumerate(
+        zip(proposals, proposal_accounts, strict=True)
+    ):
+        decoded = multisigs[multisig_pda]
+        proposal = _decode(Proposal, account, program_id)
+        if decoded is None:
+            outcomes[i].error = ValueError("Multisig account not found")
+        elif proposal is None:
+            outcomes[i].error = ValueError("Proposal account not found")
+        else:
+            multisig, member_index = decoded
+            outcomes[i].error = predict_proposal_approve(
+                multisig, proposal, member, member_index
+            )
+        if outcomes[i].error is None:
+            pending.append(i)
+    return pending
+
+
+def _decode[T: (Multisig, Proposal)](
+    account_class: type[T], account: Account | None, program_id: Pubkey
+) -> T | None:
+    if account is None or account.owner != program_id:
+        return None
+    try:
+        return account_class.decode(account.data)
+    except Exception:
+        return None
@@ -0,0 +1,149 @@
+import hashlib
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.types import TxOpts
+from solders.pubkey import Pubkey
+from solders.transaction import Signer
+
+from .._internal.contants import MAX_TRANSACTION_BUFFER_SIZE
+from .._internal.packing import max_appendable_data
+from .._internal.utils import get_recent_blockhash, send_and_confirm_transaction
+from ..accounts import PDA, TransactionBuffer
+from ..generated.program_id import PROGRAM_ID
+from ..instructions import transaction_buffer_create as create_instruction
+from ..instructions import transaction_buffer_extend as extend_instruction
+from ..transactions import transaction_buffer_create as create_transaction
+from ..transactions import transaction_buffer_extend as extend_transaction
+
+
+def _check_buffer(
+    transaction_buffer: TransactionBuffer,
+    vault_index: int,
+    final_buffer_hash: bytes,
+    transaction_message: bytes,
+) -> None:
+    if (
+        transaction_buffer.vault_index != vault_index
+        or bytes(transaction_buffer.final_buffer_hash) != final_buffer_hash
+        or transaction_buffer.final_buffer_size != len(transaction_message)
+        or not transaction_message.startswith(transaction_buffer.buffer)
+    ):
+        raise ValueError("Transaction buffer holds a different transaction message")
+
+
+async def transaction_buffer_upload(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    creator: Signer,
+    buffer_index: int,
+    vault_index: int,
+    transaction_message: bytes,
+    rent_payer: Signer | None = None,
+    send_options: TxOpts | None = None,
+    commitment: Commitment = Confirmed,
+    program_id: Pubkey = PROGRAM_ID,
+) -> TransactionBuffer:
+    """
+    Uploads an encoded vault transaction message into the creator's
+    transaction buffer `buffer_index`, in as few transactions as possible.
+
+    `transaction_buffer_create` carries the first chunk and every
+    `transaction_buffer_extend` the largest chunk that still fits in a
+    transaction. The program appends chunks in arrival order, so each one is
+    confirmed before the next is sent.
+
+    If the buffer already exists with a prefix of the same message (e.g. an
+    earlier upload failed halfway), the upload resumes after that prefix.
+    Returns the verified on-chain buffer.
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(creator, Signer)
+    assert isinstance(buffer_index, int)
+    assert isinstance(vault_index, int)
+    assert isinstance(transaction_message, bytes)
+    assert isinstance(rent_payer, Signer) or rent_payer is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey)
+
+    final_buffer_size = len(transaction_message)
+    if not 0 < final_buffer_size <= MAX_TRANSACTION_BUFFER_SIZE:
+        raise ValueError(
+            f"Transaction message size {final_buffer_size} is not within "
+            f"1..{MAX_TRANSACTION_BUFFER_SIZE} bytes"
+        )
+    final_buffer_hash = hashlib.sha256(transaction_message).digest()
+
+    transaction_buffer_pda = PDA.get_transaction_buffer_pda(
+        multisig_pda, creator.pubkey(), buffer_index, program_id
+    )[0]
+
+    transaction_buffer = await TransactionBuffer.fetch(
+        connection, transaction_buffer_pda, commitment, program_id
+    )
+    if transaction_buffer is None:
+        first_chunk_size = max_appendable_data(
+            fee_payer.pubkey(),
+            create_instruction(
+                multisig_pda,
+                creator.pubkey(),
+                rent_payer.pubkey() if rent_payer else None,
+                buffer_index,
+                vault_index,
+                final_buffer_hash,
+                final_buffer_size,
+                b"",
+                program_id,
+            ),
+        )
+        offset = min(first_chunk_size, final_buffer_size)
+        tx = create_transaction(
+            await get_recent_blockhash(connection),
+            fee_payer,
+            multisig_pda,
+            creator,
+            rent_payer,
+            buffer_index,
+            vault_index,
+            final_buffer_hash,
+            final_buffer_size,
+            transaction_message[:offset],
+            program_id,
+        )
+        await send_and_confirm_transaction(connection, tx, send_options, commitment)
+    else:
+        _check_buffer(
+            transaction_buffer, vault_index, final_buffer_hash, transaction_message
+        )
+        offset = len(transaction_buffer.buffer)
+
+    chunk_size = max_appendable_data(
+        fee_payer.pubkey(),
+        extend_instruction(
+            multisig_pda, creator.pubkey(), buffer_index, b"", program_id
+        ),
+    )
+    while offset < final_buffer_size:
+        chunk = transaction_message[offset : offset + chunk_size]
+        tx = extend_transaction(
+            await get_recent_blockhash(connection),
+            fee_payer,
+            multisig_pda,
+            creator,
+            buffer_index,
+            chunk,
+            program_id,
+        )
+        await send_and_confirm_transaction(connection, tx, send_options, commitment)
+        offset += len(chunk)
+
+    transaction_buffer = await TransactionBuffer.fetch(
+        connection, transaction_buffer_pda, commitment, program_id
+    )
+    if transaction_buffer is None or transaction_buffer.buffer != transaction_message:
+        raise ValueError("Transaction buffer does not match the uploaded message")
+
+    return transaction_buffer
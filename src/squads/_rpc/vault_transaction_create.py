@@ -31,6 +31,9 @@ async def vault_transaction_create(
     signers: list[Signer] | None = None,
     send_options: TxOpts | None = None,
     program_id: Pubkey = PROGRAM_ID,
+    optimize_lookup_tables: Annotated[
+        bool, "Use the smallest useful set of lookup tables for the message"
+    ] = False,
 ) -> SendTransactionResp:
     """ """
     assert isinstance(connection, AsyncClient)
@@ -52,9 +55,12 @@ async def vault_transaction_create(
     assert isinstance(signers, list) or signers is None
     assert isinstance(send_options, TxOpts) or send_options is None
     assert isinstance(program_id, Pubkey)
+    assert isinstance(optimize_lookup_tables, bool)
 
+    # The outer transaction and the wrapped message share one blockhash
+    recent_blockhash = await get_recent_blockhash(connection)
     tx = create_transaction(
-        await get_recent_blockhash(connection),
+        recent_blockhash,
         fee_payer,
         multisig_pda,
         transaction_index,
@@ -63,12 +69,13 @@ async def vault_transaction_create(
         vault_index,
         ephemeral_signers,
         transaction_payer,
-        await get_recent_blockhash(connection),
+        recent_blockhash,
         transaction_instructions,
         address_lookup_table_accounts,
         memo,
         program_id,
         signers,
+        optimize_lookup_tables,
     )
     try:
         return await connection.send_transaction(tx, send_options)
@@ -0,0 +1,113 @@
+from typing import Annotated
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment, Confirmed
+from solana.rpc.types import TxOpts
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+from solders.rpc.responses import SendTransactionResp
+from solders.transaction import Signer
+
+from .._internal.utils import (
+    get_recent_blockhash,
+    transaction_message_to_multisig_transaction_message_bytes,
+)
+from ..generated.program_id import PROGRAM_ID
+from ..transactions import vault_transaction_create_from_buffer as create_transaction
+from .transaction_buffer_upload import transaction_buffer_upload
+
+
+async def vault_transaction_create_from_buffer(
+    connection: AsyncClient,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    transaction_index: int,
+    creator: Annotated[Signer, "Member of multisig creating the transaction"],
+    vault_index: int,
+    ephemeral_signers: Annotated[int, "Number of ephmeral signing PDA for txn"],
+    transaction_payer: Annotated[Pubkey, "Payer of the transaction for the multisig"],
+    transaction_instructions: Annotated[
+        list[Instruction], "Instructions of the transaction for the multisig"
+    ],
+    address_lookup_table_accounts: list[AddressLookupTableAccount] | None = None,
+    buffer_index: Annotated[int, "Creator's transaction buffer to upload to"] = 0,
+    rent_payer: Annotated[Signer | None, "If not provided, `creator` is used"] = None,
+    memo: str | None = None,
+    signers: list[Signer] | None = None,
+    send_options: TxOpts | None = None,
+    program_id: Pubkey = PROGRAM_ID,
+    optimize_lookup_tables: Annotated[
+        bool, "Use the smallest useful set of lookup tables for the message"
+    ] = False,
+    commitment: Annotated[
+        Commitment, "Commitment awaited for every buffer upload transaction"
+    ] = Confirmed,
+) -> SendTransactionResp:
+    """
+    Create a vault transaction whose message is too large for a single
+    `vault_transaction_create` by uploading it through a transaction buffer
+    first. A partially uploaded buffer for the same message is resumed.
+    """
+    assert isinstance(connection, AsyncClient)
+    assert isinstance(fee_payer, Signer)
+    assert isinstance(creator, Signer)
+    assert isinstance(rent_payer, Signer) or rent_payer is None
+    assert isinstance(multisig_pda, Pubkey)
+    assert isinstance(transaction_index, int)
+    assert isinstance(vault_index, int)
+    assert isinstance(ephemeral_signers, int)
+    assert isinstance(transaction_payer, Pubkey)
+    assert isinstance(transaction_instructions, list)
+    assert (
+        isinstance(address_lookup_table_accounts, list)
+        or address_lookup_table_accounts is None
+    )
+    assert isinstance(buffer_index, int)
+    assert isinstance(memo, str) or memo is None
+    assert isinstance(signers, list) or signers is None
+    assert isinstance(send_options, TxOpts) or send_options is None
+    assert isinstance(program_id, Pubkey)
+    assert isinstance(optimize_lookup_tables, bool)
+
+    recent_blockhash = await get_recent_blockhash(connection)
+    transaction_message = transaction_message_to_multisig_transaction_message_bytes(
+        transaction_payer,
+        recent_blockhash,
+        transaction_instructions,
+        address_lookup_table_accounts,
+        optimize_lookup_tables,
+    )
+
+    await transaction_buffer_upload(
+        connection,
+        fee_payer,
+        multisig_pda,
+        creator,
+        buffer_index,
+        vault_index,
+        transaction_message,
+        rent_payer,
+        send_options,
+        commitment,
+        program_id,
+    )
+
+    tx = create_transaction(
+        await get_recent_blockhash(connection),
+        fee_payer,
+        multisig_pda,
+        transaction_index,
+        creator,
+        rent_payer,
+        buffer_index,
+        vault_index,
+        ephemeral_signers,
+        memo,
+        program_id,
+        signers,
+    )
+    try:
+        return await connection.send_transaction(tx, send_options)
+    except Exception as e:
+        raise e from None
@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey
 from solders.rpc.responses import SendTransactionResp
 from solders.transaction import Signer
 
+from .._internal.lookup_table_cache import AddressLookupTableCache
 from .._internal.utils import get_recent_blockhash
 from ..generated.program_id import PROGRAM_ID
 from ..transactions import vault_transaction_execute as create_transaction
@@ -20,6 +21,7 @@ async def vault_transaction_execute(
     signers: Sequence[Signer] | None = None,
     send_options: TxOpts | None = None,
     program_id: Pubkey = PROGRAM_ID,
+    lookup_table_cache: AddressLookupTableCache | None = None,
 ) -> SendTransactionResp:
     """ """
     assert isinstance(connection, AsyncClient)
@@ -30,6 +32,10 @@ async def vault_transaction_execute(
     assert isinstance(signers, Sequence) or signers is None
     assert isinstance(send_options, TxOpts) or send_options is None
     assert isinstance(program_id, Pubkey)
+    assert (
+        isinstance(lookup_table_cache, AddressLookupTableCache)
+        or lookup_table_cache is None
+    )
 
     tx = await create_transaction(
         connection,
@@ -40,6 +46,7 @@ async def vault_transaction_execute(
         member,
         program_id,
         signers,
+        lookup_table_cache,
     )
 
     try:
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from .._internal.packing import pack_instructions
+from ..instructions import batch_add_transaction as create_instruction
+
+
+def batch_add_transaction_many(
+    blockhash: Hash,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    first_transaction_index: int,
+    member: Signer,
+    rent_payer: Signer | None,
+    ephemeral_signers: int,
+    transaction_payer: Pubkey,
+    transactions: Sequence[list[Instruction]],
+    address_lookup_table_accounts: list[AddressLookupTableAccount] | None,
+    program_id: Pubkey,
+    optimize_lookup_tables: bool = False,
+) -> list[tuple[VersionedTransaction, range]]:
+    """
+    Add `transactions` to a batch with as few transactions as possible.
+
+    The program assigns batch transaction indexes in arrival order, so the
+    returned transactions must land in order, starting with the batch
+    holding `first_transaction_index - 1` transactions. Returns each signed
+    transaction together with the range of `transactions` it adds.
+    """
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(batch_index, int)
+        assert isinstance(first_transaction_index, int)
+        assert first_transaction_index > 0
+        assert isinstance(member, Signer)
+        assert isinstance(rent_payer, Signer) or rent_payer is None
+        assert isinstance(transactions, Sequence)
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ixs = [
+        create_instruction(
+            multisig_pda,
+            batch_index,
+            first_transaction_index + i,
+            member.pubkey(),
+            rent_payer.pubkey() if rent_payer else None,
+            ephemeral_signers,
+            transaction_payer,
+            blockhash,
+            transaction_instructions,
+            address_lookup_table_accounts,
+            program_id,
+            optimize_lookup_tables,
+        )
+        for i, transaction_instructions in enumerate(transactions)
+    ]
+
+    signers_list = [fee_payer, member]
+    if rent_payer:
+        signers_list.append(rent_payer)
+    signers_list = list(set(signers_list))
+
+    txs: list[tuple[VersionedTransaction, range]] = []
+    for group in pack_instructions(fee_payer.pubkey(), ixs):
+        message_v0 = MessageV0.try_compile(
+            fee_payer.pubkey(),
+            ixs[group.start : group.stop],
+            [],
+            blockhash,
+        )
+        txs.append((VersionedTransaction(message_v0, signers_list), group))
+
+    return txs
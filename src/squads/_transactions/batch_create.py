@@ -0,0 +1,51 @@
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from ..instructions import batch_create as create_instruction
+
+
+def batch_create(
+    blockhash: Hash,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    batch_index: int,
+    creator: Signer,
+    rent_payer: Signer | None,
+    vault_index: int,
+    memo: str | None,
+    program_id: Pubkey,
+) -> VersionedTransaction:
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Signer)
+        assert isinstance(rent_payer, Signer) or rent_payer is None
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ix = create_instruction(
+        multisig_pda,
+        batch_index,
+        creator.pubkey(),
+        rent_payer.pubkey() if rent_payer else None,
+        vault_index,
+        memo,
+        program_id,
+    )
+    message_v0 = MessageV0.try_compile(
+        fee_payer.pubkey(),
+        [ix],
+        [],
+        blockhash,
+    )
+    signers_list = [fee_payer, creator]
+    if rent_payer:
+        signers_list.append(rent_payer)
+    signers_list = list(set(signers_list))
+
+    versioned_tx = VersionedTransaction(message_v0, signers_list)
+
+    return versioned_tx
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from .._internal.packing import pack_instructions
+from ..instructions import proposal_approve as create_instruction
+
+
+def proposal_approve_many(
+    blockhash: Hash,
+    fee_payer: Signer,
+    proposals: Sequence[tuple[Pubkey, int]],
+    member: Signer,
+    memo: str | None,
+    program_id: Pubkey | None,
+) -> list[tuple[VersionedTransaction, range]]:
+    """
+    Approve many proposals with as few transactions as possible.
+
+    `proposals` holds (multisig_pda, transaction_index) pairs. Returns each
+    signed transaction together with the range of `proposals` it approves.
+    """
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(proposals, Sequence)
+        assert all(
+            isinstance(multisig_pda, Pubkey) and isinstance(transaction_index, int)
+            for multisig_pda, transaction_index in proposals
+        )
+        assert isinstance(member, Signer)
+        assert isinstance(memo, str) or memo is None
+        assert isinstance(program_id, Pubkey) or program_id is None
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ixs = [
+        create_instruction(
+            multisig_pda,
+            transaction_index,
+            member.pubkey(),
+            memo,
+            program_id,
+        )
+        for multisig_pda, transaction_index in proposals
+    ]
+
+    signers_list = [fee_payer, member]
+    signers_list = list(set(signers_list))
+
+    txs: list[tuple[VersionedTransaction, range]] = []
+    for group in pack_instructions(fee_payer.pubkey(), ixs):
+        message_v0 = MessageV0.try_compile(
+            fee_payer.pubkey(),
+            ixs[group.start : group.stop],
+            [],
+            blockhash,
+        )
+        txs.append((VersionedTransaction(message_v0, signers_list), group))
+
+    return txs
@@ -0,0 +1,55 @@
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from ..instructions import transaction_buffer_create as create_instruction
+
+
+def transaction_buffer_create(
+    blockhash: Hash,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    creator: Signer,
+    rent_payer: Signer | None,
+    buffer_index: int,
+    vault_index: int,
+    final_buffer_hash: bytes,
+    final_buffer_size: int,
+    buffer: bytes,
+    program_id: Pubkey,
+) -> VersionedTransaction:
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Signer)
+        assert isinstance(rent_payer, Signer) or rent_payer is None
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ix = create_instruction(
+        multisig_pda,
+        creator.pubkey(),
+        rent_payer.pubkey() if rent_payer else None,
+        buffer_index,
+        vault_index,
+        final_buffer_hash,
+        final_buffer_size,
+        buffer,
+        program_id,
+    )
+    message_v0 = MessageV0.try_compile(
+        fee_payer.pubkey(),
+        [ix],
+        [],
+        blockhash,
+    )
+    signers_list = [fee_payer, creator]
+    if rent_payer:
+        signers_list.append(rent_payer)
+    signers_list = list(set(signers_list))
+
+    versioned_tx = VersionedTransaction(message_v0, signers_list)
+
+    return versioned_tx
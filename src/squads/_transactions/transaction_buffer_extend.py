@@ -0,0 +1,44 @@
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from ..instructions import transaction_buffer_extend as create_instruction
+
+
+def transaction_buffer_extend(
+    blockhash: Hash,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    creator: Signer,
+    buffer_index: int,
+    buffer: bytes,
+    program_id: Pubkey,
+) -> VersionedTransaction:
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Signer)
+        assert isinstance(program_id, Pubkey)
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ix = create_instruction(
+        multisig_pda,
+        creator.pubkey(),
+        buffer_index,
+        buffer,
+        program_id,
+    )
+    message_v0 = MessageV0.try_compile(
+        fee_payer.pubkey(),
+        [ix],
+        [],
+        blockhash,
+    )
+    signers_list = [fee_payer, creator]
+    signers_list = list(set(signers_list))
+
+    versioned_tx = VersionedTransaction(message_v0, signers_list)
+
+    return versioned_tx
@@ -24,6 +24,7 @@ def vault_transaction_create(
     memo: str | None,
     program_id: Pubkey,
     signers: list[Signer] | None,
+    optimize_lookup_tables: bool = False,
 ) -> VersionedTransaction:
     """
     Returns `VersionedTransaction` that needs to be
@@ -46,6 +47,7 @@ def vault_transaction_create(
     assert isinstance(memo, str) or memo is None
     assert isinstance(program_id, Pubkey) or program_id is None
     assert isinstance(signers, list) or signers is None
+    assert isinstance(optimize_lookup_tables, bool)
 
     ix = create_instruction(
         multisig_pda,
@@ -60,6 +62,7 @@ def vault_transaction_create(
         address_lookup_table_accounts,
         memo,
         program_id,
+        optimize_lookup_tables,
     )
 
     message_v0 = MessageV0.try_compile(
@@ -0,0 +1,64 @@
+from solders.hash import Hash
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import Signer, VersionedTransaction
+
+from ..instructions import vault_transaction_create_from_buffer as create_instruction
+
+
+def vault_transaction_create_from_buffer(
+    blockhash: Hash,
+    fee_payer: Signer,
+    multisig_pda: Pubkey,
+    transaction_index: int,
+    creator: Signer,
+    rent_payer: Signer | None,
+    buffer_index: int,
+    vault_index: int,
+    ephemeral_signers: int,
+    memo: str | None,
+    program_id: Pubkey,
+    signers: list[Signer] | None,
+) -> VersionedTransaction:
+    """
+    Returns `VersionedTransaction` creating the vault transaction from the
+    message uploaded to the creator's transaction buffer `buffer_index`.
+    The buffer is closed by the same instruction.
+    """
+    try:
+        assert isinstance(fee_payer, Signer)
+        assert isinstance(multisig_pda, Pubkey)
+        assert isinstance(creator, Signer)
+        assert isinstance(rent_payer, Signer) or rent_payer is None
+        assert isinstance(program_id, Pubkey)
+        assert isinstance(signers, list) or signers is None
+    except AssertionError:
+        raise ValueError("Invalid argument") from None
+
+    ix = create_instruction(
+        multisig_pda,
+        transaction_index,
+        creator.pubkey(),
+        rent_payer.pubkey() if rent_payer else None,
+        buffer_index,
+        vault_index,
+        ephemeral_signers,
+        memo,
+        program_id,
+    )
+    message_v0 = MessageV0.try_compile(
+        fee_payer.pubkey(),
+        [ix],
+        [],
+        blockhash,
+    )
+    signers_list = [fee_payer, creator]
+    if rent_payer:
+        signers_list.append(rent_payer)
+    if signers:
+        signers_list.extend(signers)
+    signers_list = list(set(signers_list))
+
+    versioned_tx = VersionedTransaction(message_v0, signers_list)
+
+    return versioned_tx
@@ -6,6 +6,7 @@ from solders.message import MessageV0
 from solders.pubkey import Pubkey
 from solders.transaction import Signer, VersionedTransaction
 
+from .._internal.lookup_table_cache import AddressLookupTableCache
 from ..instructions import vault_transaction_execute as create_instruction
 
 
@@ -18,6 +19,7 @@ async def vault_transaction_execute(
     member: Pubkey,
     program_id: Pubkey,
     signers: Sequence[Signer] | None,
+    lookup_table_cache: AddressLookupTableCache | None = None,
 ) -> VersionedTransaction:
     """
     Returns `VersionedTransaction` that needs to be
@@ -31,6 +33,10 @@ async def vault_transaction_execute(
     assert isinstance(member, Pubkey)
     assert isinstance(program_id, Pubkey)
     assert isinstance(signers, Sequence) or signers is None
+    assert (
+        isinstance(lookup_table_cache, AddressLookupTableCache)
+        or lookup_table_cache is None
+    )
 
     ix, lookup_table_accounts = await create_instruction(
         connection,
@@ -38,6 +44,7 @@ async def vault_transaction_execute(
         transaction_index,
         member,
         program_id,
+        lookup_table_cache,
     )
 
     message_v0 = MessageV0.try_compile(
@@ -53,4 +60,3 @@ async def vault_transaction_execute(
     versioned_tx = VersionedTransaction(message_v0, signers_list)
 
     return versioned_tx
-    return versioned_tx
@@ -1,4 +1,17 @@
+from ._internal.address_store import PersistentAddressCache
+from ._internal.compact import (
+    CompactMember,
+    CompactMultisig,
+    CompactProposal,
+    CompactSpendingLimit,
+    PubkeySet,
+)
+from ._internal.fetch import FetchedAccount, iter_fetch_multiple
+from ._internal.lookup_table_cache import AddressLookupTableCache
 from ._internal.pda import PDA
+from ._internal.scan import scan_program_account_data, scan_program_accounts
+from ._internal.snapshot import MultisigState, load_multisig_state
+from ._internal.views import VaultTransactionView
 from .generated.accounts.batch import Batch, BatchJSON
 from .generated.accounts.config_transaction import (
     ConfigTransaction,
@@ -15,7 +28,16 @@ from .generated.accounts.transaction_buffer import (
 from .generated.accounts.vault_transaction import VaultTransaction, VaultTransactionJSON
 
 __all__ = [
+    "AddressLookupTableCache",
+    "CompactMember",
+    "CompactMultisig",
+    "CompactProposal",
+    "CompactSpendingLimit",
+    "FetchedAccount",
+    "MultisigState",
     "PDA",
+    "PersistentAddressCache",
+    "PubkeySet",
     "Batch",
     "BatchJSON",
     "ConfigTransaction",
@@ -32,4 +54,9 @@ __all__ = [
     "TransactionBufferJSON",
     "VaultTransaction",
     "VaultTransactionJSON",
+    "VaultTransactionView",
+    "iter_fetch_multiple",
+    "load_multisig_state",
+    "scan_program_account_data",
+    "scan_program_accounts",
 ]
@@ -0,0 +1,13 @@
+from ._internal.columnar import (
+    AccountColumns,
+    decode_proposal_columns,
+    decode_spending_limit_columns,
+    decode_vault_transaction_columns,
+)
+
+__all__ = [
+    "AccountColumns",
+    "decode_proposal_columns",
+    "decode_spending_limit_columns",
+    "decode_vault_transaction_columns",
+]
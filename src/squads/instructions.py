@@ -1,4 +1,7 @@
 from ._instructions import (
+    batch_add_transaction,
+    batch_create,
+    batch_execute_transaction,
     config_transaction_create,
     config_transaction_execute,
     multisig_add_member,
@@ -14,11 +17,17 @@ from ._instructions import (
     proposal_create,
     proposal_reject,
     spending_limit_use,
+    transaction_buffer_create,
+    transaction_buffer_extend,
     vault_transaction_create,
+    vault_transaction_create_from_buffer,
     vault_transaction_execute,
 )
 
 __all__ = [
+    "batch_add_transaction",
+    "batch_create",
+    "batch_execute_transaction",
     "config_transaction_create",
     "config_transaction_execute",
     "multisig_add_member",
@@ -34,6 +43,9 @@ __all__ = [
     "proposal_create",
     "proposal_reject",
     "spending_limit_use",
+    "transaction_buffer_create",
+    "transaction_buffer_extend",
     "vault_transaction_create",
+    "vault_transaction_create_from_buffer",
     "vault_transaction_execute",
 ]
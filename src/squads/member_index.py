@@ -0,0 +1,5 @@
+from ._internal.member_index import MemberIndex
+
+__all__ = [
+    "MemberIndex",
+]
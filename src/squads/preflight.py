@@ -0,0 +1,6 @@
+from ._internal.preflight import PreflightStats, PreflightValidator
+
+__all__ = [
+    "PreflightStats",
+    "PreflightValidator",
+]
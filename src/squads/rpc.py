@@ -1,4 +1,8 @@
+from ._internal.blockhash import BlockhashProvider
 from ._rpc import (
+    batch_add_transaction_many,
+    batch_create,
+    batch_execute,
     config_transaction_create,
     config_transaction_execute,
     multisig_add_member,
@@ -10,15 +14,26 @@ from ._rpc import (
     multisig_set_config_authority,
     proposal_activate,
     proposal_approve,
+    proposal_approve_many,
     proposal_cancel_v2,
     proposal_create,
     proposal_reject,
     spending_limit_use,
+    transaction_buffer_upload,
     vault_transaction_create,
+    vault_transaction_create_from_buffer,
     vault_transaction_execute,
 )
+from ._rpc.batch_add_transaction_many import BatchAddTransactionError
+from ._rpc.proposal_approve_many import ProposalApproveOutcome
 
 __all__ = [
+    "BatchAddTransactionError",
+    "BlockhashProvider",
+    "ProposalApproveOutcome",
+    "batch_add_transaction_many",
+    "batch_create",
+    "batch_execute",
     "config_transaction_create",
     "config_transaction_execute",
     "multisig_add_member",
@@ -30,10 +45,13 @@ __all__ = [
     "multisig_set_config_authority",
     "proposal_activate",
     "proposal_approve",
+    "proposal_approve_many",
     "proposal_cancel_v2",
     "proposal_create",
     "proposal_reject",
     "spending_limit_use",
+    "transaction_buffer_upload",
     "vault_transaction_create",
+    "vault_transaction_create_from_buffer",
     "vault_transaction_execute",
 ]
@@ -0,0 +1,6 @@
+from ._internal.simulator import MultisigSimulator, check_multisig_invariant
+
+__all__ = [
+    "MultisigSimulator",
+    "check_multisig_invariant",
+]
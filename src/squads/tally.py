@@ -0,0 +1,6 @@
+from ._internal.tally import ProposalTally, tally_proposals
+
+__all__ = [
+    "ProposalTally",
+    "tally_proposals",
+]
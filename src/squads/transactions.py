@@ -1,4 +1,7 @@
 from ._transactions import (
+    batch_add_transaction_many,
+    batch_create,
+    batch_execute_transaction,
     config_transaction_create,
     config_transaction_execute,
     multisig_add_member,
@@ -10,15 +13,22 @@ from ._transactions import (
     multisig_set_config_authority,
     proposal_activate,
     proposal_approve,
+    proposal_approve_many,
     proposal_cancel_v2,
     proposal_create,
     proposal_reject,
     spending_limit_use,
+    transaction_buffer_create,
+    transaction_buffer_extend,
     vault_transaction_create,
+    vault_transaction_create_from_buffer,
     vault_transaction_execute,
 )
 
 __all__ = [
+    "batch_add_transaction_many",
+    "batch_create",
+    "batch_execute_transaction",
     "config_transaction_create",
     "config_transaction_execute",
     "multisig_add_member",
@@ -30,10 +40,14 @@ __all__ = [
     "multisig_set_config_authority",
     "proposal_activate",
     "proposal_approve",
+    "proposal_approve_many",
     "proposal_cancel_v2",
     "proposal_create",
     "proposal_reject",
     "spending_limit_use",
+    "transaction_buffer_create",
+    "transaction_buffer_extend",
     "vault_transaction_create",
+    "vault_transaction_create_from_buffer",
     "vault_transaction_execute",
 ]
@@ -0,0 +1,71 @@
+import dataclasses
+from collections.abc import Iterable
+from typing import Any
+
+from solders.pubkey import Pubkey
+
+from squads.generated.accounts.multisig import Multisig
+from squads.generated.accounts.proposal import Proposal
+from squads.generated.types.member import Member
+from squads.generated.types.permissions import Permissions
+from squads.generated.types.proposal_status import ProposalStatusKind
+
+
+def _encodable(value: Any) -> Any:
+    if hasattr(value, "to_encodable"):
+        return value.to_encodable()
+    if isinstance(value, list):
+        return [_encodable(item) for item in value]  # pyright: ignore
+    return value
+
+
+def encode_account(account: Any) -> bytes:
+    """Serializes a generated account the way the program stores it."""
+    fields = {
+        field.name: _encodable(getattr(account, field.name))
+        for field in dataclasses.fields(account)
+    }
+    return account.discriminator + account.layout.build(fields)
+
+
+def member(key: Pubkey | None = None, mask: int = 7) -> Member:
+    return Member(key or Pubkey.new_unique(), Permissions(mask))
+
+
+def multisig(
+    members: Iterable[Member],
+    threshold: int = 2,
+    transaction_index: int = 0,
+    stale_transaction_index: int = 0,
+    time_lock: int = 0,
+) -> Multisig:
+    return Multisig(
+        create_key=Pubkey.new_unique(),
+        config_authority=Pubkey.default(),
+        threshold=threshold,
+        time_lock=time_lock,
+        transaction_index=transaction_index,
+        stale_transaction_index=stale_transaction_index,
+        rent_collector=None,
+        bump=255,
+        members=sorted(members, key=lambda item: bytes(item.key)),
+    )
+
+
+def proposal(
+    transaction_index: int,
+    status: ProposalStatusKind,
+    approved: Iterable[Pubkey] = (),
+    rejected: Iterable[Pubkey] = (),
+    cancelled: Iterable[Pubkey] = (),
+    multisig_pda: Pubkey | None = None,
+) -> Proposal:
+    return Proposal(
+        multisig=multisig_pda or Pubkey.new_unique(),
+        transaction_index=transaction_index,
+        status=status,
+        bump=255,
+        approved=list(approved),
+        rejected=list(rejected),
+        cancelled=list(cancelled),
+    )
@@ -0,0 +1,152 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from based58 import b58decode
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.types import DataSliceOpts, MemcmpOpts
+from solders.account import Account
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+from solders.rpc.responses import (
+    GetAccountInfoResp,
+    GetLatestBlockhashResp,
+    GetMultipleAccountsResp,
+    GetProgramAccountsResp,
+    GetSignatureStatusesResp,
+    RpcBlockhash,
+    RpcKeyedAccount,
+    RpcResponseContext,
+    SendTransactionResp,
+)
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from solders.transaction_status import (
+    TransactionConfirmationStatus,
+    TransactionErrorType,
+    TransactionStatus,
+)
+
+U64_MAX = 2**64 - 1
+LOOKUP_TABLE_META_SIZE = 56
+ADDRESS_LOOKUP_TABLE_PROGRAM_ID = Pubkey.from_string(
+    "AddressLookupTab1e1111111111111111111111111"
+)
+
+
+def lookup_table_account(
+    addresses: Sequence[Pubkey], deactivation_slot: int = U64_MAX
+) -> Account:
+    """Raw lookup table account, laid out the way the program stores it."""
+    meta = (1).to_bytes(4, "little") + deactivation_slot.to_bytes(8, "little")
+    data = meta.ljust(LOOKUP_TABLE_META_SIZE, b"\0") + b"".join(
+        bytes(address) for address in addresses
+    )
+    return Account(1, data, ADDRESS_LOOKUP_TABLE_PROGRAM_ID)
+
+
+class FakeClient(AsyncClient):
+    """
+    In-memory stand-in for the RPC methods the package calls. Requests are
+    recorded in `calls` as `(method, args)` pairs; a method listed in
+    `failures` raises the given exception instead.
+
+    Sent transactions land in `sent`; `transaction_error` decides which of
+    them fail on chain, and with what error, and may apply the successful
+    ones to `accounts`.
+    """
+
+    def __init__(self, slot: int = 100, block_height: int = 1_000):
+        super().__init__()
+        self.slot = slot
+        self.block_height = block_height
+        self.accounts: dict[Pubkey, Account] = {}
+        self.calls: list[tuple[str, Any]] = []
+        self.failures: dict[str, Exception] = {}
+        self.sent: list[VersionedTransaction] = []
+        self.transaction_error: (
+            Callable[[VersionedTransaction], TransactionErrorType | None] | None
+        ) = None
+        self._statuses: dict[Signature, TransactionErrorType | None] = {}
+
+    def _record(self, method: str, args: Any = None) -> None:
+        self.calls.append((method, args))
+        if method in self.failures:
+            raise self.failures[method]
+
+    def count(self, method: str) -> int:
+        return sum(1 for called, _ in self.calls if called == method)
+
+    async def get_account_info(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, pubkey: Pubkey, commitment: Any = None, **kwargs: Any
+    ) -> GetAccountInfoResp:
+        self._record("get_account_info", pubkey)
+        return GetAccountInfoResp(
+            self.accounts.get(pubkey), RpcResponseContext(self.slot)
+        )
+
+    async def get_multiple_accounts(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, pubkeys: list[Pubkey], commitment: Any = None, **kwargs: Any
+    ) -> GetMultipleAccountsResp:
+        self._record("get_multiple_accounts", list(pubkeys))
+        return GetMultipleAccountsResp(
+            [self.accounts.get(pubkey) for pubkey in pubkeys],
+            RpcResponseContext(self.slot),
+        )
+
+    async def get_program_accounts(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        pubkey: Pubkey,
+        commitment: Any = None,
+        encoding: Any = None,
+        data_slice: DataSliceOpts | None = None,
+        filters: Sequence[MemcmpOpts] = (),
+    ) -> GetProgramAccountsResp:
+        """Applies base58 `memcmp` filters and `data_slice` like the RPC."""
+        self._record("get_program_accounts", list(filters))
+        keyed_accounts: list[RpcKeyedAccount] = []
+        for key, account in self.accounts.items():
+            if account.owner != pubkey or not all(
+                account.data[f.offset :].startswith(b58decode(f.bytes.encode()))
+                for f in filters
+            ):
+                continue
+            if data_slice is not None:
+                start = data_slice.offset
+                data = account.data[start : start + data_slice.length]
+                account = Account(
+                    account.lamports, data, account.owner, account.executable
+                )
+            keyed_accounts.append(RpcKeyedAccount(key, account))
+        return GetProgramAccountsResp(keyed_accounts)
+
+    async def get_latest_blockhash(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, commitment: Any = None
+    ) -> GetLatestBlockhashResp:
+        self._record("get_latest_blockhash")
+        return GetLatestBlockhashResp(
+            RpcBlockhash(Hash.new_unique(), self.block_height + 150),
+            RpcResponseContext(self.slot),
+        )
+
+    async def send_transaction(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, txn: VersionedTransaction, opts: Any = None
+    ) -> SendTransactionResp:
+        self._record("send_transaction", txn)
+        self.sent.append(txn)
+        signature = txn.signatures[0]
+        error = self.transaction_error(txn) if self.transaction_error else None
+        self._statuses[signature] = error
+        return SendTransactionResp(signature)
+
+    async def confirm_transaction(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, tx_sig: Signature, commitment: Any = None, **kwargs: Any
+    ) -> GetSignatureStatusesResp:
+        self._record("confirm_transaction", tx_sig)
+        status = TransactionStatus(
+            self.slot,
+            None,
+            None,
+            self._statuses[tx_sig],
+            TransactionConfirmationStatus.Confirmed,
+        )
+        return GetSignatureStatusesResp([status], RpcResponseContext(self.slot))
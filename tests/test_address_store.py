@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.address_store import PersistentAddressCache, encode_seeds
+from squads._internal.pda import PDA
+from squads.generated.program_id import PROGRAM_ID
+
+SEEDS = (b"multisig", b"vault", bytes(Pubkey.new_unique()))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PersistentAddressCache(tmp_path / "addresses.db")
+    yield store
+    store.close()
+
+
+def tamper(store: PersistentAddressCache, seeds, address: bytes, bump: int) -> None:
+    connection = sqlite3.connect(store.path)
+    connection.execute(
+        "UPDATE addresses SET address = ?, bump = ? WHERE seeds = ?",
+        (address, bump, encode_seeds(seeds)),
+    )
+    connection.commit()
+    connection.close()
+
+
+def test_round_trip(store):
+    value = Pubkey.find_program_address(list(SEEDS), PROGRAM_ID)
+    store.put(SEEDS, PROGRAM_ID, value)
+
+    assert store.get(SEEDS, PROGRAM_ID) == value
+    assert list(store.items(PROGRAM_ID)) == [(SEEDS, value)]
+    assert store.get(SEEDS, Pubkey.new_unique()) is None
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda address, bump: (bytes(Pubkey.new_unique()), bump),
+        lambda address, bump: (address, (bump - 1) % 256),
+        lambda address, bump: (address[:31], bump),
+        lambda address, bump: (address, 300),
+    ],
+)
+def test_drops_rows_that_fail_verification(store, corrupt):
+    address, bump = Pubkey.find_program_address(list(SEEDS), PROGRAM_ID)
+    store.put(SEEDS, PROGRAM_ID, (address, bump))
+    tamper(store, SEEDS, *corrupt(bytes(address), bump))
+
+    assert store.get(SEEDS, PROGRAM_ID) is None
+    # The row was deleted, so the correct address can be stored again
+    store.put(SEEDS, PROGRAM_ID, (address, bump))
+    assert store.get(SEEDS, PROGRAM_ID) == (address, bump)
+
+
+def test_items_skip_rows_that_fail_verification(store):
+    other_seeds = (b"multisig", bytes(Pubkey.new_unique()))
+    value = Pubkey.find_program_address(list(SEEDS), PROGRAM_ID)
+    other_value = Pubkey.find_program_address(list(other_seeds), PROGRAM_ID)
+    store.put_many([(SEEDS, value), (other_seeds, other_value)], PROGRAM_ID)
+    tamper(store, SEEDS, bytes(Pubkey.new_unique()), value[1])
+
+    assert list(store.items(PROGRAM_ID)) == [(other_seeds, other_value)]
+    assert store.get(SEEDS, PROGRAM_ID) is None
+
+
+def test_find_program_address_ignores_tampered_row(store):
+    create_key = Pubkey.new_unique()
+    expected = Pubkey.find_program_address(
+        [b"multisig", b"multisig", bytes(create_key)], PROGRAM_ID
+    )
+    PDA.cache_clear()
+    PDA.set_persistent_cache(store)
+    try:
+        assert PDA.get_multisig_pda(create_key) == expected
+        tamper(
+            store,
+            (b"multisig", b"multisig", bytes(create_key)),
+            bytes(Pubkey.new_unique()),
+            expected[1],
+        )
+        PDA.cache_clear()
+
+        assert PDA.warm_cache() == 0
+        assert PDA.get_multisig_pda(create_key) == expected
+    finally:
+        PDA.set_persistent_cache(None)
+        PDA.cache_clear()
@@ -0,0 +1,189 @@
+import asyncio
+
+import pytest
+from solders.account import Account
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+from solders.transaction_status import (
+    InstructionErrorCustom,
+    TransactionErrorInstructionError,
+)
+
+from squads.accounts import PDA, Batch
+from squads.generated.accounts.vault_batch_transaction import VaultBatchTransaction
+from squads.generated.errors import custom
+from squads.generated.program_id import PROGRAM_ID
+from squads.generated.types.multisig_compiled_instruction import (
+    MultisigCompiledInstruction,
+)
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+from squads.rpc import (
+    BatchAddTransactionError,
+    batch_add_transaction_many,
+    batch_execute,
+)
+
+from .factories import encode_account
+from .fakes import FakeClient
+
+MULTISIG_PDA = Pubkey.new_unique()
+BATCH_INDEX = 4
+VAULT_PDA, VAULT_BUMP = PDA.get_vault_pda(MULTISIG_PDA, 0)
+PROGRAM = Pubkey.new_unique()
+
+
+def program_account(account: object) -> Account:
+    return Account(1, encode_account(account), PROGRAM_ID)
+
+
+def add_batch(client: FakeClient, size: int, executed_transaction_index: int = 0):
+    batch_pda = PDA.get_transaction_pda(MULTISIG_PDA, BATCH_INDEX)[0]
+    client.accounts[batch_pda] = program_account(
+        Batch(
+            MULTISIG_PDA,
+            Pubkey.new_unique(),
+            BATCH_INDEX,
+            255,
+            0,
+            VAULT_BUMP,
+            size,
+            executed_transaction_index,
+        )
+    )
+    for transaction_index in range(1, size + 1):
+        batch_transaction_pda = PDA.get_batch_transaction_pda(
+            MULTISIG_PDA, BATCH_INDEX, transaction_index
+        )[0]
+        client.accounts[batch_transaction_pda] = program_account(
+            VaultBatchTransaction(
+                255,
+                b"",
+                VaultTransactionMessage(
+                    1,
+                    1,
+                    0,
+                    [VAULT_PDA, PROGRAM],
+                    [MultisigCompiledInstruction(1, bytes([0]), b"")],
+                    [],
+                ),
+            )
+        )
+
+
+def add(client: FakeClient, member: Keypair, num_transactions: int = 12):
+    transactions = [
+        [Instruction(PROGRAM, bytes(100), [AccountMeta(VAULT_PDA, True, True)])]
+        for _ in range(num_transactions)
+    ]
+    return asyncio.run(
+        batch_add_transaction_many(
+            client, member, MULTISIG_PDA, BATCH_INDEX, member, VAULT_PDA, transactions
+        )
+    )
+
+
+def test_add_transaction_many():
+    client, member = FakeClient(), Keypair()
+    add_batch(client, size=2)
+
+    signatures = add(client, member)
+
+    assert len(client.sent) == len(signatures) > 1
+    assert signatures == [tx.signatures[0] for tx in client.sent]
+    # Later transactions are re-signed with a fresh blockhash
+    blockhashes = {tx.message.recent_blockhash for tx in client.sent}
+    assert len(blockhashes) == len(client.sent)
+    assert all(all(tx.verify_with_results()) for tx in client.sent)
+
+
+def test_add_transaction_many_reports_added_indexes():
+    client, member = FakeClient(), Keypair()
+    add_batch(client, size=2)
+
+    def fail_second(tx: VersionedTransaction):
+        if len(client.sent) == 2:
+            return TransactionErrorInstructionError(
+                0, InstructionErrorCustom(custom.Unauthorized.code)
+            )
+        return None
+
+    client.transaction_error = fail_second
+    with pytest.raises(BatchAddTransactionError) as excinfo:
+        add(client, member)
+
+    error = excinfo.value
+    num_added = len(error.transaction_indexes)
+    assert 0 < num_added < 12
+    # Numbering continues after the two transactions already in the batch
+    assert error.transaction_indexes == list(range(3, 3 + num_added))
+    assert error.signatures == [client.sent[0].signatures[0]]
+    assert isinstance(error.__cause__, custom.Unauthorized)
+
+    # A failing first transaction adds nothing, so its error is raised as is
+    client.sent.clear()
+    client.transaction_error = lambda tx: TransactionErrorInstructionError(
+        0, InstructionErrorCustom(custom.Unauthorized.code)
+    )
+    with pytest.raises(custom.Unauthorized):
+        add(client, member)
+
+
+def execute(client: FakeClient, member: Keypair, **kwargs: object):
+    async def run():
+        return [
+            executed
+            async for executed in batch_execute(
+                client, member, MULTISIG_PDA, BATCH_INDEX, member, **kwargs
+            )
+        ]
+
+    return asyncio.run(run())
+
+
+def test_execute_resumes_after_executed_index():
+    client, member = FakeClient(), Keypair()
+    add_batch(client, size=12, executed_transaction_index=2)
+
+    executed = execute(client, member)
+
+    assert [transaction_index for transaction_index, _ in executed] == list(
+        range(3, 13)
+    )
+    (fetched,) = [
+        keys for method, keys in client.calls if method == "get_multiple_accounts"
+    ]
+    assert fetched == [
+        PDA.get_batch_transaction_pda(MULTISIG_PDA, BATCH_INDEX, i)[0]
+        for i in range(3, 13)
+    ]
+
+
+def test_execute_packs_within_the_compute_budget():
+    client, member = FakeClient(), Keypair()
+    add_batch(client, size=10)
+
+    executed = execute(client, member)
+
+    # Seven executions get the 1.4M compute unit cap between them
+    assert [len(tx.message.instructions) for tx in client.sent] == [7, 3]
+    signatures = [tx.signatures[0] for tx in client.sent]
+    assert [signature for _, signature in executed] == (
+        [signatures[0]] * 7 + [signatures[1]] * 3
+    )
+
+    client.sent.clear()
+    execute(client, member, max_executions_per_transaction=None)
+    assert [len(tx.message.instructions) for tx in client.sent] == [10]
+    client.sent.clear()
+    execute(client, member, max_executions_per_transaction=4)
+    assert [len(tx.message.instructions) for tx in client.sent] == [4, 4, 2]
+
+
+def test_execute_nothing_left():
+    client, member = FakeClient(), Keypair()
+    add_batch(client, size=3, executed_transaction_index=3)
+
+    assert execute(client, member) == []
+    assert client.sent == []
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from squads._internal import blockhash
+from squads._internal.blockhash import (
+    BLOCK_DURATION,
+    MAX_PROCESSING_AGE,
+    BlockhashProvider,
+    get_blockhash_provider,
+)
+from squads._internal.utils import get_recent_blockhash
+
+from .fakes import FakeClient
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_estimates_remaining_blocks(monkeypatch: pytest.MonkeyPatch):
+    clock = Clock()
+    monkeypatch.setattr(blockhash, "time", clock)
+    client = FakeClient(block_height=5_000)
+    provider = BlockhashProvider(
+        client, refresh_interval=10, max_age=120, min_remaining_blocks=50
+    )
+
+    async def run():
+        first = await provider.get()
+        assert first.last_valid_block_height == 5_000 + MAX_PROCESSING_AGE
+        assert first.block_height == 5_000
+        assert first.remaining_blocks == MAX_PROCESSING_AGE
+
+        clock.now += 100 * BLOCK_DURATION
+        assert first.block_height == 5_100
+        assert (await provider.get()) is first
+
+        # Past the remaining-blocks margin but well inside `max_age`
+        clock.now += 1 * BLOCK_DURATION
+        assert first.remaining_blocks == 49
+        second = await provider.get()
+        assert second is not first
+        assert provider.last_valid_block_height == second.last_valid_block_height
+
+    asyncio.run(run())
+    assert client.count("get_latest_blockhash") == 2
+    assert provider.served == 3
+
+
+def test_refresh_loop_survives_failures():
+    client = FakeClient()
+
+    async def run():
+        async with BlockhashProvider(client, refresh_interval=0.01) as provider:
+            first = provider.latest
+            client.failures["get_latest_blockhash"] = ConnectionError()
+            await asyncio.sleep(0.05)
+            assert provider.running and provider.latest is first
+
+            del client.failures["get_latest_blockhash"]
+            await asyncio.sleep(0.05)
+            assert provider.latest is not first
+            assert provider.fetches > 1
+        assert not provider.running
+
+    asyncio.run(run())
+
+
+def test_rpc_helpers_find_the_running_provider():
+    client, other = FakeClient(), FakeClient()
+
+    async def run():
+        provider = BlockhashProvider(client, refresh_interval=60, max_age=60)
+        assert get_blockhash_provider(client) is None
+
+        async with provider:
+            assert get_blockhash_provider(client) is provider
+            assert get_blockhash_provider(other) is None
+            assert provider.latest is not None
+            cached = provider.latest.blockhash
+            assert await get_recent_blockhash(client) == cached
+            assert await get_recent_blockhash(client) == cached
+            assert await get_recent_blockhash(other) != cached
+
+        assert get_blockhash_provider(client) is None
+        assert await get_recent_blockhash(client) != cached
+
+    asyncio.run(run())
+    # One fetch on start, one after the provider stopped
+    assert client.count("get_latest_blockhash") == 2
+    assert other.count("get_latest_blockhash") == 1
@@ -0,0 +1,207 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.columnar import (
+    decode_proposal_columns,
+    decode_spending_limit_columns,
+    decode_vault_transaction_columns,
+)
+from squads.generated.accounts.spending_limit import SpendingLimit
+from squads.generated.accounts.vault_transaction import VaultTransaction
+from squads.generated.types.multisig_compiled_instruction import (
+    MultisigCompiledInstruction,
+)
+from squads.generated.types.period import Day
+from squads.generated.types.proposal_status import (
+    Approved,
+    Cancelled,
+    Draft,
+    Executing,
+)
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+from .factories import encode_account, proposal
+
+np = pytest.importorskip("numpy")
+
+KEYS = [Pubkey.new_unique() for _ in range(10)]
+STATUSES = [
+    Draft({"timestamp": 1}),
+    Executing(),
+    Approved({"timestamp": -5}),
+    Cancelled({"timestamp": 77}),
+]
+
+
+def make_proposals():
+    return [
+        proposal(
+            index,
+            STATUSES[index % 4],
+            approved=KEYS[: index % 4],
+            rejected=KEYS[4 : 4 + index % 3],
+            cancelled=KEYS[8 : 8 + index % 2],
+        )
+        for index in range(40)
+    ]
+
+
+def list_row(columns, name: str, row: int) -> list[bytes]:
+    offsets, values = columns.lists[name]
+    return [bytes(value) for value in values[offsets[row] : offsets[row + 1]]]
+
+
+def test_proposal_columns():
+    proposals = make_proposals()
+    addresses = [Pubkey.new_unique() for _ in proposals]
+    datas = [encode_account(item) for item in proposals]
+    # Account data can be padded past the encoded fields
+    datas[3] += bytes(20)
+
+    columns = decode_proposal_columns(datas, addresses)
+
+    assert columns.num_rows == len(proposals)
+    for row, (item, address) in enumerate(zip(proposals, addresses, strict=True)):
+        assert bytes(columns.fields["address"][row]) == bytes(address)
+        assert bytes(columns.fields["multisig"][row]) == bytes(item.multisig)
+        assert columns.fields["transaction_index"][row] == item.transaction_index
+        assert columns.fields["status"][row] == item.status.discriminator
+        assert columns.fields["bump"][row] == item.bump
+        executing = item.status.kind == "Executing"
+        assert columns.null_masks["status_timestamp"][row] == executing
+        if not executing:
+            timestamp = item.status.value["timestamp"]
+            assert columns.fields["status_timestamp"][row] == timestamp
+        for name in ("approved", "rejected", "cancelled"):
+            assert list_row(columns, name, row) == [
+                bytes(key) for key in getattr(item, name)
+            ]
+
+
+def test_vault_transaction_columns():
+    transactions = [
+        VaultTransaction(
+            multisig=Pubkey.new_unique(),
+            creator=Pubkey.new_unique(),
+            index=index,
+            bump=1,
+            vault_index=index % 3,
+            vault_bump=200,
+            ephemeral_signer_bumps=bytes(range(index % 4)),
+            message=VaultTransactionMessage(
+                1,
+                1,
+                0,
+                [KEYS[0]],
+                [MultisigCompiledInstruction(0, b"\x00", b"abc" * index)],
+                [],
+            ),
+        )
+        for index in range(20)
+    ]
+
+    columns = decode_vault_transaction_columns(
+        [encode_account(item) for item in transactions]
+    )
+
+    for row, item in enumerate(transactions):
+        assert bytes(columns.fields["creator"][row]) == bytes(item.creator)
+        assert columns.fields["index"][row] == item.index
+        assert columns.fields["vault_index"][row] == item.vault_index
+        assert columns.fields["vault_bump"][row] == item.vault_bump
+        offsets, values = columns.lists["ephemeral_signer_bumps"]
+        assert bytes(values[offsets[row] : offsets[row + 1]]) == (
+            item.ephemeral_signer_bumps
+        )
+        offsets, values = columns.lists["message"]
+        message = VaultTransactionMessage.layout.parse(
+            bytes(values[offsets[row] : offsets[row + 1]])
+        )
+        assert message.instructions[0].data == item.message.instructions[0].data
+
+
+def test_spending_limit_columns():
+    spending_limits = [
+        SpendingLimit(
+            multisig=Pubkey.new_unique(),
+            create_key=Pubkey.new_unique(),
+            vault_index=2,
+            mint=Pubkey.new_unique(),
+            amount=10**12 + index,
+            period=Day(),
+            remaining_amount=index,
+            last_reset=-index,
+            bump=254,
+            members=KEYS[: index % 3],
+            destinations=KEYS[: index % 5],
+        )
+        for index in range(20)
+    ]
+
+    columns = decode_spending_limit_columns(
+        [encode_account(item) for item in spending_limits]
+    )
+
+    for row, item in enumerate(spending_limits):
+        assert bytes(columns.fields["mint"][row]) == bytes(item.mint)
+        assert columns.fields["amount"][row] == item.amount
+        assert columns.fields["period"][row] == Day.discriminator
+        assert columns.fields["remaining_amount"][row] == item.remaining_amount
+        assert columns.fields["last_reset"][row] == item.last_reset
+        assert list_row(columns, "members", row) == [bytes(k) for k in item.members]
+        assert list_row(columns, "destinations", row) == [
+            bytes(k) for k in item.destinations
+        ]
+
+
+def test_empty():
+    columns = decode_proposal_columns([])
+
+    assert columns.num_rows == 0
+    assert columns.fields["transaction_index"].shape == (0,)
+
+
+def test_rejects_other_account_type():
+    data = encode_account(make_proposals()[0])
+
+    with pytest.raises(ValueError, match="discriminator"):
+        decode_spending_limit_columns([data])
+
+
+def test_rejects_truncated_data():
+    data = encode_account(make_proposals()[5])
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_proposal_columns([data[:60]])
+
+
+def test_mismatched_addresses():
+    datas = [encode_account(item) for item in make_proposals()]
+
+    with pytest.raises(ValueError):
+        decode_proposal_columns(datas, [Pubkey.new_unique()])
+
+
+def test_to_arrow_and_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    proposals = make_proposals()
+
+    table = decode_proposal_columns(
+        [encode_account(item) for item in proposals]
+    ).to_arrow()
+
+    assert table.schema.field("multisig").type == pa.binary(32)
+    for item, row in zip(proposals, table.to_pylist(), strict=True):
+        assert row["transaction_index"] == item.transaction_index
+        if item.status.kind == "Executing":
+            assert row["status_timestamp"] is None
+        else:
+            assert row["status_timestamp"] == item.status.value["timestamp"]
+        assert row["approved"] == [bytes(key) for key in item.approved]
+
+    path = str(tmp_path / "proposals.parquet")
+    decode_proposal_columns([encode_account(item) for item in proposals]).write_parquet(
+        path
+    )
+    assert pq.read_table(path).num_rows == len(proposals)
@@ -0,0 +1,112 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.compact import (
+    CompactMember,
+    CompactMultisig,
+    CompactProposal,
+    CompactSpendingLimit,
+    PubkeySet,
+)
+from squads.generated.accounts.spending_limit import SpendingLimit
+from squads.generated.types import period, proposal_status
+
+from .factories import encode_account, member, multisig, proposal
+
+STATUSES = [
+    proposal_status.Draft({"timestamp": 1}),
+    proposal_status.Active({"timestamp": 2}),
+    proposal_status.Rejected({"timestamp": 3}),
+    proposal_status.Approved({"timestamp": 4}),
+    proposal_status.Executing(),
+    proposal_status.Executed({"timestamp": 6}),
+    proposal_status.Cancelled({"timestamp": 7}),
+]
+
+
+def spending_limit(period_kind: period.PeriodKind) -> SpendingLimit:
+    return SpendingLimit(
+        multisig=Pubkey.new_unique(),
+        create_key=Pubkey.new_unique(),
+        vault_index=1,
+        mint=Pubkey.new_unique(),
+        amount=1_000,
+        period=period_kind,
+        remaining_amount=400,
+        last_reset=1_700_000_000,
+        bump=254,
+        members=[Pubkey.new_unique() for _ in range(3)],
+        destinations=[Pubkey.new_unique()],
+    )
+
+
+def test_pubkey_set():
+    keys = [Pubkey.new_unique() for _ in range(3)]
+    pubkey_set = PubkeySet([*keys, keys[0]])
+
+    assert len(pubkey_set) == 3
+    assert list(pubkey_set) == keys
+    assert pubkey_set[-1] == keys[2]
+    assert pubkey_set.index(keys[1]) == 1
+    assert keys[1] in pubkey_set and bytes(keys[1]) in pubkey_set
+    assert Pubkey.new_unique() not in pubkey_set
+    assert pubkey_set == set(keys)
+    assert PubkeySet.from_bytes(bytes(pubkey_set)) == pubkey_set
+    # Equal sets hash alike, whatever their order
+    assert hash(PubkeySet(keys[::-1])) == hash(pubkey_set)
+    with pytest.raises(ValueError):
+        PubkeySet.from_bytes(bytes(33))
+
+
+def test_pubkey_set_matches_record_boundaries():
+    first, second = bytes(Pubkey.new_unique()), bytes(Pubkey.new_unique())
+    pubkey_set = PubkeySet.from_bytes(first + second)
+    straddling = first[16:] + second[:16]
+
+    assert straddling not in pubkey_set
+    with pytest.raises(ValueError):
+        pubkey_set.index(Pubkey.from_bytes(straddling))
+
+
+def test_multisig_round_trip():
+    members = [member(mask=mask) for mask in (1, 2, 4, 7)]
+    ms = multisig(members, threshold=2, transaction_index=9, stale_transaction_index=4)
+
+    compact = CompactMultisig.decode(encode_account(ms))
+
+    assert compact == CompactMultisig.from_multisig(ms)
+    assert compact.to_multisig() == ms
+    assert compact.members == tuple(CompactMember.from_member(m) for m in ms.members)
+    target = ms.members[2]
+    assert compact.member(target.key) == CompactMember(
+        target.key, target.permissions.mask
+    )
+    assert compact.member(Pubkey.new_unique()) is None
+
+
+@pytest.mark.parametrize("status", STATUSES, ids=lambda status: status.kind)
+def test_proposal_round_trip(status: proposal_status.ProposalStatusKind):
+    keys = [Pubkey.new_unique() for _ in range(5)]
+    original = proposal(7, status, keys[:2], keys[2:4], keys[4:])
+
+    compact = CompactProposal.decode(encode_account(original))
+
+    assert compact == CompactProposal.from_proposal(original)
+    assert compact.status_kind == status.kind
+    assert compact.status == status
+    assert compact.to_proposal() == original
+
+
+@pytest.mark.parametrize(
+    "period_kind",
+    [period.OneTime(), period.Day(), period.Week(), period.Month()],
+    ids=lambda period_kind: period_kind.kind,
+)
+def test_spending_limit_round_trip(period_kind: period.PeriodKind):
+    original = spending_limit(period_kind)
+
+    compact = CompactSpendingLimit.decode(encode_account(original))
+
+    assert compact == CompactSpendingLimit.from_spending_limit(original)
+    assert compact.period == period_kind
+    assert compact.to_spending_limit() == original
@@ -0,0 +1,45 @@
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import AccountMeta, Instruction
+from solders.pubkey import Pubkey
+
+from squads._internal.compiled_keys import CompiledKeys, get_lookup_table_index
+
+
+def test_lookup_table_index_is_shared():
+    table = AddressLookupTableAccount(
+        Pubkey.new_unique(), [Pubkey.new_unique() for _ in range(4)]
+    )
+    index = get_lookup_table_index(table)
+
+    assert index == {address: i for i, address in enumerate(table.addresses)}
+    assert get_lookup_table_index(table) is index
+
+
+def test_lookup_table_index_checks_contents():
+    addresses = [Pubkey.new_unique() for _ in range(4)]
+    table = AddressLookupTableAccount(Pubkey.new_unique(), addresses)
+    # Same key and length, different contents
+    reordered = AddressLookupTableAccount(table.key, addresses[::-1])
+
+    get_lookup_table_index(table)
+    index = get_lookup_table_index(reordered)
+
+    assert index == {address: i for i, address in enumerate(addresses[::-1])}
+    assert get_lookup_table_index(table)[addresses[0]] == 0
+
+
+def test_select_lookup_tables_prefers_fewer_tables():
+    payer = Pubkey.new_unique()
+    keys = [Pubkey.new_unique() for _ in range(4)]
+    partial = AddressLookupTableAccount(Pubkey.new_unique(), keys[:2])
+    full = AddressLookupTableAccount(Pubkey.new_unique(), keys)
+    unused = AddressLookupTableAccount(Pubkey.new_unique(), [Pubkey.new_unique()])
+    instructions = [
+        Instruction(Pubkey.new_unique(), b"", [AccountMeta(k, False, False)])
+        for k in keys
+    ]
+    compiled_keys = CompiledKeys.compile(instructions, payer)
+
+    assert compiled_keys.select_lookup_tables([partial, unused, full]) == [full]
+    # Nothing to gain: the tables are kept as given
+    assert compiled_keys.select_lookup_tables([full]) == [full]
@@ -0,0 +1,239 @@
+import random
+
+import pytest
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+
+from squads._internal.encoding import (
+    encode_vault_transaction_message,
+    vault_transaction_message_size,
+)
+from squads._internal.sizing import MessageSizeEstimator
+from squads._internal.types import (
+    CompiledMsInstructionConstruct,
+    MessageAddressTableConstruct,
+    TransactionMessageConstruct,
+)
+from squads._internal.utils import (
+    compile_to_wrapped_message_v0,
+    transaction_message_to_multisig_transaction_message_bytes,
+)
+from squads.generated.types.multisig_compiled_instruction import (
+    MultisigCompiledInstruction,
+)
+from squads.generated.types.multisig_message_address_table_lookup import (
+    MultisigMessageAddressTableLookup,
+)
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+SEEDS = range(20)
+
+
+def construct_encode(message: MessageV0) -> bytes:
+    """The `TransactionMessageConstruct` path the encoder replaced."""
+    header = message.header
+    account_keys = message.account_keys
+    tx_msg_construct = TransactionMessageConstruct(
+        num_signers=header.num_required_signatures,
+        num_writable_signers=header.num_required_signatures
+        - header.num_readonly_signed_accounts,
+        num_writable_non_signers=len(account_keys)
+        - header.num_required_signatures
+        - header.num_readonly_unsigned_accounts,
+        account_keys=account_keys,
+        instructions=[
+            CompiledMsInstructionConstruct(
+                program_id_index=ix.program_id_index,
+                account_indexes=list(ix.accounts),
+                data=list(ix.data),
+            )
+            for ix in message.instructions
+        ],
+        address_table_lookups=[
+            MessageAddressTableConstruct(
+                account_key=lut.account_key,
+                writable_indexes=list(lut.writable_indexes),
+                readonly_indexes=list(lut.readonly_indexes),
+            )
+            for lut in message.address_table_lookups
+        ],
+    )
+    return tx_msg_construct.layout.build(tx_msg_construct.to_encodable())
+
+
+def vault_transaction_message(message: MessageV0) -> VaultTransactionMessage:
+    header = message.header
+    account_keys = message.account_keys
+    return VaultTransactionMessage(
+        num_signers=header.num_required_signatures,
+        num_writable_signers=header.num_required_signatures
+        - header.num_readonly_signed_accounts,
+        num_writable_non_signers=len(account_keys)
+        - header.num_required_signatures
+        - header.num_readonly_unsigned_accounts,
+        account_keys=list(account_keys),
+        instructions=[
+            MultisigCompiledInstruction(
+                program_id_index=ix.program_id_index,
+                account_indexes=list(ix.accounts),
+                data=bytes(ix.data),
+            )
+            for ix in message.instructions
+        ],
+        address_table_lookups=[
+            MultisigMessageAddressTableLookup(
+                account_key=lut.account_key,
+                writable_indexes=list(lut.writable_indexes),
+                readonly_indexes=list(lut.readonly_indexes),
+            )
+            for lut in message.address_table_lookups
+        ],
+    )
+
+
+def random_instructions(
+    rng: random.Random, accounts: list[Pubkey], programs: list[Pubkey]
+) -> list[Instruction]:
+    instructions: list[Instruction] = []
+    for _ in range(rng.randint(1, 12)):
+        metas = [
+            AccountMeta(key, rng.random() < 0.2, rng.random() < 0.5)
+            for key in rng.sample(accounts, rng.randint(0, 10))
+        ]
+        data = rng.randbytes(rng.choice([0, 1, 8, 40, 300]))
+        instructions.append(Instruction(rng.choice(programs), data, metas))
+    return instructions
+
+
+def random_lookup_tables(
+    rng: random.Random, accounts: list[Pubkey]
+) -> list[AddressLookupTableAccount]:
+    lookup_tables: list[AddressLookupTableAccount] = []
+    for _ in range(rng.randint(1, 4)):
+        addresses = rng.sample(accounts, rng.randint(1, len(accounts)))
+        addresses += [Pubkey.new_unique() for _ in range(rng.randint(0, 5))]
+        rng.shuffle(addresses)
+        lookup_tables.append(AddressLookupTableAccount(Pubkey.new_unique(), addresses))
+    return lookup_tables
+
+
+def random_message(
+    seed: int, with_lookup_tables: bool, optimize_lookup_tables: bool = False
+) -> MessageV0:
+    rng = random.Random(seed)
+    accounts = [Pubkey.new_unique() for _ in range(rng.randint(10, 40))]
+    programs = [Pubkey.new_unique() for _ in range(3)]
+    lookup_tables = random_lookup_tables(rng, accounts) if with_lookup_tables else None
+    return compile_to_wrapped_message_v0(
+        Pubkey.new_unique(),
+        Hash.new_unique(),
+        random_instructions(rng, accounts, programs),
+        lookup_tables,
+        optimize_lookup_tables,
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize(
+    "with_lookup_tables,optimize_lookup_tables",
+    [(False, False), (True, False), (True, True)],
+)
+def test_matches_construct(
+    seed: int, with_lookup_tables: bool, optimize_lookup_tables: bool
+):
+    message = random_message(seed, with_lookup_tables, optimize_lookup_tables)
+    if with_lookup_tables and not optimize_lookup_tables:
+        assert message.address_table_lookups
+
+    encoded = encode_vault_transaction_message(message)
+
+    assert encoded == construct_encode(message)
+    assert len(encoded) == vault_transaction_message_size(message)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("with_lookup_tables", [False, True])
+def test_size_estimator_matches(seed: int, with_lookup_tables: bool):
+    rng = random.Random(seed)
+    accounts = [Pubkey.new_unique() for _ in range(rng.randint(10, 40))]
+    programs = [Pubkey.new_unique() for _ in range(3)]
+    lookup_tables = random_lookup_tables(rng, accounts) if with_lookup_tables else []
+    instructions = random_instructions(rng, accounts, programs)
+    payer = Pubkey.new_unique()
+    estimator = MessageSizeEstimator(payer, lookup_tables, wrapped=True)
+    for ix in instructions:
+        estimator.add(ix)
+
+    message = compile_to_wrapped_message_v0(
+        payer, Hash.default(), instructions, lookup_tables
+    )
+
+    assert estimator.message_size == vault_transaction_message_size(message)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("with_lookup_tables", [False, True])
+def test_matches_vault_transaction_message(seed: int, with_lookup_tables: bool):
+    message = random_message(seed, with_lookup_tables)
+    encoded = encode_vault_transaction_message(message)
+
+    decoded = TransactionMessageConstruct.layout.parse(encoded)
+    expected = vault_transaction_message(message)
+    assert decoded.num_signers == expected.num_signers
+    assert decoded.num_writable_signers == expected.num_writable_signers
+    assert decoded.num_writable_non_signers == expected.num_writable_non_signers
+    assert list(decoded.account_keys) == expected.account_keys
+    assert [
+        (ix.program_id_index, list(ix.account_indexes), bytes(ix.data))
+        for ix in decoded.instructions
+    ] == [
+        (ix.program_id_index, ix.account_indexes, ix.data)
+        for ix in expected.instructions
+    ]
+    assert [
+        (lut.account_key, list(lut.writable_indexes), list(lut.readonly_indexes))
+        for lut in decoded.address_table_lookups
+    ] == [
+        (lut.account_key, lut.writable_indexes, lut.readonly_indexes)
+        for lut in expected.address_table_lookups
+    ]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("optimize_lookup_tables", [False, True])
+def test_transaction_message_bytes(seed: int, optimize_lookup_tables: bool):
+    rng = random.Random(seed)
+    accounts = [Pubkey.new_unique() for _ in range(rng.randint(10, 40))]
+    programs = [Pubkey.new_unique() for _ in range(3)]
+    payer = Pubkey.new_unique()
+    blockhash = Hash.new_unique()
+    instructions = random_instructions(rng, accounts, programs)
+    lookup_tables = random_lookup_tables(rng, accounts)
+
+    encoded = transaction_message_to_multisig_transaction_message_bytes(
+        payer, blockhash, instructions, lookup_tables, optimize_lookup_tables
+    )
+
+    message = compile_to_wrapped_message_v0(
+        payer, blockhash, instructions, lookup_tables, optimize_lookup_tables
+    )
+    assert encoded == construct_encode(message)
+
+
+def test_optimized_lookup_tables_not_larger():
+    for seed in SEEDS:
+        greedy = encode_vault_transaction_message(random_message(seed, True, False))
+        optimized = encode_vault_transaction_message(random_message(seed, True, True))
+        assert len(optimized) <= len(greedy)
+
+
+def test_rejects_oversized_instruction_data():
+    payer = Pubkey.new_unique()
+    instruction = Instruction(Pubkey.new_unique(), bytes(2**16), [])
+    message = compile_to_wrapped_message_v0(payer, Hash.new_unique(), [instruction])
+
+    with pytest.raises(ValueError):
+        encode_vault_transaction_message(message)
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal import lookup_table_cache
+from squads._internal.lookup_table_cache import (
+    DEACTIVATION_COOLDOWN_SLOTS,
+    AddressLookupTableCache,
+)
+
+from .fakes import FakeClient, lookup_table_account
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(lookup_table_cache, "time", clock)
+    return clock
+
+
+def fetched(client: FakeClient) -> list[list[Pubkey]]:
+    return [keys for method, keys in client.calls if method == "get_multiple_accounts"]
+
+
+def test_refreshes_on_ttl_and_length(clock: Clock):
+    client = FakeClient()
+    key = Pubkey.new_unique()
+    addresses = [Pubkey.new_unique() for _ in range(3)]
+    client.accounts[key] = lookup_table_account(addresses[:2])
+    cache = AddressLookupTableCache(ttl=60)
+
+    async def get(min_length: int = 0):
+        tables = await cache.get_many(client, [key], {key: min_length})
+        return tables[key].addresses
+
+    assert asyncio.run(get()) == addresses[:2]
+    assert asyncio.run(get(2)) == addresses[:2]
+    assert len(fetched(client)) == 1
+
+    # The table was extended; a caller needing the new index refetches it
+    client.accounts[key] = lookup_table_account(addresses)
+    assert asyncio.run(get(3)) == addresses
+    clock.now += 60
+    asyncio.run(get())
+
+    assert len(fetched(client)) == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stale_refreshes) == (1, 1, 2)
+    assert stats.hit_ratio == 0.25
+
+
+def test_keeps_deactivated_tables_until_the_cooldown_ends(clock: Clock):
+    client = FakeClient(slot=1_000)
+    key = Pubkey.new_unique()
+    addresses = [Pubkey.new_unique() for _ in range(2)]
+    client.accounts[key] = lookup_table_account(addresses, deactivation_slot=990)
+    cache = AddressLookupTableCache(ttl=1)
+
+    async def get():
+        return (await cache.get_many(client, [key], {key: 5}))[key]
+
+    asyncio.run(get())
+    entry = cache.get(key)
+    assert entry is not None and entry.is_deactivated
+    # Neither the TTL nor a missing index refetches a deactivated table...
+    clock.now += 10
+    asyncio.run(get())
+    assert len(fetched(client)) == 1
+    assert not entry.may_be_closed
+
+    # ...until enough slots have passed for it to be closed
+    remaining_slots = 990 + DEACTIVATION_COOLDOWN_SLOTS - entry.estimated_slot
+    clock.now += remaining_slots * lookup_table_cache.BLOCK_DURATION + 0.01
+    assert entry.may_be_closed
+    del client.accounts[key]
+    with pytest.raises(ValueError, match="not found"):
+        asyncio.run(get())
+
+    assert len(fetched(client)) == 2
+    assert cache.stats().stale_refreshes == 1
@@ -0,0 +1,86 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.compact import PubkeySet
+from squads._internal.member_index import MemberIndex
+from squads._internal.types import Permission
+from squads.generated.types import config_action
+
+from .factories import member
+
+
+def bits(positions: list[int]) -> int:
+    return sum(1 << position for position in positions)
+
+
+def test_bitsets():
+    members = [member(mask=mask) for mask in (1, 2, 4, 7, 3)]
+    index = MemberIndex(members)
+
+    assert len(index) == 5
+    assert [index.position(m.key) for m in members] == [0, 1, 2, 3, 4]
+    assert index.bitset(Permission.initiate) == bits([0, 3, 4])
+    assert index.bitset(Permission.vote) == bits([1, 3, 4])
+    assert index.bitset(Permission.execute) == bits([2, 3])
+    assert index.count(Permission.vote) == 3
+    assert index.members_with(Permission.execute) == [members[2].key, members[3].key]
+    for m in members:
+        assert m.key in index
+        for permission in Permission:
+            assert index.has(m.key, permission) == bool(m.permissions.mask & permission)
+
+    outsider = Pubkey.new_unique()
+    assert outsider not in index
+    assert index.position(outsider) is None
+    assert not index.has(outsider, Permission.vote)
+
+
+def test_mask():
+    members = [member() for _ in range(4)]
+    index = MemberIndex(members)
+    keys = [members[3].key, Pubkey.new_unique(), members[1].key]
+
+    assert index.mask(keys) == bits([1, 3])
+    assert index.mask(PubkeySet(keys)) == bits([1, 3])
+    assert index.mask([]) == 0
+
+
+def test_removed_positions_are_reused():
+    members = [member(mask=2) for _ in range(3)]
+    index = MemberIndex(members)
+    approved = index.mask([members[0].key, members[2].key])
+
+    index.remove_member(members[1].key)
+    assert members[1].key not in index
+    assert index.bitset(Permission.vote) == bits([0, 2])
+    # Masks built before the removal stay valid for the remaining members
+    assert approved & index.bitset(Permission.vote) == approved
+
+    newcomer = member(mask=4)
+    assert index.add_member(newcomer) == 1
+    assert index.bitset(Permission.vote) == bits([0, 2])
+    assert index.bitset(Permission.execute) == bits([1])
+    assert index.add_member(member()) == 3
+
+
+def test_duplicate_and_unknown_members():
+    existing = member()
+    index = MemberIndex([existing])
+
+    with pytest.raises(ValueError):
+        index.add_member(member(existing.key))
+    with pytest.raises(ValueError):
+        index.remove_member(Pubkey.new_unique())
+
+
+def test_apply_config_actions():
+    members = [member() for _ in range(2)]
+    index = MemberIndex(members)
+    newcomer = member(mask=1)
+
+    index.apply(config_action.AddMember({"new_member": newcomer}))
+    index.apply(config_action.RemoveMember({"old_member": members[0].key}))
+    index.apply(config_action.ChangeThreshold({"new_threshold": 1}))
+
+    assert newcomer.key in index and members[0].key not in index
+    assert index.members_with(Permission.initiate) == [members[1].key, newcomer.key]
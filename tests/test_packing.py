@@ -0,0 +1,93 @@
+import pytest
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+
+from squads._internal.contants import MAX_TX_ACCOUNT_LOCKS, MAX_TX_SIZE_BYTES
+from squads._internal.packing import pack_instructions
+from squads._internal.sizing import versioned_transaction_size
+
+PROGRAM = Pubkey.new_unique()
+
+
+def instruction(accounts: list[Pubkey], data: bytes = b"") -> Instruction:
+    return Instruction(
+        PROGRAM, data, [AccountMeta(key, False, True) for key in accounts]
+    )
+
+
+def loaded_accounts(payer: Pubkey, instructions: list[Instruction]) -> int:
+    keys = {payer}
+    for ix in instructions:
+        keys.add(ix.program_id)
+        keys.update(meta.pubkey for meta in ix.accounts)
+    return len(keys)
+
+
+def test_packs_by_size():
+    payer = Pubkey.new_unique()
+    ixs = [instruction([Pubkey.new_unique()], bytes(200)) for _ in range(20)]
+
+    groups = pack_instructions(payer, ixs)
+
+    assert [i for group in groups for i in group] == list(range(len(ixs)))
+    for group in groups:
+        message = MessageV0.try_compile(
+            payer, ixs[group.start : group.stop], [], Hash.default()
+        )
+        assert versioned_transaction_size(message) <= MAX_TX_SIZE_BYTES
+    # A group is only closed when the next instruction does not fit
+    for group, following in zip(groups, groups[1:], strict=False):
+        message = MessageV0.try_compile(
+            payer, ixs[group.start : following.start + 1], [], Hash.default()
+        )
+        assert versioned_transaction_size(message) > MAX_TX_SIZE_BYTES
+
+
+def test_packs_by_account_count():
+    payer = Pubkey.new_unique()
+    accounts = [Pubkey.new_unique() for _ in range(200)]
+    lookup_table = AddressLookupTableAccount(Pubkey.new_unique(), accounts)
+    # Looked-up keys are one byte each, so only the account count limits
+    ixs = [instruction(accounts[i : i + 20]) for i in range(0, 200, 20)]
+
+    groups = pack_instructions(payer, ixs, [lookup_table])
+
+    assert len(groups) > 1
+    for group in groups:
+        group_ixs = ixs[group.start : group.stop]
+        assert loaded_accounts(payer, group_ixs) <= MAX_TX_ACCOUNT_LOCKS
+        message = MessageV0.try_compile(
+            payer, group_ixs, [lookup_table], Hash.default()
+        )
+        assert versioned_transaction_size(message) <= MAX_TX_SIZE_BYTES
+
+    groups = pack_instructions(payer, ixs, [lookup_table], max_accounts=128)
+    assert all(
+        loaded_accounts(payer, ixs[group.start : group.stop]) <= 128 for group in groups
+    )
+
+
+def test_max_instructions():
+    payer = Pubkey.new_unique()
+    ixs = [instruction([Pubkey.new_unique()]) for _ in range(7)]
+
+    groups = pack_instructions(payer, ixs, max_instructions=3)
+
+    assert groups == [range(0, 3), range(3, 6), range(6, 7)]
+
+
+def test_oversized_instruction():
+    payer = Pubkey.new_unique()
+
+    with pytest.raises(ValueError, match="Instruction 1"):
+        pack_instructions(
+            payer,
+            [
+                instruction([Pubkey.new_unique()]),
+                instruction([Pubkey.new_unique() for _ in range(70)]),
+            ],
+            max_size=10_000,
+        )
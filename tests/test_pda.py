@@ -0,0 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal import pda
+from squads._internal.pda import PDA
+from squads.generated.program_id import PROGRAM_ID
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    PDA.cache_clear()
+    yield
+    PDA.cache_clear()
+
+
+def test_cache_counts_bump_searches():
+    multisig_pda = Pubkey.new_unique()
+
+    expected = PDA.get_proposal_pda(multisig_pda, 1)
+    assert PDA.get_proposal_pda(multisig_pda, 1) == expected
+
+    info = PDA.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_known_bump_bypasses_cache():
+    multisig_pda = Pubkey.new_unique()
+    address, bump = PDA.get_transaction_pda(multisig_pda, 7)
+    before = PDA.cache_info()
+
+    assert PDA.get_transaction_pda_with_bump(multisig_pda, 7, bump) == (address, bump)
+
+    assert PDA.cache_info() == before
+
+
+def test_known_bump_rejects_on_curve_address():
+    multisig_pda = Pubkey.new_unique()
+    for bump in range(256):
+        try:
+            PDA.get_vault_pda_with_bump(multisig_pda, 0, bump)
+        except ValueError:
+            break
+    else:
+        pytest.fail("Every bump produced an off-curve address")
+
+
+def expected_transaction_pdas(params):
+    return [
+        Pubkey.find_program_address(
+            [
+                b"multisig",
+                bytes(multisig_pda),
+                b"transaction",
+                index.to_bytes(8, "little"),
+            ],
+            PROGRAM_ID,
+        )
+        for multisig_pda, index in params
+    ]
+
+
+def test_derive_many_keeps_input_order():
+    multisig_pda = Pubkey.new_unique()
+    params = [(multisig_pda, index) for index in (5, 1, 9, 1, 3, 5, 7)]
+    # Warm the cache for some of them, so hits and misses are interleaved
+    PDA.get_transaction_pda(multisig_pda, 9)
+    PDA.get_transaction_pda(multisig_pda, 3)
+
+    assert PDA.derive_many("transaction", params) == expected_transaction_pdas(params)
+    # Duplicates are derived once
+    assert PDA.cache_info().currsize == 5
+
+
+def test_derive_many_in_process_pool(monkeypatch):
+    used: list[int] = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            used.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(pda, "DERIVE_MANY_PARALLEL_THRESHOLD", 8)
+    monkeypatch.setattr(pda, "ProcessPoolExecutor", RecordingExecutor)
+    multisig_pda = Pubkey.new_unique()
+    params = [(multisig_pda, index) for index in range(40)]
+    PDA.get_transaction_pda(multisig_pda, 17)
+
+    assert PDA.derive_many("transaction", params, max_workers=2) == (
+        expected_transaction_pdas(params)
+    )
+    assert used == [2]
+
+    # Below the threshold the bump searches run inline
+    other = [(Pubkey.new_unique(), index) for index in range(7)]
+    assert PDA.derive_many("transaction", other, max_workers=2) == (
+        expected_transaction_pdas(other)
+    )
+    assert used == [2]
+
+
+def test_derive_many_unknown_kind():
+    with pytest.raises(ValueError):
+        PDA.derive_many("unknown", [()])  # pyright: ignore[reportArgumentType]
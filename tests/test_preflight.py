@@ -0,0 +1,88 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.member_index import MemberIndex
+from squads._internal.preflight import (
+    predict_config_transaction_execute,
+    predict_proposal_create,
+)
+from squads.generated.errors import custom
+from squads.generated.types import proposal_status
+
+from .factories import member, multisig, proposal
+
+NOW = 1_000
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize(
+    "transaction_index,expected",
+    [
+        (6, custom.InvalidTransactionIndex),
+        (2, custom.StaleProposal),
+        (4, custom.NotAMember),
+    ],
+)
+def test_proposal_create_checks_index_before_creator(
+    indexed: bool, transaction_index: int, expected: type
+):
+    ms = multisig([member()], transaction_index=5, stale_transaction_index=3)
+    member_index = MemberIndex.from_multisig(ms) if indexed else None
+
+    error = predict_proposal_create(
+        ms, transaction_index, Pubkey.new_unique(), member_index
+    )
+
+    assert isinstance(error, expected)
+
+
+def test_proposal_create_allows_voters():
+    voter = member(mask=2)
+    ms = multisig([voter], transaction_index=1)
+
+    assert predict_proposal_create(ms, 1, voter.key) is None
+    assert isinstance(
+        predict_proposal_create(ms, 1, member(mask=4).key), custom.NotAMember
+    )
+    ms = multisig([member(voter.key, mask=4)], transaction_index=1)
+    assert isinstance(predict_proposal_create(ms, 1, voter.key), custom.Unauthorized)
+
+
+@pytest.mark.parametrize(
+    "stale_transaction_index,approved_at,expected",
+    [
+        # The time lock is checked before staleness
+        (1, NOW - 10, custom.TimeLockNotReleased),
+        (1, NOW - 100, custom.StaleProposal),
+        (0, NOW - 10, custom.TimeLockNotReleased),
+        (0, NOW - 100, None),
+    ],
+)
+def test_config_transaction_execute_order(
+    stale_transaction_index: int, approved_at: int, expected: type | None
+):
+    executor = member()
+    ms = multisig(
+        [executor],
+        transaction_index=1,
+        stale_transaction_index=stale_transaction_index,
+        time_lock=60,
+    )
+    approved = proposal(1, proposal_status.Approved({"timestamp": approved_at}))
+
+    error = predict_config_transaction_execute(ms, approved, executor.key, NOW)
+
+    if expected is None:
+        assert error is None
+    else:
+        assert isinstance(error, expected)
+
+
+def test_config_transaction_execute_checks_status_first():
+    executor = member()
+    ms = multisig([executor], transaction_index=1, stale_transaction_index=1)
+    active = proposal(1, proposal_status.Active({"timestamp": NOW}))
+
+    error = predict_config_transaction_execute(ms, active, executor.key, NOW)
+
+    assert isinstance(error, custom.InvalidProposalStatus)
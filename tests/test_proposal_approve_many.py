@@ -0,0 +1,102 @@
+import asyncio
+
+from solders.account import Account
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+from solders.transaction_status import (
+    InstructionErrorCustom,
+    TransactionErrorInstructionError,
+)
+
+from squads.accounts import PDA
+from squads.generated.errors import custom
+from squads.generated.program_id import PROGRAM_ID
+from squads.generated.types import proposal_status
+from squads.rpc import proposal_approve_many
+
+from .factories import encode_account, member, multisig, proposal
+from .fakes import FakeClient
+
+ACTIVE = proposal_status.Active({"timestamp": 0})
+
+
+def program_account(account: object) -> Account:
+    return Account(1, encode_account(account), PROGRAM_ID)
+
+
+def proposal_pda(multisig_pda: Pubkey, transaction_index: int) -> Pubkey:
+    return PDA.get_proposal_pda(multisig_pda, transaction_index, PROGRAM_ID)[0]
+
+
+def setup(client: FakeClient, voter: Keypair, num_proposals: int) -> Pubkey:
+    multisig_pda = Pubkey.new_unique()
+    ms = multisig([member(voter.pubkey()), member()], transaction_index=num_proposals)
+    client.accounts[multisig_pda] = program_account(ms)
+    for transaction_index in range(1, num_proposals + 1):
+        client.accounts[proposal_pda(multisig_pda, transaction_index)] = (
+            program_account(proposal(transaction_index, ACTIVE))
+        )
+    return multisig_pda
+
+
+def fail_approvals_of(failing: Pubkey):
+    def transaction_error(tx: VersionedTransaction):
+        if failing in tx.message.account_keys:
+            return TransactionErrorInstructionError(
+                0, InstructionErrorCustom(custom.InvalidProposalStatus.code)
+            )
+        return None
+
+    return transaction_error
+
+
+def test_isolates_the_failing_approval():
+    client, voter = FakeClient(), Keypair()
+    multisig_pda = setup(client, voter, 4)
+    client.transaction_error = fail_approvals_of(proposal_pda(multisig_pda, 3))
+
+    outcomes = asyncio.run(
+        proposal_approve_many(
+            client, voter, voter, [(multisig_pda, i) for i in range(1, 5)]
+        )
+    )
+
+    assert [o.transaction_index for o in outcomes] == [1, 2, 3, 4]
+    assert [o.ok for o in outcomes] == [True, True, False, True]
+    assert isinstance(outcomes[2].error, custom.InvalidProposalStatus)
+    assert outcomes[2].signature is None
+    # All four fail together, then [1, 2] lands, [3, 4] fails and is split
+    assert len(client.sent) == 5
+    signatures = [tx.signatures[0] for tx in client.sent]
+    assert outcomes[0].signature == outcomes[1].signature == signatures[1]
+    assert outcomes[3].signature == signatures[4]
+
+
+def test_preflight_skips_doomed_approvals():
+    client, voter = FakeClient(), Keypair()
+    multisig_pda = setup(client, voter, 3)
+    client.accounts[proposal_pda(multisig_pda, 2)] = program_account(
+        proposal(2, ACTIVE, approved=[voter.pubkey()])
+    )
+    del client.accounts[proposal_pda(multisig_pda, 3)]
+    requested = [(multisig_pda, i) for i in range(1, 4)]
+    requested.append((Pubkey.new_unique(), 1))
+
+    outcomes = asyncio.run(proposal_approve_many(client, voter, voter, requested))
+
+    assert [o.ok for o in outcomes] == [True, False, False, False]
+    assert isinstance(outcomes[1].error, custom.AlreadyApproved)
+    assert str(outcomes[2].error) == "Proposal account not found"
+    assert str(outcomes[3].error) == "Multisig account not found"
+    (sent,) = client.sent
+    assert proposal_pda(multisig_pda, 1) in sent.message.account_keys
+    assert proposal_pda(multisig_pda, 2) not in sent.message.account_keys
+
+    # Without the preflight every approval is sent and fails on its own
+    client.transaction_error = fail_approvals_of(proposal_pda(multisig_pda, 2))
+    outcomes = asyncio.run(
+        proposal_approve_many(client, voter, voter, requested[:2], preflight=False)
+    )
+    assert [o.ok for o in outcomes] == [True, False]
+    assert isinstance(outcomes[1].error, custom.InvalidProposalStatus)
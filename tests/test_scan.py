@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from based58 import b58encode
+from solana.rpc.types import DataSliceOpts, MemcmpOpts
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from squads._internal.scan import (
+    program_account_filters,
+    scan_program_account_data,
+    scan_program_accounts,
+)
+from squads.generated.accounts.multisig import Multisig
+from squads.generated.accounts.proposal import Proposal
+from squads.generated.accounts.spending_limit import SpendingLimit
+from squads.generated.program_id import PROGRAM_ID
+from squads.generated.types import period, proposal_status
+
+from .factories import encode_account, member, multisig, proposal
+from .fakes import FakeClient
+
+ACTIVE = proposal_status.Active({"timestamp": 0})
+
+
+def test_filters():
+    multisig_pda = Pubkey.new_unique()
+    discriminator = MemcmpOpts(
+        offset=0, bytes=b58encode(Proposal.discriminator).decode()
+    )
+
+    assert program_account_filters(Proposal) == [discriminator]
+    assert program_account_filters(Proposal, multisig_pda) == [
+        discriminator,
+        MemcmpOpts(offset=8, bytes=str(multisig_pda)),
+    ]
+    with pytest.raises(ValueError, match="can't be filtered by multisig"):
+        program_account_filters(Multisig, multisig_pda)
+
+
+def spending_limit(multisig_pda: Pubkey) -> SpendingLimit:
+    return SpendingLimit(
+        multisig_pda,
+        Pubkey.new_unique(),
+        0,
+        Pubkey.new_unique(),
+        100,
+        period.Day(),
+        100,
+        0,
+        255,
+        [Pubkey.new_unique()],
+        [],
+    )
+
+
+def test_scans_by_discriminator_and_multisig():
+    client = FakeClient()
+    ours, theirs = Pubkey.new_unique(), Pubkey.new_unique()
+    accounts = {
+        "multisig": multisig([member()]),
+        "ours": proposal(1, ACTIVE, multisig_pda=ours),
+        "theirs": proposal(1, ACTIVE, multisig_pda=theirs),
+        "limit": spending_limit(ours),
+    }
+    addresses = {name: Pubkey.new_unique() for name in accounts}
+    for name, account in accounts.items():
+        client.accounts[addresses[name]] = Account(
+            1, encode_account(account), PROGRAM_ID
+        )
+    # Same layout, other program
+    client.accounts[Pubkey.new_unique()] = Account(
+        1, encode_account(accounts["ours"]), Pubkey.new_unique()
+    )
+
+    def scan(account_class: type, multisig_pda: Pubkey | None = None):
+        return dict(
+            asyncio.run(scan_program_accounts(client, account_class, multisig_pda))
+        )
+
+    assert scan(Proposal) == {
+        addresses["ours"]: accounts["ours"],
+        addresses["theirs"]: accounts["theirs"],
+    }
+    assert scan(Proposal, ours) == {addresses["ours"]: accounts["ours"]}
+    assert scan(SpendingLimit, ours) == {addresses["limit"]: accounts["limit"]}
+    assert scan(SpendingLimit, theirs) == {}
+    assert scan(Multisig) == {addresses["multisig"]: accounts["multisig"]}
+
+    (header,) = asyncio.run(
+        scan_program_account_data(
+            client, Proposal, DataSliceOpts(offset=8, length=40), theirs
+        )
+    )
+    assert header == (
+        addresses["theirs"],
+        bytes(theirs) + (1).to_bytes(8, "little"),
+    )
@@ -0,0 +1,316 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from squads._internal.simulator import MultisigSimulator, check_multisig_invariant
+from squads._internal.snapshot import MultisigState
+from squads.generated.accounts.config_transaction import ConfigTransaction
+from squads.generated.accounts.vault_transaction import VaultTransaction
+from squads.generated.errors import anchor, custom
+from squads.generated.types import config_action, period, proposal_status
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+from .factories import member, multisig, proposal
+
+MULTISIG_PDA = Pubkey.new_unique()
+
+
+@pytest.fixture
+def members():
+    return sorted((member() for _ in range(3)), key=lambda m: bytes(m.key))
+
+
+@pytest.fixture
+def simulator(members):
+    return MultisigSimulator(MULTISIG_PDA, multisig(members, threshold=2), now=100)
+
+
+def approved_vault_transaction(simulator: MultisigSimulator, members) -> int:
+    index = simulator.vault_transaction_create(members[0].key)
+    simulator.proposal_create(index, members[0].key)
+    simulator.proposal_approve(index, members[0].key)
+    simulator.proposal_approve(index, members[1].key)
+    return index
+
+
+def approved_config_transaction(
+    simulator: MultisigSimulator, members, actions: list
+) -> int:
+    index = simulator.config_transaction_create(members[0].key, actions)
+    simulator.proposal_create(index, members[0].key)
+    simulator.proposal_approve(index, members[0].key)
+    simulator.proposal_approve(index, members[1].key)
+    return index
+
+
+def test_vote_and_execute(simulator, members):
+    index = simulator.vault_transaction_create(members[0].key)
+    created = simulator.proposal_create(index, members[0].key)
+    assert created.status == proposal_status.Active({"timestamp": 100})
+
+    simulator.proposal_approve(index, members[0].key)
+    with pytest.raises(custom.AlreadyApproved):
+        simulator.proposal_approve(index, members[0].key)
+    with pytest.raises(custom.InvalidProposalStatus):
+        simulator.vault_transaction_execute(index, members[0].key)
+
+    simulator.advance(5)
+    approved = simulator.proposal_approve(index, members[1].key)
+    assert approved.status == proposal_status.Approved({"timestamp": 105})
+
+    executed = simulator.vault_transaction_execute(index, members[2].key)
+    assert executed.status == proposal_status.Executed({"timestamp": 105})
+
+
+def test_reject_at_cutoff(simulator, members):
+    index = simulator.vault_transaction_create(members[0].key)
+    simulator.proposal_create(index, members[0].key)
+
+    simulator.proposal_reject(index, members[0].key)
+    assert simulator.proposals[index].status.kind == "Active"
+    # Switching a vote moves it between the lists
+    simulator.proposal_approve(index, members[0].key)
+    simulator.proposal_reject(index, members[1].key)
+    rejected = simulator.proposal_reject(index, members[0].key)
+
+    assert rejected.approved == []
+    assert rejected.status.kind == "Rejected"
+
+
+def test_time_lock(members):
+    simulator = MultisigSimulator(
+        MULTISIG_PDA, multisig(members, threshold=2, time_lock=60), now=0
+    )
+    index = approved_vault_transaction(simulator, members)
+
+    simulator.advance(59)
+    with pytest.raises(custom.TimeLockNotReleased):
+        simulator.vault_transaction_execute(index, members[0].key)
+    simulator.advance(1)
+    simulator.vault_transaction_execute(index, members[0].key)
+
+
+def test_config_execute_invalidates_prior_transactions(simulator, members):
+    pending = simulator.vault_transaction_create(members[0].key)
+    simulator.proposal_create(pending, members[0].key)
+    newcomer = member()
+    index = approved_config_transaction(
+        simulator, members, [config_action.AddMember({"new_member": newcomer})]
+    )
+
+    simulator.config_transaction_execute(index, members[0].key)
+
+    assert newcomer.key in simulator.member_index
+    assert newcomer in simulator.multisig.members
+    assert simulator.multisig.stale_transaction_index == index
+    with pytest.raises(custom.StaleProposal):
+        simulator.proposal_approve(pending, members[0].key)
+
+
+def test_set_rent_collector_keeps_prior_transactions(simulator, members):
+    pending = simulator.vault_transaction_create(members[0].key)
+    simulator.proposal_create(pending, members[0].key)
+    rent_collector = Pubkey.new_unique()
+    index = approved_config_transaction(
+        simulator,
+        members,
+        [config_action.SetRentCollector({"new_rent_collector": rent_collector})],
+    )
+
+    simulator.config_transaction_execute(index, members[0].key)
+
+    assert simulator.multisig.rent_collector == rent_collector
+    assert simulator.multisig.stale_transaction_index == 0
+    simulator.proposal_approve(pending, members[0].key)
+
+
+def test_failed_config_execute_leaves_state(simulator, members):
+    index = approved_config_transaction(
+        simulator,
+        members,
+        [
+            config_action.AddMember({"new_member": member()}),
+            config_action.ChangeThreshold({"new_threshold": 5}),
+        ],
+    )
+    before = simulator.multisig
+
+    with pytest.raises(custom.InvalidThreshold):
+        simulator.config_transaction_execute(index, members[0].key)
+
+    assert simulator.multisig is before
+    assert len(simulator.multisig.members) == 3
+    assert len(simulator.member_index) == 3
+    assert simulator.proposals[index].status.kind == "Approved"
+
+
+def test_missing_or_mismatched_transaction(simulator, members):
+    vault_index = approved_vault_transaction(simulator, members)
+    config_index = approved_config_transaction(
+        simulator, members, [config_action.SetTimeLock({"new_time_lock": 0})]
+    )
+
+    with pytest.raises(anchor.AccountNotInitialized):
+        simulator.vault_transaction_execute(config_index + 1, members[0].key)
+    with pytest.raises(anchor.AccountNotInitialized):
+        simulator.config_transaction_execute(config_index + 1, members[0].key)
+    with pytest.raises(anchor.AccountDiscriminatorMismatch):
+        simulator.vault_transaction_execute(config_index, members[0].key)
+    with pytest.raises(anchor.AccountDiscriminatorMismatch):
+        simulator.config_transaction_execute(vault_index, members[0].key)
+
+
+def test_spending_limit(simulator, members):
+    create_key = Pubkey.new_unique()
+    mint = Pubkey.new_unique()
+    destination = Pubkey.new_unique()
+    index = approved_config_transaction(
+        simulator,
+        members,
+        [
+            config_action.AddSpendingLimit(
+                {
+                    "create_key": create_key,
+                    "vault_index": 0,
+                    "mint": mint,
+                    "amount": 100,
+                    "period": period.Day(),
+                    "members": [members[2].key],
+                    "destinations": [destination],
+                }
+            )
+        ],
+    )
+    simulator.config_transaction_execute(index, members[0].key)
+    (spending_limit_pda,) = simulator.spending_limits
+
+    def use(amount: int, user: Pubkey = members[2].key, to: Pubkey = destination):
+        return simulator.spending_limit_use(spending_limit_pda, user, amount, mint, to)
+
+    assert use(60).remaining_amount == 40
+    with pytest.raises(custom.SpendingLimitExceeded):
+        use(41)
+    with pytest.raises(custom.Unauthorized):
+        use(1, user=members[0].key)
+    with pytest.raises(custom.InvalidDestination):
+        use(1, to=Pubkey.new_unique())
+    # The mint is checked before the destination
+    with pytest.raises(custom.InvalidMint):
+        simulator.spending_limit_use(
+            spending_limit_pda, members[2].key, 1, Pubkey.new_unique(), members[0].key
+        )
+
+    # The period resets once a full day has passed since the last reset
+    simulator.advance(2 * 24 * 60 * 60 + 5)
+    spending_limit = use(100)
+    assert spending_limit.remaining_amount == 0
+    assert spending_limit.last_reset == 100 + 2 * 24 * 60 * 60
+
+
+def add_spending_limit(create_key: Pubkey, members: list[Pubkey]):
+    return config_action.AddSpendingLimit(
+        {
+            "create_key": create_key,
+            "vault_index": 0,
+            "mint": Pubkey.new_unique(),
+            "amount": 100,
+            "period": period.OneTime(),
+            "members": members,
+            "destinations": [],
+        }
+    )
+
+
+def test_add_spending_limit_rejects_duplicates(simulator, members):
+    create_key = Pubkey.new_unique()
+    keys = [m.key for m in members]
+    index = approved_config_transaction(
+        simulator, members, [add_spending_limit(create_key, keys[::-1])]
+    )
+    simulator.config_transaction_execute(index, members[0].key)
+    (spending_limit,) = simulator.spending_limits.values()
+    assert spending_limit.members == keys
+
+    duplicate_members = approved_config_transaction(
+        simulator,
+        members,
+        [add_spending_limit(Pubkey.new_unique(), [keys[0], keys[1], keys[0]])],
+    )
+    with pytest.raises(custom.DuplicateMember):
+        simulator.config_transaction_execute(duplicate_members, members[0].key)
+
+    # The spending limit account already exists for this create key
+    existing = approved_config_transaction(
+        simulator, members, [add_spending_limit(create_key, keys[:1])]
+    )
+    with pytest.raises(ValueError):
+        simulator.config_transaction_execute(existing, members[0].key)
+    assert len(simulator.spending_limits) == 1
+
+
+def vault_transaction(creator: Pubkey) -> VaultTransaction:
+    return VaultTransaction(
+        MULTISIG_PDA,
+        creator,
+        1,
+        255,
+        0,
+        255,
+        b"",
+        VaultTransactionMessage(1, 1, 0, [creator], [], []),
+    )
+
+
+def test_does_not_mutate_inputs(members):
+    ms = multisig(members, threshold=2, transaction_index=2)
+    active = proposal(
+        1, proposal_status.Active({"timestamp": 0}), multisig_pda=MULTISIG_PDA
+    )
+    config_transaction = ConfigTransaction(
+        MULTISIG_PDA,
+        members[0].key,
+        2,
+        255,
+        [config_action.AddMember({"new_member": member()})],
+    )
+    state = MultisigState(
+        MULTISIG_PDA,
+        ms,
+        range(1, 3),
+        slot=0,
+        transactions={1: vault_transaction(members[0].key), 2: config_transaction},
+        proposals={1: active},
+    )
+
+    simulator = MultisigSimulator.from_state(state, now=10)
+    simulator.proposal_approve(1, members[0].key)
+    simulator.proposal_approve(1, members[1].key)
+    simulator.proposal_create(2, members[0].key)
+    simulator.proposal_approve(2, members[0].key)
+    simulator.proposal_approve(2, members[1].key)
+    simulator.vault_transaction_execute(1, members[0].key)
+    simulator.config_transaction_execute(2, members[0].key)
+
+    assert active.status.kind == "Active" and active.approved == []
+    assert ms.members == members and ms.stale_transaction_index == 0
+    assert len(config_transaction.actions) == 1
+    assert state.proposals == {1: active}
+
+
+@pytest.mark.parametrize(
+    "masks,threshold,expected",
+    [
+        ((2, 4), 1, custom.NoProposers),
+        ((1, 2), 1, custom.NoExecutors),
+        ((1, 4), 1, custom.NoVoters),
+        ((7, 7), 3, custom.InvalidThreshold),
+        ((7, 7), 0, custom.InvalidThreshold),
+        ((7, 8), 1, custom.UnknownPermission),
+    ],
+)
+def test_invariant(masks, threshold, expected):
+    with pytest.raises(expected):
+        check_multisig_invariant(
+            multisig([member(mask=mask) for mask in masks], threshold=threshold)
+        )
+
+    check_multisig_invariant(multisig([member(), member()], threshold=2))
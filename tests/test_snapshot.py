@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from anchorpy.error import AccountInvalidDiscriminator
+from solders.account import Account
+from solders.pubkey import Pubkey
+
+from squads._internal.snapshot import load_multisig_state
+from squads.accounts import PDA
+from squads.generated.accounts.batch import Batch
+from squads.generated.accounts.config_transaction import ConfigTransaction
+from squads.generated.accounts.vault_transaction import VaultTransaction
+from squads.generated.program_id import PROGRAM_ID
+from squads.generated.types import config_action, proposal_status
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+from .factories import encode_account, member, multisig, proposal
+from .fakes import FakeClient
+
+MULTISIG_PDA = Pubkey.new_unique()
+CREATOR = Pubkey.new_unique()
+
+
+def program_account(account: object, owner: Pubkey = PROGRAM_ID) -> Account:
+    return Account(1, encode_account(account), owner)
+
+
+def transaction_pda(index: int) -> Pubkey:
+    return PDA.get_transaction_pda(MULTISIG_PDA, index)[0]
+
+
+def proposal_pda(index: int) -> Pubkey:
+    return PDA.get_proposal_pda(MULTISIG_PDA, index)[0]
+
+
+def setup(client: FakeClient) -> dict[int, object]:
+    client.accounts[MULTISIG_PDA] = program_account(
+        multisig([member(), member()], transaction_index=4)
+    )
+    transactions = {
+        1: VaultTransaction(
+            MULTISIG_PDA,
+            CREATOR,
+            1,
+            255,
+            0,
+            255,
+            b"",
+            VaultTransactionMessage(1, 1, 0, [CREATOR], [], []),
+        ),
+        2: ConfigTransaction(
+            MULTISIG_PDA,
+            CREATOR,
+            2,
+            255,
+            [config_action.ChangeThreshold({"new_threshold": 1})],
+        ),
+        3: Batch(MULTISIG_PDA, CREATOR, 3, 255, 0, 255, 2, 0),
+    }
+    for index, transaction in transactions.items():
+        client.accounts[transaction_pda(index)] = program_account(transaction)
+    # Index 4 has a proposal but its transaction account was closed
+    for index in (1, 4):
+        client.accounts[proposal_pda(index)] = program_account(
+            proposal(index, proposal_status.Active({"timestamp": 0}), [CREATOR])
+        )
+    return transactions
+
+
+def test_loads_transactions_by_discriminator():
+    client = FakeClient(slot=77)
+    transactions = setup(client)
+
+    state = asyncio.run(load_multisig_state(client, MULTISIG_PDA))
+
+    assert state.indexes == range(1, 5)
+    assert state.slot == 77
+    assert state.transactions == transactions
+    assert state.vault_transactions == {1: transactions[1]}
+    assert state.config_transactions == {2: transactions[2]}
+    assert state.batches == {3: transactions[3]}
+    assert sorted(state.proposals) == [1, 4]
+    assert state.proposals[4].approved == [CREATOR]
+    assert len(state.member_index) == 2
+
+
+def test_loads_requested_indexes():
+    client = FakeClient()
+    transactions = setup(client)
+
+    state = asyncio.run(load_multisig_state(client, MULTISIG_PDA, range(2, 4)))
+
+    assert state.transactions == {2: transactions[2], 3: transactions[3]}
+    assert state.proposals == {}
+    empty = asyncio.run(load_multisig_state(client, MULTISIG_PDA, range(9, 9)))
+    assert (empty.transactions, empty.proposals) == ({}, {})
+    assert empty.slot == client.slot
+
+
+def test_rejects_missing_and_foreign_accounts():
+    client = FakeClient()
+    setup(client)
+
+    with pytest.raises(ValueError, match="not found"):
+        asyncio.run(load_multisig_state(client, Pubkey.new_unique()))
+
+    client.accounts[proposal_pda(2)] = program_account(
+        proposal(2, proposal_status.Draft({"timestamp": 0})), Pubkey.new_unique()
+    )
+    with pytest.raises(ValueError, match="does not belong"):
+        asyncio.run(load_multisig_state(client, MULTISIG_PDA))
+
+    del client.accounts[proposal_pda(2)]
+    # A proposal stored at a transaction address has no transaction kind
+    client.accounts[transaction_pda(2)] = client.accounts[proposal_pda(1)]
+    with pytest.raises(AccountInvalidDiscriminator):
+        asyncio.run(load_multisig_state(client, MULTISIG_PDA))
@@ -0,0 +1,95 @@
+import pytest
+
+from squads._internal.compact import CompactProposal
+from squads._internal.tally import tally_proposals
+from squads.generated.types import proposal_status
+
+from .factories import member, multisig, proposal
+
+NOW = 1_000
+
+
+@pytest.mark.parametrize(
+    "voters,threshold,cutoff",
+    [(1, 1, 1), (3, 2, 2), (5, 3, 3), (5, 5, 1), (7, 1, 7)],
+)
+def test_cutoff(voters: int, threshold: int, cutoff: int):
+    # Members without the vote permission don't count towards the cutoff
+    members = [member(mask=2) for _ in range(voters)] + [member(mask=5)]
+    ms = multisig(members, threshold=threshold)
+    keys = [m.key for m in members if m.permissions.mask & 2]
+    tallies = tally_proposals(
+        ms,
+        [
+            proposal(1, proposal_status.Active({"timestamp": 0}), rejected=keys[:n])
+            for n in range(cutoff + 1)
+        ],
+        NOW,
+    )
+
+    assert [t.cutoff for t in tallies] == [cutoff] * (cutoff + 1)
+    assert [t.cutoff_reached for t in tallies] == [False] * cutoff + [True]
+
+
+def test_counts_only_current_voters():
+    voters = [member(mask=2) for _ in range(3)]
+    proposer = member(mask=1)
+    ms = multisig([*voters, proposer], threshold=2)
+    removed = member().key
+
+    (tally,) = tally_proposals(
+        ms,
+        [
+            proposal(
+                1,
+                proposal_status.Active({"timestamp": 0}),
+                approved=[voters[0].key, proposer.key, removed],
+                rejected=[voters[1].key, removed],
+            )
+        ],
+        NOW,
+    )
+
+    assert (tally.approvals, tally.rejections) == (1, 1)
+    assert not tally.threshold_reached
+    assert not tally.cutoff_reached
+
+
+def test_threshold_stale_and_time_lock():
+    members = [member() for _ in range(3)]
+    keys = [m.key for m in members]
+    ms = multisig(
+        members,
+        threshold=2,
+        transaction_index=3,
+        stale_transaction_index=1,
+        time_lock=60,
+    )
+    proposals = [
+        proposal(1, proposal_status.Active({"timestamp": 0}), approved=keys[:2]),
+        proposal(2, proposal_status.Approved({"timestamp": NOW - 60})),
+        proposal(3, proposal_status.Approved({"timestamp": NOW - 59})),
+    ]
+
+    tallies = tally_proposals(ms, proposals, NOW)
+
+    assert [t.stale for t in tallies] == [True, False, False]
+    assert tallies[0].threshold_reached
+    assert tallies[0].executable_at is None and tallies[0].time_lock_elapsed is None
+    assert [t.executable_at for t in tallies[1:]] == [NOW, NOW + 1]
+    assert [t.time_lock_elapsed for t in tallies[1:]] == [True, False]
+
+
+def test_compact_proposals_match():
+    members = [member() for _ in range(4)]
+    keys = [m.key for m in members]
+    ms = multisig(members, threshold=3)
+    proposals = [
+        proposal(1, proposal_status.Active({"timestamp": 0}), keys[:2], keys[2:3]),
+        proposal(2, proposal_status.Approved({"timestamp": 5}), keys[:3]),
+        proposal(3, proposal_status.Executing()),
+    ]
+
+    assert tally_proposals(ms, proposals, NOW) == tally_proposals(
+        ms, [CompactProposal.from_proposal(p) for p in proposals], NOW
+    )
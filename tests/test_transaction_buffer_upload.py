@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+
+import pytest
+from solders.account import Account
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from squads._internal.contants import MAX_TRANSACTION_BUFFER_SIZE, MAX_TX_SIZE_BYTES
+from squads.accounts import PDA, TransactionBuffer
+from squads.generated.instructions.transaction_buffer_create import (
+    layout as create_layout,
+)
+from squads.generated.instructions.transaction_buffer_extend import (
+    layout as extend_layout,
+)
+from squads.generated.program_id import PROGRAM_ID
+from squads.rpc import transaction_buffer_upload
+
+from .factories import encode_account
+from .fakes import FakeClient
+
+CREATE = b"\xf5\xc9ql%?\x1dY"
+EXTEND = b"\xe6\x9dC8\x05\xee\xf5\x92"
+MULTISIG_PDA = Pubkey.new_unique()
+
+
+class BufferProgram:
+    """Applies `transaction_buffer_create/extend` to the fake's accounts."""
+
+    def __init__(self, client: FakeClient, multisig_pda: Pubkey, creator: Pubkey):
+        self.client = client
+        self.multisig_pda = multisig_pda
+        self.creator = creator
+        self.chunks: list[bytes] = []
+        client.transaction_error = self
+
+    def __call__(self, tx: VersionedTransaction) -> None:
+        assert len(bytes(tx)) <= MAX_TX_SIZE_BYTES
+        keys = tx.message.account_keys
+        for ix in tx.message.instructions:
+            buffer_pda = keys[ix.accounts[1]]
+            if ix.data[:8] == CREATE:
+                args = create_layout.parse(ix.data[8:]).args
+                buffer = TransactionBuffer(
+                    self.multisig_pda,
+                    self.creator,
+                    args.buffer_index,
+                    args.vault_index,
+                    list(args.final_buffer_hash),
+                    args.final_buffer_size,
+                    args.buffer,
+                )
+            else:
+                assert ix.data[:8] == EXTEND
+                args = extend_layout.parse(ix.data[8:]).args
+                buffer = TransactionBuffer.decode(self.client.accounts[buffer_pda].data)
+                buffer.buffer += args.buffer
+            self.chunks.append(args.buffer)
+            self.client.accounts[buffer_pda] = Account(
+                1, encode_account(buffer), PROGRAM_ID
+            )
+
+
+def upload(client: FakeClient, creator: Keypair, message: bytes) -> TransactionBuffer:
+    return asyncio.run(
+        transaction_buffer_upload(client, creator, MULTISIG_PDA, creator, 0, 1, message)
+    )
+
+
+@pytest.mark.parametrize("size", [1, 500, MAX_TRANSACTION_BUFFER_SIZE])
+def test_uploads_in_transaction_sized_chunks(size: int):
+    client, creator = FakeClient(), Keypair()
+    program = BufferProgram(client, MULTISIG_PDA, creator.pubkey())
+    message = bytes(i % 251 for i in range(size))
+
+    transaction_buffer = upload(client, creator, message)
+
+    assert transaction_buffer.buffer == message
+    assert bytes(transaction_buffer.final_buffer_hash) == (
+        hashlib.sha256(message).digest()
+    )
+    assert b"".join(program.chunks) == message
+    # Every chunk but the last fills its transaction
+    assert len(client.sent) == len(program.chunks)
+    for tx in client.sent[:-1]:
+        assert len(bytes(tx)) == MAX_TX_SIZE_BYTES
+
+
+@pytest.mark.parametrize("size", [0, MAX_TRANSACTION_BUFFER_SIZE + 1])
+def test_rejects_sizes_out_of_bounds(size: int):
+    client, creator = FakeClient(), Keypair()
+
+    with pytest.raises(ValueError, match="not within"):
+        upload(client, creator, bytes(size))
+    assert client.calls == []
+
+
+def existing_buffer(
+    client: FakeClient, creator: Keypair, message: bytes, prefix: bytes
+) -> None:
+    buffer_pda = PDA.get_transaction_buffer_pda(
+        MULTISIG_PDA, creator.pubkey(), 0, PROGRAM_ID
+    )[0]
+    buffer = TransactionBuffer(
+        MULTISIG_PDA,
+        creator.pubkey(),
+        0,
+        1,
+        list(hashlib.sha256(message).digest()),
+        len(message),
+        prefix,
+    )
+    client.accounts[buffer_pda] = Account(1, encode_account(buffer), PROGRAM_ID)
+
+
+def test_resumes_a_partial_buffer():
+    client, creator = FakeClient(), Keypair()
+    program = BufferProgram(client, MULTISIG_PDA, creator.pubkey())
+    message = bytes(range(200)) * 10
+    existing_buffer(client, creator, message, message[:700])
+
+    transaction_buffer = upload(client, creator, message)
+
+    assert transaction_buffer.buffer == message
+    assert b"".join(program.chunks) == message[700:]
+    assert all(tx.message.instructions[0].data[:8] == EXTEND for tx in client.sent)
+
+
+def test_refuses_a_mismatched_buffer():
+    client, creator = FakeClient(), Keypair()
+    BufferProgram(client, MULTISIG_PDA, creator.pubkey())
+    message = bytes(range(200)) * 10
+    existing_buffer(client, creator, message, b"\xff" + message[1:700])
+
+    with pytest.raises(ValueError, match="different transaction message"):
+        upload(client, creator, message)
+    assert client.sent == []
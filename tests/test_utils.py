@@ -0,0 +1,64 @@
+import asyncio
+from collections.abc import Sequence
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.instruction import AccountMeta
+from solders.pubkey import Pubkey
+
+from squads._internal.utils import accounts_for_transaction_execute
+from squads.generated.types.multisig_message_address_table_lookup import (
+    MultisigMessageAddressTableLookup,
+)
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+
+class StaticLookupTables:
+    """Serves fixed lookup tables in place of an `AddressLookupTableCache`."""
+
+    def __init__(self, tables: Sequence[AddressLookupTableAccount]):
+        self.tables = {table.key: table for table in tables}
+
+    async def get_many(self, connection, keys, min_lengths=None):
+        return {key: self.tables[key] for key in keys}
+
+
+def test_lookup_table_accounts_keep_their_access():
+    vault = Pubkey.new_unique()
+    program = Pubkey.new_unique()
+    addresses = [Pubkey.new_unique() for _ in range(4)]
+    table = AddressLookupTableAccount(Pubkey.new_unique(), addresses)
+    message = VaultTransactionMessage(
+        num_signers=1,
+        num_writable_signers=1,
+        num_writable_non_signers=0,
+        account_keys=[vault, program],
+        instructions=[],
+        address_table_lookups=[
+            MultisigMessageAddressTableLookup(
+                account_key=table.key, writable_indexes=[2, 0], readonly_indexes=[3]
+            )
+        ],
+    )
+
+    metas, tables = asyncio.run(
+        accounts_for_transaction_execute(
+            None,
+            Pubkey.new_unique(),
+            vault,
+            message,
+            [],
+            None,
+            StaticLookupTables([table]),
+        )
+    )
+
+    assert tables == [table]
+    assert metas == [
+        AccountMeta(table.key, is_signer=False, is_writable=False),
+        # The vault signs through the program, not the transaction
+        AccountMeta(vault, is_signer=False, is_writable=True),
+        AccountMeta(program, is_signer=False, is_writable=False),
+        AccountMeta(addresses[2], is_signer=False, is_writable=True),
+        AccountMeta(addresses[0], is_signer=False, is_writable=True),
+        AccountMeta(addresses[3], is_signer=False, is_writable=False),
+    ]
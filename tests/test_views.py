@@ -0,0 +1,121 @@
+import pytest
+from anchorpy.error import AccountInvalidDiscriminator
+from solders.pubkey import Pubkey
+
+from squads._internal.views import VaultTransactionView
+from squads.generated.accounts.vault_transaction import VaultTransaction
+from squads.generated.types.multisig_compiled_instruction import (
+    MultisigCompiledInstruction,
+)
+from squads.generated.types.multisig_message_address_table_lookup import (
+    MultisigMessageAddressTableLookup,
+)
+from squads.generated.types.vault_transaction_message import VaultTransactionMessage
+
+from .factories import encode_account
+
+
+def vault_transaction(
+    instructions: list[MultisigCompiledInstruction],
+    lookups: list[MultisigMessageAddressTableLookup],
+    ephemeral_signer_bumps: bytes,
+) -> VaultTransaction:
+    return VaultTransaction(
+        multisig=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        index=2**40 + 3,
+        bump=254,
+        vault_index=7,
+        vault_bump=253,
+        ephemeral_signer_bumps=ephemeral_signer_bumps,
+        message=VaultTransactionMessage(
+            num_signers=2,
+            num_writable_signers=1,
+            num_writable_non_signers=2,
+            account_keys=[Pubkey.new_unique() for _ in range(5)],
+            instructions=instructions,
+            address_table_lookups=lookups,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "instructions,lookups,ephemeral_signer_bumps",
+    [
+        ([], [], b""),
+        (
+            [
+                MultisigCompiledInstruction(4, bytes([0, 1, 2]), b"\x01\x02"),
+                MultisigCompiledInstruction(3, b"", b""),
+                MultisigCompiledInstruction(4, bytes([5, 6]), bytes(300)),
+            ],
+            [
+                MultisigMessageAddressTableLookup(
+                    Pubkey.new_unique(), bytes([0, 9]), bytes([4])
+                ),
+                MultisigMessageAddressTableLookup(Pubkey.new_unique(), b"", b"\x01"),
+            ],
+            bytes([250, 251]),
+        ),
+    ],
+    ids=["empty", "full"],
+)
+def test_matches_decode(
+    instructions: list[MultisigCompiledInstruction],
+    lookups: list[MultisigMessageAddressTableLookup],
+    ephemeral_signer_bumps: bytes,
+):
+    original = vault_transaction(instructions, lookups, ephemeral_signer_bumps)
+    data = encode_account(original)
+    decoded = VaultTransaction.decode(data)
+
+    view = VaultTransactionView(data)
+
+    for name in (
+        "multisig",
+        "creator",
+        "index",
+        "bump",
+        "vault_index",
+        "vault_bump",
+        "ephemeral_signer_bumps",
+    ):
+        assert getattr(view, name) == getattr(decoded, name), name
+    message, expected = view.message, decoded.message
+    assert (
+        message.num_signers,
+        message.num_writable_signers,
+        message.num_writable_non_signers,
+        message.account_keys,
+    ) == (
+        expected.num_signers,
+        expected.num_writable_signers,
+        expected.num_writable_non_signers,
+        expected.account_keys,
+    )
+    assert [
+        (ix.program_id_index, bytes(ix.account_indexes), bytes(ix.data))
+        for ix in message.instructions
+    ] == [
+        (ix.program_id_index, ix.account_indexes, ix.data)
+        for ix in expected.instructions
+    ]
+    assert [
+        (
+            lookup.account_key,
+            bytes(lookup.writable_indexes),
+            bytes(lookup.readonly_indexes),
+        )
+        for lookup in message.address_table_lookups
+    ] == [
+        (lookup.account_key, lookup.writable_indexes, lookup.readonly_indexes)
+        for lookup in expected.address_table_lookups
+    ]
+    assert view.to_vault_transaction() == decoded == original
+
+
+def test_rejects_other_accounts():
+    data = encode_account(vault_transaction([], [], b""))
+
+    with pytest.raises(AccountInvalidDiscriminator):
+        VaultTransactionView(bytes(8) + data[8:])